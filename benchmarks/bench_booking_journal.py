@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.models import Booking, Movie, Screening, SeatingConfig
+from cinema_booking_system.repositories import BookingJournal
+
+def write_history(directory: str, event_count: int, snapshot_interval: int) -> Screening:
+    # Alternate bookings and cancellations so the journal holds `event_count` records but the house never fills up
+    screening = Screening(datetime.now(), SeatingConfig(26, 50), Movie("Benchmark"), [], 1)
+    journal = BookingJournal(directory, snapshot_interval=snapshot_interval)
+    journal.start(screening)
+    live = []
+    for sequence in range(event_count // 3):
+        seats = [seat for seat in screening.seat_map.free_seats_from_center(sequence % 26, 2)]
+        booking = Booking(f"GIC{sequence:07d}", seats)
+        journal.record_booking_created(booking)
+        screening.add_booking(booking)
+        journal.record_seats_confirmed(booking)
+        live.append(booking)
+        if len(live) > 300:
+            cancelled = live.pop(0)
+            screening.remove_booking(cancelled)
+            journal.record_booking_cancelled(cancelled)
+        if sequence % 64 == 0:
+            journal.commit()
+    journal.close()
+    return screening
+
+def time_recovery(directory: str) -> float:
+    started = time.perf_counter()
+    BookingJournal(directory).recover()
+    return time.perf_counter() - started
+
+def run(event_count: int, snapshot_interval: int) -> dict:
+    results = {"events": event_count}
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        write_history(directory, event_count, event_count * 2)
+        results["append_events_per_second"] = event_count / (time.perf_counter() - started)
+        results["full_replay_seconds"] = time_recovery(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        write_history(directory, event_count, snapshot_interval)
+        results["snapshot_interval"] = snapshot_interval
+        results["snapshot_plus_tail_seconds"] = time_recovery(directory)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append throughput and crash-recovery time of the booking journal")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--snapshot-interval", type=int, default=10000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.events, args.snapshot_interval), indent=2))
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.models import Movie, Screening, SeatingConfig
+from cinema_booking_system.service import BookingClient, BookingService
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def run(client_count: int, row_count: int, seat_count_per_row: int, seats_per_booking: int) -> dict:
+    # Every client holds and confirms bookings on the same screening until it is sold out, each on its own keep-alive connection
+    screening = Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie("Benchmark"), [])
+    service = BookingService(screening)
+    await service.start()
+    latencies = []
+
+    async def sell():
+        client = BookingClient("127.0.0.1", service.port)
+        try:
+            while True:
+                started = time.perf_counter()
+                status, response = await client.hold(seats_per_booking)
+                if status != 201:
+                    return  # Sold out
+                await client.confirm(response["booking_id"])
+                latencies.append(time.perf_counter() - started)
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(sell() for _ in range(client_count)))
+    elapsed = time.perf_counter() - started
+    await service.close()
+
+    booked_seats = [seat for booking in screening.booking_data for seat in booking.seats]
+    assert len(booked_seats) == len(set(booked_seats)), "A seat was sold twice"
+    return {
+        "clients": client_count,
+        "bookings": len(screening.booking_data),
+        # Each booking is two requests: hold and confirm
+        "requests_per_second": 2 * len(screening.booking_data) / elapsed,
+        "booking_p50_ms": percentile(latencies, 0.5) * 1000,
+        "booking_p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test of the asyncio booking service with many concurrent clients")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--seats-per-row", type=int, default=100)
+    parser.add_argument("--seats-per-booking", type=int, default=2)
+    args = parser.parse_args()
+    print(json.dumps([asyncio.run(run(client_count, args.rows, args.seats_per_row, args.seats_per_booking)) for client_count in args.clients], indent=2))
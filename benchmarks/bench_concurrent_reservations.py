@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models import Movie, Screening, SeatConflictError, SeatingConfig
+
+def run(thread_count: int, row_count: int, seat_count_per_row: int, seats_per_booking: int) -> dict:
+    # Every thread sells from the center of the same screening, which is the worst case for conflicts
+    screening = Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie("Benchmark"), [])
+    failures = []
+
+    def sell():
+        booker = BookingController(screening)
+        while True:
+            try:
+                booker.reserve(seats_per_booking)
+            except SeatConflictError:
+                failures.append(1)
+            except ValueError:
+                return  # Sold out
+
+    threads = [threading.Thread(target=sell) for _ in range(thread_count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    booked_seats = [seat for booking in screening.booking_data for seat in booking.seats]
+    assert len(booked_seats) == len(set(booked_seats)), "A seat was sold twice"
+    return {
+        "threads": thread_count,
+        "reservations": len(screening.booking_data),
+        "reservations_per_second": len(screening.booking_data) / elapsed,
+        "failed_after_retries": len(failures),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of concurrent seat reservations on one screening")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--seats-per-row", type=int, default=50)
+    parser.add_argument("--seats-per-booking", type=int, default=2)
+    args = parser.parse_args()
+    print(json.dumps([run(thread_count, args.rows, args.seats_per_row, args.seats_per_booking) for thread_count in args.threads], indent=2))
@@ -0,0 +1,150 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.document import Document
+from cinema_booking_system import metrics
+from cinema_booking_system.booking_menu import BookingMenuValidator
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models import Booking, Movie, Screening, SeatingConfig
+from cinema_booking_system.seating_display import SeatingDisplay
+
+# Hall sizes (rows x seats per row) and the share of seats booked in each
+HALLS = "8x10,26x50,100x100,400x250"
+OCCUPANCIES = "0,0.5,0.99"
+
+# Party size used for every allocation
+SEAT_COUNT = 4
+
+# A case is reported as a regression when its median time grows by more than this share over the baseline run
+REGRESSION_THRESHOLD = 0.25
+
+def measure(function, rounds: int, min_round_seconds: float) -> dict:
+    # Call the function enough times for one round to take at least min_round_seconds, then time that many rounds;
+    # the median is what runs are compared on, the minimum is the least noisy estimate of the cost itself
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        if time.perf_counter() - started >= min_round_seconds:
+            break
+        number *= 2
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - started) / number * 1e6)
+    return {"median_us": statistics.median(timings), "min_us": min(timings), "calls": number * rounds}
+
+def build_screening(row_count: int, seat_count_per_row: int, occupancy: float) -> Screening:
+    seat_config = SeatingConfig(row_count, seat_count_per_row)
+    random.seed(1)
+    # Scattered seats, booked in groups of four, so the free runs are fragmented as in a busy hall
+    booked = random.sample(range(seat_config.total_seats), int(seat_config.total_seats * occupancy))
+    bookings = [Booking(f"GIC{index // SEAT_COUNT:04d}", booked[index:index + SEAT_COUNT]) for index in range(0, len(booked), SEAT_COUNT)]
+    return Screening(datetime.now(), seat_config, Movie("Benchmark"), bookings)
+
+def run_hall(row_count: int, seat_count_per_row: int, occupancy: float, rounds: int, min_round_seconds: float, output) -> dict:
+    screening = build_screening(row_count, seat_count_per_row, occupancy)
+    seat_config = screening.seat_config
+    booker = BookingController(screening)
+    validator = BookingMenuValidator(screening)
+    display = SeatingDisplay(screening)
+    selected_seats = booker.select_seats_from_center(SEAT_COUNT, None)
+    # Start the user selection at the front of the middle row, and validate a free seat so every check runs
+    starting_seat = seat_config.seat_id(row_count // 2, 0)
+    free_row = next(row for row in reversed(range(row_count)) if screening.seat_map.count_in_row(row))
+    free_seat_label = seat_config.seat_label(screening.seat_map.free_seats_from_center(free_row, 1)[0])
+    document = Document(free_seat_label)
+
+    def display_frame():
+        with contextlib.redirect_stdout(output):
+            display.display(selected_seats)
+
+    cases = {
+        "select_seats_from_center": lambda: booker.select_seats_from_center(SEAT_COUNT, None),
+        # A party larger than a row is split over rows, each filled from the center outwards
+        "select_seats_from_center_split": lambda: booker.select_seats_from_center(seat_count_per_row + 2, None),
+        "determine_seats_from_user_selection": lambda: booker.determine_seats_from_user_selection(SEAT_COUNT, starting_seat),
+        "validate": lambda: validator.validate(document),
+        "display": display_frame,
+    }
+    return {name: measure(function, rounds, min_round_seconds) for name, function in cases.items()}
+
+def case_key(operation: str, row_count: int, seat_count_per_row: int, occupancy: float) -> str:
+    return f"{operation}[{row_count}x{seat_count_per_row},{occupancy:.0%}]"
+
+def run(halls, occupancies, rounds: int, min_round_seconds: float) -> dict:
+    results = {}
+    # The frames are written to the null device, so the display case includes encoding and writing them out
+    with open(os.devnull, "w") as output:
+        for row_count, seat_count_per_row in halls:
+            for occupancy in occupancies:
+                for operation, timing in run_hall(row_count, seat_count_per_row, occupancy, rounds, min_round_seconds, output).items():
+                    results[case_key(operation, row_count, seat_count_per_row, occupancy)] = timing
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seat_count": SEAT_COUNT,
+        "metrics": metrics.registry is not None,
+        "results": results,
+    }
+
+def compare(baseline: dict, current: dict, threshold: float) -> dict:
+    # Cases present in both runs, with the ratio of the current median to the baseline median
+    comparison = {}
+    for key, timing in current["results"].items():
+        if key not in baseline["results"]:
+            continue
+        baseline_us = baseline["results"][key]["median_us"]
+        ratio = timing["median_us"] / baseline_us if baseline_us else float("inf")
+        comparison[key] = {
+            "baseline_us": baseline_us,
+            "current_us": timing["median_us"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        }
+    return comparison
+
+def parse_hall(text: str):
+    rows, seats_per_row = text.lower().split("x")
+    return int(rows), int(seats_per_row)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seat allocation, seat validation and seating display times across hall sizes and occupancy levels")
+    parser.add_argument("--halls", default=HALLS, help="comma separated hall sizes, as rows x seats per row")
+    parser.add_argument("--occupancy", default=OCCUPANCIES, help="comma separated shares of seats booked")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-round-seconds", type=float, default=0.02)
+    parser.add_argument("--output", help="also write the results to this file, to compare later runs against")
+    parser.add_argument("--compare", help="results file of an earlier run; exits non-zero if any case regressed")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="allowed slowdown of a case's median before it is flagged")
+    parser.add_argument("--metrics", action="store_true", help="record metrics while timing, to measure their cost")
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.enable()
+
+    result = run([parse_hall(hall) for hall in args.halls.split(",")], [float(share) for share in args.occupancy.split(",")], args.rounds, args.min_round_seconds)
+    if args.output:
+        with open(args.output, "w") as results_file:
+            json.dump(result, results_file, indent=2)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            result["comparison"] = compare(json.load(baseline_file), result, args.threshold)
+        regressions = [key for key, case in result["comparison"].items() if case["regression"]]
+        result["regressions"] = regressions
+    print(json.dumps(result, indent=2))
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,57 @@
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-start budgets for the entry points of short-lived worker processes, in milliseconds of cumulative import
+# time as reported by `python -X importtime`, and the modules each of them must not load
+BUDGETS_MS = {
+    "cinema_booking_system.models": 30.0,
+    "cinema_booking_system.controllers": 40.0,
+    "cinema_booking_system.command_runner": 45.0,
+}
+FORBIDDEN_MODULES = ("prompt_toolkit", "asyncio")
+
+def import_time(module: str) -> dict:
+    # Import the module in a fresh interpreter; -X importtime reports every import on stderr as
+    # "import time: self [us] | cumulative | imported package", nested imports indented under their importer
+    script = f"import sys; import {module}; print(' '.join(sorted(sys.modules)))"
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module and not fields[2].startswith("  "):
+            cumulative_us = int(fields[1])
+    loaded = set(completed.stdout.split())
+    return {
+        "ms": cumulative_us / 1000,
+        "forbidden_modules": sorted(name for name in FORBIDDEN_MODULES if name in loaded),
+    }
+
+def run(repeat: int) -> dict:
+    # Measure with the bytecode already compiled, as in a deployed worker, even where writing it is disabled
+    compileall.compile_dir(os.path.join(ROOT, "cinema_booking_system"), quiet=1)
+    results = {}
+    for module, budget_ms in BUDGETS_MS.items():
+        runs = [import_time(module) for _ in range(repeat)]
+        median_ms = statistics.median(run["ms"] for run in runs)
+        results[module] = {
+            "median_ms": median_ms,
+            "budget_ms": budget_ms,
+            "forbidden_modules": runs[0]["forbidden_modules"],
+            "within_budget": median_ms <= budget_ms and not runs[0]["forbidden_modules"],
+        }
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time of the headless entry points against their cold-start budgets")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    results = run(args.repeat)
+    print(json.dumps(results, indent=2))
+    sys.exit(0 if all(result["within_budget"] for result in results.values()) else 1)
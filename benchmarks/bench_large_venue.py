@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prompt_toolkit.document import Document
+from cinema_booking_system.booking_menu import BookingMenuValidator
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models import Booking, Movie, Screening, SeatingConfig
+from cinema_booking_system.seating_display import SeatingDisplay
+
+# Interactive targets for an arena-sized hall, in milliseconds per operation (see "Performance targets" in docs/design.md)
+TARGETS_MS = {
+    "load_screening": 500.0,
+    "default_selection": 1.0,
+    "selection_from_seat": 1.0,
+    "reserve": 2.0,
+    "validate_seat": 0.1,
+    "render_frame": 20.0,
+}
+
+def timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+def run(row_count: int, seat_count_per_row: int, occupancy: float, repeat: int) -> dict:
+    seat_config = SeatingConfig(row_count, seat_count_per_row)
+    random.seed(1)
+    # Scattered pairs of booked seats, so free runs are fragmented as in a busy hall
+    booked = sorted(random.sample(range(0, seat_config.total_seats - 1, 2), int(seat_config.total_seats * occupancy / 2)))
+    bookings = [Booking(f"GIC{index}", [seat, seat + 1]) for index, seat in enumerate(booked)]
+
+    results = {}
+    results["load_screening"] = timed(lambda: Screening(datetime.now(), seat_config, Movie("Arena"), list(bookings)), 3)
+    screening = Screening(datetime.now(), seat_config, Movie("Arena"), list(bookings))
+    booker = BookingController(screening)
+    validator = BookingMenuValidator(screening)
+    display = SeatingDisplay(screening)
+    selected_seats = booker.select_seats_from_center(4, None)
+    # A free seat in the back row, so validation runs every check
+    free_seat_label = seat_config.seat_label(screening.seat_map.free_seats_from_center(row_count - 1, 1)[0])
+
+    results["default_selection"] = timed(lambda: booker.select_seats_from_center(4, None), repeat)
+    results["selection_from_seat"] = timed(lambda: booker.determine_seats_from_user_selection(4, seat_config.seat_id(row_count // 2, 0)), repeat)
+    results["reserve"] = timed(lambda: booker.reserve(4), repeat)
+    results["validate_seat"] = timed(lambda: validator.validate(Document(free_seat_label)), repeat)
+    results["render_frame"] = timed(lambda: display.render(selected_seats), max(1, repeat // 10))
+
+    return {
+        "rows": row_count,
+        "seats_per_row": seat_count_per_row,
+        "seats": seat_config.total_seats,
+        "occupancy": occupancy,
+        "ms": results,
+        "within_targets": {name: results[name] <= target for name, target in TARGETS_MS.items()},
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Allocation, validation and display times for an arena-sized hall, against the documented targets")
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--seats-per-row", type=int, default=250)
+    parser.add_argument("--occupancy", type=float, default=0.6)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    result = run(args.rows, args.seats_per_row, args.occupancy, args.repeat)
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if all(result["within_targets"].values()) else 1)
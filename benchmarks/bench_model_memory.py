@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.models import Booking, Movie, Screening, SeatingConfig
+
+class DictBooking:
+    # The original Booking layout, for comparison: properties over an instance __dict__ and seats as label strings
+    def __init__(self, id, seats):
+        self.id = id
+        self.seats = seats
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, value):
+        self._id = value
+
+    @property
+    def seats(self):
+        return self._seats
+
+    @seats.setter
+    def seats(self, value):
+        self._seats = value
+
+def bytes_per_item(build, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+def run(booking_count: int, seats_per_booking: int, row_count: int, seat_count_per_row: int) -> dict:
+    seat_config = SeatingConfig(row_count, seat_count_per_row)
+    # Booking ids are generated outside the measurement, so only the bookings themselves are counted
+    ids = [f"GIC{index:013d}" for index in range(booking_count)]
+    seat_ids = [[(index * seats_per_booking + offset) % seat_config.total_seats for offset in range(seats_per_booking)] for index in range(booking_count)]
+
+    # The label strings are built inside the measurement, as each original booking held its own
+    before = bytes_per_item(lambda count: [DictBooking(ids[index], seat_config.seat_labels(seat_ids[index])) for index in range(count)], booking_count)
+    after = bytes_per_item(lambda count: [Booking(ids[index], seat_ids[index]) for index in range(count)], booking_count)
+    screening = bytes_per_item(lambda count: [Screening(datetime.now(), seat_config, Movie("Benchmark"), []) for _ in range(count)], 100)
+    return {
+        "bookings": booking_count,
+        "seats_per_booking": seats_per_booking,
+        "bytes_per_booking_before": before,
+        "bytes_per_booking_after": after,
+        "saving": 1 - after / before,
+        "bytes_per_empty_screening": screening,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory per booking: original dict-backed layout with seat labels vs slotted bookings with packed seat ids")
+    parser.add_argument("--bookings", type=int, default=200000)
+    parser.add_argument("--seats-per-booking", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=26)
+    parser.add_argument("--seats-per-row", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(args.bookings, args.seats_per_booking, args.rows, args.seats_per_row), indent=2))
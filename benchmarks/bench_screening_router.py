@@ -0,0 +1,49 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.models import Movie, Screening, SeatingConfig
+from cinema_booking_system.service import ScreeningRouter
+
+def run(worker_count: int, screening_count: int, row_count: int, seat_count_per_row: int, holds_per_round: int, seats_per_booking: int) -> dict:
+    # Sell out every screening: each round holds a few bookings on every screening in one batch, then confirms them
+    screenings = [Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie(f"Show {index}"), [], index) for index in range(screening_count)]
+    with ScreeningRouter(screenings, worker_count) as router:
+        requests = 0
+        bookings = 0
+        started = time.perf_counter()
+        open_screenings = list(range(screening_count))
+        while open_screenings:
+            holds = [(screening_id, "POST", "/holds", {"seat_count": seats_per_booking}) for screening_id in open_screenings for _ in range(holds_per_round)]
+            responses = router.request_many(holds)
+            confirms = [(hold[0], "POST", f"/bookings/{response['booking_id']}/confirm", None) for hold, (status, response) in zip(holds, responses) if status == 201]
+            confirmed = router.request_many(confirms)
+            requests += len(holds) + len(confirms)
+            bookings += sum(status == 200 for status, _ in confirmed)
+            # A screening is done once one of its holds fails for lack of seats
+            sold_out = {hold[0] for hold, (status, _) in zip(holds, responses) if status != 201}
+            open_screenings = [screening_id for screening_id in open_screenings if screening_id not in sold_out]
+        elapsed = time.perf_counter() - started
+    return {
+        "workers": worker_count,
+        "screenings": screening_count,
+        "bookings": bookings,
+        "requests_per_second": requests / elapsed,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of the sharded booking engine against the number of worker processes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--screenings", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--seats-per-row", type=int, default=40)
+    parser.add_argument("--holds-per-round", type=int, default=8)
+    parser.add_argument("--seats-per-booking", type=int, default=2)
+    args = parser.parse_args()
+    results = [run(worker_count, args.screenings, args.rows, args.seats_per_row, args.holds_per_round, args.seats_per_booking) for worker_count in args.workers]
+    print(json.dumps({"cpu_count": os.cpu_count(), "runs": results}, indent=2))
@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.models import Booking, Movie, Screening, SeatingConfig
+from cinema_booking_system.repositories import ScreeningSnapshot, SQLiteRepository, write_snapshot
+
+def timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat * 1000
+
+def python_heap_bytes(function) -> int:
+    # Python heap kept alive by what the function returns
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+def read_availability(snapshot: ScreeningSnapshot) -> int:
+    return snapshot.seats_free + snapshot.seats_free_in_row(snapshot.row_count - 1)
+
+def run(row_count: int, seat_count_per_row: int, occupancy: float, repeat: int) -> dict:
+    seat_config = SeatingConfig(row_count, seat_count_per_row)
+    random.seed(1)
+    booked = sorted(random.sample(range(0, seat_config.total_seats - 1, 2), int(seat_config.total_seats * occupancy / 2)))
+    bookings = [Booking(f"GIC{index:013d}", [seat, seat + 1]) for index, seat in enumerate(booked)]
+    screening = Screening(datetime(2025, 1, 1, 20, 0), seat_config, Movie("Arena"), bookings)
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, "screening.snapshot")
+        repository = SQLiteRepository(os.path.join(directory, "cinema.db"))
+        screening_id = repository.save_screening(screening)
+
+        def attach():
+            # What a kiosk or reporting process does: map the file and read availability
+            with ScreeningSnapshot(snapshot_path) as snapshot:
+                return read_availability(snapshot)
+
+        def attach_and_keep():
+            return ScreeningSnapshot(snapshot_path)
+
+        write_ms = timed(lambda: write_snapshot(screening, snapshot_path), max(1, repeat // 10))
+        with ScreeningSnapshot(snapshot_path) as snapshot:
+            load_ms = timed(snapshot.load, max(1, repeat // 20))
+        results = {
+            "rows": row_count,
+            "seats_per_row": seat_count_per_row,
+            "bookings": len(bookings),
+            "snapshot_bytes": os.path.getsize(snapshot_path),
+            "ms": {
+                "write_snapshot": write_ms,
+                "attach_and_read_availability": timed(attach, repeat),
+                "load_from_snapshot": load_ms,
+                "load_from_sqlite": timed(lambda: repository.load_screening(screening_id), max(1, repeat // 20)),
+            },
+            "python_heap_bytes": {
+                "attached_snapshot": python_heap_bytes(attach_and_keep),
+                "loaded_screening": python_heap_bytes(lambda: repository.load_screening(screening_id)),
+            },
+        }
+        repository.close()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Writing, attaching to and loading binary screening snapshots, against loading the screening from SQLite")
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--seats-per-row", type=int, default=250)
+    parser.add_argument("--occupancy", type=float, default=0.6)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.seats_per_row, args.occupancy, args.repeat), indent=2))
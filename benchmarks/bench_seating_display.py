@@ -0,0 +1,69 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models import Movie, Screening, SeatingConfig
+from cinema_booking_system.seating_display import SeatingDisplay
+
+def run(row_count: int, seat_count_per_row: int, frame_count: int) -> dict:
+    # Half-booked hall, previewing a 4-seat selection, as the booking menu does after each seat choice
+    screening = Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie("Benchmark"), [])
+    booker = BookingController(screening)
+    while screening.seats_free > screening.seat_config.total_seats // 2:
+        booker.reserve(3)
+    display = SeatingDisplay(screening)
+    selected_seats = booker.select_seats_from_center(4, None)
+
+    started = time.perf_counter()
+    for _ in range(frame_count):
+        display.render(selected_seats)
+    render_seconds = time.perf_counter() - started
+
+    # Include the write, into an in-memory stream so the terminal's speed is not measured
+    stdout, sys.stdout = sys.stdout, io.StringIO()
+    try:
+        started = time.perf_counter()
+        for _ in range(frame_count):
+            display.display(selected_seats)
+        display_seconds = time.perf_counter() - started
+    finally:
+        sys.stdout = stdout
+
+    # Bytes sent per frame when the preview is repainted in place, moving a 4-seat selection along the middle row
+    # (LINES makes the terminal tall enough for the frame to be repainted rather than printed in full)
+    os.environ["LINES"] = str(row_count + 100)
+    stdout, sys.stdout = sys.stdout, io.StringIO()
+    try:
+        display.repaint(selected_seats)
+        repaint_bytes = []
+        middle_row = row_count // 2 * seat_count_per_row
+        for column in range(seat_count_per_row - 4):
+            sys.stdout = io.StringIO()
+            display.repaint(range(middle_row + column, middle_row + column + 4))
+            repaint_bytes.append(len(sys.stdout.getvalue()))
+    finally:
+        sys.stdout = stdout
+
+    return {
+        "rows": row_count,
+        "seats_per_row": seat_count_per_row,
+        "frame_bytes": len(display.render(selected_seats)),
+        "render_us": render_seconds / frame_count * 1e6,
+        "display_us": display_seconds / frame_count * 1e6,
+        "repaint_bytes": sum(repaint_bytes) / len(repaint_bytes),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and terminal output to render one seat-selection preview frame")
+    parser.add_argument("--rows", type=int, default=26)
+    parser.add_argument("--seats-per-row", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=10000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.seats_per_row, args.frames), indent=2))
@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models import BookingRequest, Movie, Screening, SeatingConfig
+from cinema_booking_system.repositories import SQLiteRepository
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def run(booking_count: int, seats_per_booking: int, batch_size: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SQLiteRepository(os.path.join(directory, "bench.db"))
+        seat_count_per_row = 50
+        row_count = -(-booking_count * seats_per_booking // seat_count_per_row)
+        screening = Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie("Benchmark"), [])
+        repository.save_screening(screening)
+        booker = BookingController(screening, repository)
+
+        # One confirmation (allocation + commit) per booking, as the interactive menu does
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(booking_count // 2):
+            begin = time.perf_counter()
+            booking = booker.new_booking()
+            booking.seats = booker.select_seats_from_center(seats_per_booking, None)
+            booker.save_booking(booking)
+            latencies.append(time.perf_counter() - begin)
+        single_elapsed = time.perf_counter() - started
+
+        # The remaining bookings go through book_many, committed in one transaction per batch
+        remaining = booking_count - booking_count // 2
+        started = time.perf_counter()
+        for offset in range(0, remaining, batch_size):
+            booker.book_many([BookingRequest(seats_per_booking) for _ in range(min(batch_size, remaining - offset))])
+        batch_elapsed = time.perf_counter() - started
+        repository.close()
+
+    return {
+        "bookings": booking_count,
+        "seats_per_booking": seats_per_booking,
+        "commit_latency_ms": {
+            "p50": percentile(latencies, 0.5) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": max(latencies) * 1000,
+        },
+        "single_bookings_per_second": len(latencies) / single_elapsed,
+        "batch_size": batch_size,
+        "batch_bookings_per_second": remaining / batch_elapsed,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Commit latency and throughput of the SQLite booking repository")
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--seats-per-booking", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    print(json.dumps(run(args.bookings, args.seats_per_booking, args.batch_size), indent=2))
@@ -1,3 +1,23 @@
-from .booking_menu import BookingMenu
-from .config_menu import ConfigMenu
-from .seating_display import SeatingDisplay
+import importlib
+
+# The menus pull in prompt_toolkit, so the public names are imported on first use (PEP 562) rather than here;
+# importing the models, controllers, repositories or service does not load the interactive front-end
+_LAZY_ATTRIBUTES = {
+    "BookingMenu": ".booking_menu",
+    "CommandRunner": ".command_runner",
+    "ConfigMenu": ".config_menu",
+    "SeatingDisplay": ".seating_display",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
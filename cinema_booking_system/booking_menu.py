@@ -1,18 +1,23 @@
 import re
 import time
+from datetime import datetime
+from typing import Optional
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.validation import Validator, ValidationError
-from cinema_booking_system.models.screening import Screening
-from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.models.cinema import Cinema
+from cinema_booking_system.models.screening import Screening, SeatConflictError
 from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
 from cinema_booking_system.seating_display import SeatingDisplay
 
 class BookingMenuValidator(Validator):
     
-    def __init__(self, seating_config: SeatingConfig, booking_data: list):
-        self.seating_config = seating_config
-        self.booking_data = booking_data
+    def __init__(self, screening: Screening):
+        self.screening = screening
+        self.seating_config = screening.seat_config
+        # Seats held by the booking being made are still selectable by that booking
+        self.hold_id = None
     
     def validate(self, document):
         text = document.text
@@ -23,19 +28,20 @@ class BookingMenuValidator(Validator):
             )
         
         if text.lower() != 'confirm' and text.lower() != 'cancel':
-            if not re.match(r'^[A-Za-z]\d+$', text):
+            if not re.match(r'^[A-Za-z]+\d+$', text):
                 raise ValidationError(
                     message="Invalid format. Please select a seating position (e.g. A1, B2, C3).",
                     cursor_position=len(text)  # Move cursor to the end
                 )
             
-            row_letter = text[0].upper()
-            seat_number = int(text[1:])
+            split = len(text.rstrip("0123456789"))
+            row = self.seating_config.parse_row(text[:split])
+            seat_number = int(text[split:])
             
-            # Validate row letter
-            if ord(row_letter) - ord('A') >= self.seating_config.row_count:
+            # Validate row letters
+            if row >= self.seating_config.row_count:
                 raise ValidationError(
-                    message=f"Invalid row. Please select a row between A and {chr(ord('A') + self.seating_config.row_count - 1)}.",
+                    message=f"Invalid row. Please select a row between A and {self.seating_config.row_label(self.seating_config.row_count - 1)}.",
                     cursor_position=len(text)  # Move cursor to the end
                 )
             
@@ -47,25 +53,33 @@ class BookingMenuValidator(Validator):
                 )
             
             # Check if the seat is already booked
-            for booking in self.booking_data:
-                if text in booking.seats:
-                    raise ValidationError(
-                        message="Seat is already booked. Please select another seat.",
-                        cursor_position=len(text)  # Move cursor to the end
-                    )
+            seat = self.seating_config.seat_id(row, seat_number - 1)
+            if not self.screening.is_seat_available(seat) and not self.screening.is_seat_held_by(seat, self.hold_id):
+                raise ValidationError(
+                    message="Seat is already booked. Please select another seat.",
+                    cursor_position=len(text)  # Move cursor to the end
+                )
 
 class BookingMenu:
-    def __init__(self, screening: Screening):
-        self.screening = screening
-        self.menu_options = ["1", "2", "3"]
+    def __init__(self, screening: Screening, repository: Optional[SQLiteRepository] = None, cinema: Optional[Cinema] = None, repaint: bool = False):
+        self.repository = repository
+        # Redraw the seat preview in place, sending only the seats that changed, instead of printing a new map each time
+        self.repaint = repaint
+        # With a cinema catalog the user can switch between its screenings
+        self.cinema = cinema
+        self.menu_options = ["1", "2", "3", "4"] if cinema is not None else ["1", "2", "3"]
         self.booking_select_options = ["Confirm", "Cancel"]
-        self.booking_check_options = ["GIC0001"]
         self.menu_completer = WordCompleter(self.menu_options, ignore_case=True)
         self.booking_select_completer = WordCompleter(self.booking_select_options, ignore_case=True)
-        self.booking_check_completer = WordCompleter(self.booking_check_options, ignore_case=True)
-        self.validator = BookingMenuValidator(screening.seat_config, screening.booking_data)
-        self.seating_display = SeatingDisplay(screening.seat_config, screening.booking_data)
-        self.booker = BookingController(screening)
+        # Offer the most recent booking ids, read each time the completer runs
+        self.booking_check_completer = WordCompleter(lambda: self.screening.latest_booking_ids(10)[::-1], ignore_case=True)
+        self.select_screening(screening)
+    
+    def select_screening(self, screening: Screening):
+        self.screening = screening
+        self.validator = BookingMenuValidator(screening)
+        self.seating_display = SeatingDisplay(screening)
+        self.booker = BookingController(screening, self.repository)
         
     def display_menu(self):
         user_input = prompt(
@@ -74,7 +88,8 @@ class BookingMenu:
             f"[1] Book Tickets for '{self.screening.movie.title}' ({self.booker.seats_available} seats available)\n"
             "[2] Check Bookings\n"
             "[3] Exit\n"
-            "\n"
+            + (f"[4] Change Screening (now showing: {self.screening.start_time:%Y-%m-%d %H:%M}, Hall {self.screening.hall})\n" if self.cinema is not None else "")
+            + "\n"
             "Please enter your selection (Press Tab to view available options): ",
             completer=self.menu_completer
         )
@@ -99,82 +114,139 @@ class BookingMenu:
     def prompt_booking_id(self):
         booking_id = prompt(
             "Enter booking ID to check booking details, or enter blank to go back to the main menu.\n"
-            "Hint: Press tab for an example ID\n"
+            "Hint: Press tab for the latest booking IDs\n"
             "Booking ID: ",
             completer = self.booking_check_completer,
         )
         return booking_id
 
+    def prompt_screening(self):
+        # List today's and later screenings, optionally of one movie only, and let the user pick one by number
+        title = prompt(
+            "\nEnter a movie title to list its screenings, or enter blank to list all screenings:\n",
+            completer = WordCompleter(self.cinema.movies, ignore_case=True),
+        )
+        start_of_today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        screenings = self.cinema.screenings_between(start_of_today, datetime.max, title or None)
+        if not screenings:
+            print("\nNo screenings found.")
+            return None
+        print()
+        for number, screening in enumerate(screenings, 1):
+            availability = self.cinema.availability(screening)
+            seats = "sold out" if availability.sold_out else f"{availability.seats_free} seats available"
+            print(f"[{number}] '{screening.movie.title}' at {screening.start_time:%Y-%m-%d %H:%M}, Hall {screening.hall} ({seats})")
+        choice = prompt("\nPlease enter the screening number, or enter blank to go back to the main menu: ")
+        if choice.isdigit() and 1 <= int(choice) <= len(screenings):
+            return screenings[int(choice) - 1]
+        return None
+
     def run(self):
         while True:
             menu_choice = self.display_menu()
             match menu_choice:
                 case "1":
-                    
-                    if self.booker.seats_available == 0:
-                        print(f"Sorry, this screening has been fully booked.")
-                        time.sleep(2) # block the thread to make sure the user reads the message
-                    
-                    else:
-                        # Prompt user for number of seats
-                        input_seats = self.prompt_seat_count()
-                        if input_seats.isdigit() and 1 <= int(input_seats) <= self.booker.seats_available:
-                            
-                            # Reserve number of seats
-                            seat_count = int(input_seats)
-                            print(f"\nBooking {seat_count} seats for {self.screening.movie.title}...")
-                            
-                            # Create a booking object and generate an id
-                            booking = self.booker.new_booking()
-                            
-                            self.booker.seats_available -= int(input_seats)
-                            print(f"\nSuccessfully reserved {input_seats} seats for {self.screening.movie.title} at {self.screening.start_time}.\nBooking ID: {booking.id} \n")
-                            
-                            # Prompt user to select seats
-                            selected_seats = None
-                            seat_input = None
-                            while True:
+                    # Back to the seat count prompt whenever other sellers take the seats this booking needs
+                    while True:
+                        
+                        if self.booker.seats_available == 0:
+                            print(f"Sorry, this screening has been fully booked.")
+                            time.sleep(2) # block the thread to make sure the user reads the message
+                        
+                        else:
+                            # Prompt user for number of seats
+                            input_seats = self.prompt_seat_count()
+                            if input_seats.isdigit() and 1 <= int(input_seats) <= self.booker.seats_available:
                                 
-                                if selected_seats is None:
-                                    # Determine the default seat selection - rear and center
-                                    selected_seats = self.booker.select_seats_from_center(seat_count, None)
-                                else:
-                                    # Determine the seat selection based on user input
-                                    selected_seats = self.booker.determine_seats_from_user_selection(seat_count, seat_input)
+                                # Reserve number of seats
+                                seat_count = int(input_seats)
+                                print(f"\nBooking {seat_count} seats for {self.screening.movie.title}...")
                                 
-                                # Preview seating selection
-                                print(f"Selected Seats: {selected_seats}\n")
-                                self.seating_display.display(selected_seats)
+                                # Create a booking object and generate an id
+                                booking = self.booker.new_booking()
                                 
-                                # Prompt user to select a custom seat, confirm, or cancel
-                                seat_input = self.prompt_seat_position()
-                                if seat_input.lower() == "confirm":
-                                    # Update models and commit transactions
-                                    booking.seats = selected_seats
-                                    self.screening.booking_data.append(booking)
-                                    self.booker.save_booking(booking)
-                                    print(f"\nBooking confirmed! Booking ID: {booking.id} Seats: {selected_seats}\n")
-                                    time.sleep(2) # block the thread to make sure the user reads the message
-                                    break
-                                elif seat_input.lower() == "cancel":
-                                    self.booker.seats_available += seat_count
-                                    print("\nCancelling booking...")
-                                    break
+                                print(f"\nSuccessfully reserved {input_seats} seats for {self.screening.movie.title} at {self.screening.start_time}.\nBooking ID: {booking.id} \n")
                                 
-                        elif input_seats.isdigit() and int(input_seats) > self.booker.seats_available:
-                            print(f"Sorry, there are only {self.booker.seats_available} seats available. Please try again.")
-                            time.sleep(2) # block the thread to make sure the user reads the message
-                        
+                                # Prompt user to select seats
+                                starting_seat = None
+                                notice = None
+                                self.validator.hold_id = booking.id
+                                self.seating_display.reset()
+                                while True:
+                                    
+                                    # Determine the default seat selection - rear and center - or the selection from the seat the user entered,
+                                    # and hold it so other sellers cannot take it while the user decides. The previous preview's hold is only
+                                    # replaced once the new selection is held.
+                                    try:
+                                        self.booker.hold(booking, seat_count, starting_seat)
+                                    except SeatConflictError:
+                                        continue # Other sellers kept taking the planned seats; select again
+                                    except ValueError as error:
+                                        # Other sellers took seats after the count was accepted, so the party no longer fits
+                                        self.booker.release_hold(booking)
+                                        notice = f"\n{error} Please try again."
+                                        break
+                                    selected_seats = list(booking.seats)
+                                    
+                                    # Preview seating selection
+                                    # (when repainting, anything printed under the map is cleared, so messages follow the map)
+                                    if self.repaint:
+                                        self.seating_display.repaint(selected_seats)
+                                        print(f"Selected Seats: {self.screening.seat_config.seat_labels(selected_seats)}")
+                                        if notice:
+                                            print(notice)
+                                    else:
+                                        if notice:
+                                            print(notice)
+                                        print(f"Selected Seats: {self.screening.seat_config.seat_labels(selected_seats)}\n")
+                                        self.seating_display.display(selected_seats)
+                                    notice = None
+                                    
+                                    # Prompt user to select a custom seat, confirm, or cancel
+                                    seat_input = self.prompt_seat_position()
+                                    if seat_input.lower() == "confirm":
+                                        # Update models and commit transactions
+                                        try:
+                                            self.booker.save_booking(booking)
+                                        except ValueError as error:
+                                            # The seats were taken or could not be saved; go back to the default selection
+                                            notice = f"\nUnable to confirm booking: {error}\nPlease review the updated seat selection.\n"
+                                            starting_seat = None
+                                            continue
+                                        print(f"\nBooking confirmed! Booking ID: {booking.id} Seats: {self.screening.seat_config.seat_labels(selected_seats)}\n")
+                                        time.sleep(2) # block the thread to make sure the user reads the message
+                                        break
+                                    elif seat_input.lower() == "cancel":
+                                        self.booker.release_hold(booking)
+                                        print("\nCancelling booking...")
+                                        break
+                                    else:
+                                        starting_seat = self.screening.seat_config.parse_seat(seat_input)
+                                self.validator.hold_id = None
+                                if notice:
+                                    print(notice)
+                                    continue
+                                    
+                            elif input_seats.isdigit() and int(input_seats) > self.booker.seats_available:
+                                print(f"Sorry, there are only {self.booker.seats_available} seats available. Please try again.")
+                                if self.cinema is not None:
+                                    # Point the user at the next show of the same movie that can fit the party
+                                    next_screening = self.cinema.next_screening_with_seats(int(input_seats), self.screening.start_time, self.screening.movie.title)
+                                    if next_screening is not None:
+                                        print(f"The next screening with {input_seats} seats available is at {next_screening.start_time:%Y-%m-%d %H:%M} in Hall {next_screening.hall} (select it with [4]).")
+                                time.sleep(2) # block the thread to make sure the user reads the message
+                        break
+                    
                 case "2":
                     
                     while True:
                         booking_id = self.prompt_booking_id()
                         
                         if booking_id:
-                            booking = next((booking for booking in self.screening.booking_data if booking.id == booking_id), None)
+                            booking = self.screening.find_booking(booking_id.strip().upper())
                             if booking:
                                 print(f"\nBooking ID: {booking.id}")
-                                print(f"Seats: {booking.seats}")
+                                print(f"Seats: {self.screening.seat_config.seat_labels(booking.seats)}")
                                 self.seating_display.display(booking.seats)
                             else:
                                 print("\nBooking not found.")
@@ -185,6 +257,12 @@ class BookingMenu:
                     print("\nThank you for using GIC Cinemas System. Bye!")
                     break
                 
+                case "4" if self.cinema is not None:
+                    screening = self.prompt_screening()
+                    if screening is not None:
+                        self.select_screening(screening)
+                        print(f"\nNow booking '{screening.movie.title}' at {screening.start_time:%Y-%m-%d %H:%M}, Hall {screening.hall}.")
+                
                 case _:
                     print("\nInvalid choice, please try again.")
                     
\ No newline at end of file
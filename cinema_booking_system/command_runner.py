@@ -0,0 +1,172 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+from cinema_booking_system.config_parser import parse_config
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.cinema import Cinema
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening, DEFAULT_HALL
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+
+USAGE = "Commands: configure [Title] [Row] [Seats Per Row] | book [Seats] [from Seat] | confirm | cancel [Booking ID] | check [Booking ID]"
+
+class CommandError(Exception):
+    pass
+
+class CommandRunner:
+    # Runs the booking menu's flow from text commands instead of prompts, one JSON result per command, with no
+    # seat maps drawn and no pauses, so scripted load tests and bulk jobs run at the speed of the controller:
+    #   configure Inception 8 10     start a new screening (the same format as the configuration prompt)
+    #   book 3 [from B4]             hold seats for a new booking, or change the selection of the pending one
+    #   confirm                      confirm the pending booking
+    #   cancel [GIC...]              release the pending booking, or cancel a confirmed one
+    #   check GIC...                 booking details
+    def __init__(self, screening: Optional[Screening] = None, repository: Optional[SQLiteRepository] = None, cinema: Optional[Cinema] = None, hall: str = DEFAULT_HALL):
+        self.repository = repository
+        self.cinema = cinema
+        self.hall = hall
+        self.screening: Optional[Screening] = None
+        self.booker: Optional[BookingController] = None
+        # The booking whose seats are held until it is confirmed or cancelled, as in the booking menu
+        self.pending: Optional[Booking] = None
+        if screening is not None:
+            self.select_screening(screening)
+
+    def select_screening(self, screening: Screening):
+        self.screening = screening
+        self.booker = BookingController(screening, self.repository)
+        self.pending = None
+
+    def run(self, lines: Iterable[str], output: TextIO) -> int:
+        # Execute every command, writing each result as a JSON line; returns the number of failed commands
+        failures = 0
+        for line in lines:
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+            result = self.execute(command)
+            failures += not result["ok"]
+            output.write(json.dumps(result) + "\n")
+        # Leave no seats held by an unfinished script
+        if self.pending is not None:
+            self.booker.release_hold(self.pending)
+            self.pending = None
+        output.flush()
+        return failures
+
+    def execute(self, command: str) -> Dict[str, Any]:
+        name, _, arguments = command.partition(" ")
+        handler = {
+            "configure": self.configure,
+            "book": self.book,
+            "confirm": self.confirm,
+            "cancel": self.cancel,
+            "check": self.check,
+        }.get(name.lower())
+        try:
+            if handler is None:
+                raise CommandError(f"Unknown command: {name}. {USAGE}")
+            if handler != self.configure and self.screening is None:
+                raise CommandError("No screening configured. Start with: configure [Title] [Row] [Seats Per Row]")
+            result = handler(arguments.split())
+        except (CommandError, ValueError) as error:
+            return {"command": command, "ok": False, "error": str(error)}
+        return {"command": command, "ok": True, **result}
+
+    def configure(self, arguments: List[str]) -> Dict[str, Any]:
+        title, row_count, seat_count_per_row = parse_config(" ".join(arguments))
+        self._release_pending()
+        screening = Screening(datetime.now(), SeatingConfig(row_count, seat_count_per_row), Movie(title), [], hall=self.hall)
+        if self.repository is not None:
+            self.repository.save_screening(screening)
+        if self.cinema is not None:
+            self.cinema.add_screening(screening)
+        self.select_screening(screening)
+        return self._screening_details()
+
+    def book(self, arguments: List[str]) -> Dict[str, Any]:
+        if len(arguments) not in (1, 3) or not arguments[0].isdigit() or (len(arguments) == 3 and arguments[1].lower() != "from"):
+            raise CommandError("Invalid format. Please enter in book [Seats] [from Seat] format.")
+        seat_count = int(arguments[0])
+        seats_available = self.booker.seats_available + (len(self.pending.seats) if self.pending is not None else 0)
+        if not 1 <= seat_count <= seats_available:
+            raise CommandError(f"Sorry, there are only {seats_available} seats available.")
+        starting_seat = None
+        if len(arguments) == 3:
+            starting_seat = self.screening.seat_config.parse_seat(arguments[2].upper())
+            if not self.screening.is_seat_available(starting_seat) and not (self.pending is not None and self.screening.is_seat_held_by(starting_seat, self.pending.id)):
+                raise CommandError("Seat is already booked. Please select another seat.")
+        # Like choosing a new seat in the booking menu, a second book command changes the pending booking's selection
+        booking = self.pending if self.pending is not None else self.booker.new_booking()
+        self.booker.hold(booking, seat_count, starting_seat)
+        self.pending = booking
+        return self._booking_details(booking, confirmed=False)
+
+    def confirm(self, arguments: List[str]) -> Dict[str, Any]:
+        if self.pending is None:
+            raise CommandError("No booking to confirm. Start with: book [Seats]")
+        booking, self.pending = self.pending, None
+        if not self.screening.held_seats(booking.id):
+            raise CommandError(f"The hold on booking {booking.id} has expired")
+        try:
+            self.booker.save_booking(booking)
+        except ValueError as error:
+            self.booker.release_hold(booking)
+            raise CommandError(f"Unable to confirm booking: {error}") from error
+        return self._booking_details(booking, confirmed=True)
+
+    def cancel(self, arguments: List[str]) -> Dict[str, Any]:
+        if not arguments:
+            if self.pending is None:
+                raise CommandError("No booking to cancel.")
+            booking = self.pending
+            self._release_pending()
+        else:
+            booking_id = arguments[0].upper()
+            if self.pending is not None and self.pending.id == booking_id:
+                booking = self.pending
+                self._release_pending()
+            else:
+                booking = self._find_booking(booking_id)
+                self.booker.cancel_booking(booking)
+        return {"booking_id": booking.id, "cancelled": True}
+
+    def check(self, arguments: List[str]) -> Dict[str, Any]:
+        if len(arguments) != 1:
+            raise CommandError("Invalid format. Please enter in check [Booking ID] format.")
+        booking_id = arguments[0].upper()
+        if self.pending is not None and self.pending.id == booking_id:
+            return self._booking_details(self.pending, confirmed=False)
+        return self._booking_details(self._find_booking(booking_id), confirmed=True)
+
+    def _find_booking(self, booking_id: str) -> Booking:
+        booking = self.screening.find_booking(booking_id)
+        if booking is None:
+            raise CommandError("Booking not found.")
+        return booking
+
+    def _release_pending(self):
+        if self.pending is not None:
+            self.booker.release_hold(self.pending)
+            self.pending = None
+
+    def _screening_details(self) -> Dict[str, Any]:
+        return {
+            "screening_id": self.screening.id,
+            "movie": self.screening.movie.title,
+            "start_time": self.screening.start_time.isoformat(),
+            "hall": self.screening.hall,
+            "rows": self.screening.seat_config.row_count,
+            "seats_per_row": self.screening.seat_config.seat_count_per_row,
+            "seats_available": self.booker.seats_available,
+        }
+
+    def _booking_details(self, booking: Booking, confirmed: bool) -> Dict[str, Any]:
+        return {
+            "booking_id": booking.id,
+            "seats": self.screening.seat_config.seat_labels(booking.seats),
+            "confirmed": confirmed,
+            "seats_available": self.booker.seats_available,
+        }
@@ -1,48 +1,23 @@
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
 from prompt_toolkit.validation import Validator, ValidationError
+from cinema_booking_system import config_parser
 
 class ConfigMenuValidator(Validator):
-    MAX_ROWS = 26
-    MAX_SEATS_PER_ROW = 50
+    MAX_ROWS = config_parser.MAX_ROWS
+    MAX_SEATS_PER_ROW = config_parser.MAX_SEATS_PER_ROW
     
     def validate(self, document):
         text = document.text.strip()
-        if not text:
+        if text and text.split()[0].lower() == 'exit':
+            return
+        try:
+            config_parser.parse_config(text)
+        except ValueError as error:
             raise ValidationError(
-                message="Input cannot be empty. Please enter in [Title] [Row] [Seats Per Row] format.",
+                message=str(error),
                 cursor_position=len(text)  # Move cursor to the end
-            )
-        
-        parts = text.split()
-        if parts[0].lower() != 'exit':
-            if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
-                raise ValidationError(
-                    message="Invalid format. Please enter in [Title] [Row] [Seats Per Row] format.",
-                    cursor_position=len(text)  # Move cursor to the end
-                )
-            row_count = int(parts[1])
-            seats_per_row = int(parts[2])
-            if row_count <= 0:
-                raise ValidationError(
-                    message="Row count must be a positive integer.",
-                    cursor_position=len(text)  # Move cursor to the end
-                )
-            if seats_per_row <= 0:
-                raise ValidationError(
-                    message="Seats per row must be a positive integer.",
-                    cursor_position=len(text)  # Move cursor to the end
-                )
-            if row_count > self.MAX_ROWS:
-                raise ValidationError(
-                    message=f"Row count cannot exceed {self.MAX_ROWS}.",
-                    cursor_position=len(text)  # Move cursor to the end
-                )
-            if seats_per_row > self.MAX_SEATS_PER_ROW:
-                raise ValidationError(
-                    message=f"Seats per row cannot exceed {self.MAX_SEATS_PER_ROW}.",
-                    cursor_position=len(text)  # Move cursor to the end
-                )
+            ) from error
 
 class ConfigMenu:
     def __init__(self):
@@ -0,0 +1,26 @@
+from typing import Tuple
+
+# Up to two-letter row labels (A to ZZ) and arena-sized halls; see the performance targets in docs/design.md
+MAX_ROWS = 702
+MAX_SEATS_PER_ROW = 500
+
+def parse_config(text: str) -> Tuple[str, int, int]:
+    # Parses "[Title] [Row] [Seats Per Row]" into its parts, raising ValueError with a message for the user.
+    # Kept apart from the config menu so headless callers can check a configuration without loading prompt_toolkit.
+    text = text.strip()
+    if not text:
+        raise ValueError("Input cannot be empty. Please enter in [Title] [Row] [Seats Per Row] format.")
+    parts = text.split()
+    if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+        raise ValueError("Invalid format. Please enter in [Title] [Row] [Seats Per Row] format.")
+    row_count = int(parts[1])
+    seats_per_row = int(parts[2])
+    if row_count <= 0:
+        raise ValueError("Row count must be a positive integer.")
+    if seats_per_row <= 0:
+        raise ValueError("Seats per row must be a positive integer.")
+    if row_count > MAX_ROWS:
+        raise ValueError(f"Row count cannot exceed {MAX_ROWS}.")
+    if seats_per_row > MAX_SEATS_PER_ROW:
+        raise ValueError(f"Seats per row cannot exceed {MAX_SEATS_PER_ROW}.")
+    return parts[0], row_count, seats_per_row
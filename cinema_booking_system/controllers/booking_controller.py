@@ -1,163 +1,240 @@
-import re
-from typing import List
-from cinema_booking_system.models.screening import Screening
+from typing import Iterable, List, Optional, Set
+from cinema_booking_system import metrics
+from cinema_booking_system.models.screening import Screening, SeatConflictError
 from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.booking_id_generator import BookingIdGenerator, booking_ids
+from cinema_booking_system.models.booking_request import BookingRequest, BatchBookingResult
+from cinema_booking_system.models.seat_map import SeatMap, FREE, BOOKED
+from cinema_booking_system.repositories.booking_journal import BookingJournal
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+
+# How long seats picked for an unconfirmed booking stay held before they are released again
+HOLD_TTL_SECONDS = 300
 
 class BookingController:
     
-    def __init__(self, screening: Screening):
+    def __init__(self, screening: Screening, repository: Optional[SQLiteRepository] = None, journal: Optional[BookingJournal] = None, hold_ttl: float = HOLD_TTL_SECONDS, id_generator: Optional[BookingIdGenerator] = None):
         self.screening = screening
+        self.id_generator = id_generator if id_generator is not None else booking_ids
+        self.repository = repository
+        # The journal must already hold this screening's state; starting it here could overwrite a snapshot not yet recovered
+        if journal is not None and not journal.started:
+            raise ValueError("The booking journal has not been started; call start() or recover() before using it")
+        self.journal = journal
+        self.hold_ttl = hold_ttl
         self.total_seats = screening.seat_config.row_count * screening.seat_config.seat_count_per_row
-        self.seats_available = self.total_seats - len(screening.booking_data) # fix me
         
     @property
-    def seats_available(self) -> List[Booking]:
-        return self._seats_available
-    
-    @seats_available.setter
-    def seats_available(self, value):
-        self._seats_available = value
+    def seats_available(self) -> int:
+        # Read straight from the screening's seat counters, which are updated whenever seats are booked, held or released
+        self.screening.expire_holds()
+        return self.screening.seats_free
     
-    def is_seat_booked(self, seat: str) -> bool:
-        # for booking in self.screening.booking_data:
-            # print(f'Seats already booked for: booking.id: {booking.id}, booking.seats: {booking.seats}')
-        return any(seat in booking.seats for booking in self.screening.booking_data)
+    def is_seat_booked(self, seat: int) -> bool:
+        # O(1) lookup against the occupancy index maintained by the screening
+        return self.screening.is_seat_booked(seat)
 
-    def select_seats_from_center(self, seat_count: int, starting_row: str) -> List[str]:
-        seats_per_row = self.screening.seat_config.seat_count_per_row
-        selected_seats: List[str] = []
-        
-        # Calculate the center column
-        center_column = seats_per_row // 2
+    def select_seats_from_center(self, seat_count: int, starting_row: Optional[int], excluded_seats: Optional[Set[int]] = None, seat_map: Optional[SeatMap] = None) -> List[int]:
+        if seat_map is None:
+            # Plan against the live seat map, retrying if another thread commits while we read it
+            return self.screening.read_consistent(lambda: self.select_seats_from_center(seat_count, starting_row, excluded_seats, self.screening.seat_map))
+        seat_config = self.screening.seat_config
+        selected_seats: List[int] = []
+        excluded_seats = excluded_seats or set()
         
-        # Initialize row
-        # row_offset = ord(starting_row) - ord('A') if starting_row is not None else 0
-        starting_row = 'A' if starting_row is None else starting_row
-        current_row = starting_row
+        # Initialize row (wrapping around so a start past the last row goes back to the first)
+        current_row = 0 if starting_row is None else starting_row % seat_config.row_count
         seats_needed = seat_count
         
-        # print(f"starting_row: {starting_row}, current_row:{current_row}, seats_needed:{seats_needed}")
+        # Keep the party together where possible: take the closest-to-center block of adjacent seats in the first row that fits it
+        if 0 < seat_count <= seat_config.seat_count_per_row:
+            block = seat_map.find_free_block(seat_count, current_row)
+            if block and not excluded_seats.intersection(block):
+                metrics.observe("seat_allocation_rows_probed", 1, metrics.COUNT_BUCKETS)
+                return block
         
-        while seats_needed > 0:
-            # For each row, start from center and expand outwards
-            left_ptr = center_column
-            right_ptr = center_column + 1
-            row_seats: List[str] = []
-            
-            while len(row_seats) < min(seats_per_row, seats_needed):
-                
-                # print(f"row_seats: {row_seats}")
-                
-                # Try center-left seat
-                if left_ptr >= 0:
-                    seat_str = f"{current_row}{left_ptr + 1}"
-                    if not self.is_seat_booked(seat_str) and seat_str not in selected_seats:
-                        row_seats.append(seat_str)
-                    left_ptr -= 1
-                    # print(f"left_ptr: {left_ptr}")
-                
-                # If we still need seats, try center-right seat
-                if len(row_seats) < min(seats_per_row, seats_needed) and right_ptr < seats_per_row:
-                    seat_str = f"{current_row}{right_ptr + 1}"
-                    if not self.is_seat_booked(seat_str) and seat_str not in selected_seats:
-                        row_seats.append(seat_str)
-                    right_ptr += 1
-                    # print(f"right_ptr: {right_ptr}")
-                    
-                # Skip to the next row if both pointers reached the end (the row is full)
-                if (left_ptr < 0) and (right_ptr == seats_per_row):
-                    # print(f"Row {current_row} is full, unable to assign more seats")
-                    break
+        # Otherwise split the party, filling each row from the center outwards
+        
+        # Visit every row at most once; a short selection only happens if the screening is (nearly) full
+        rows_probed = 0
+        for _ in range(seat_config.row_count):
+            if seats_needed <= 0:
+                break
+            rows_probed += 1
             
-            # Add the seats found in this row to our selection
-            selected_seats.extend(row_seats)
-            seats_needed -= len(row_seats)
+            # For each row, take the free seats closest to the center (skipping rows with nothing left)
+            if seat_map.count_in_row(current_row) > 0:
+                row_seats = seat_map.free_seats_from_center(current_row, seats_needed + len(excluded_seats))
+                row_seats = [seat for seat in row_seats if seat not in excluded_seats][:seats_needed]
+                selected_seats.extend(row_seats)
+                seats_needed -= len(row_seats)
             
-            # Move to next row if we still need more seats
-            if seats_needed > 0:
-                # print(f"selected_seats: {selected_seats}, seats_needed: {seats_needed}")
-                current_row = chr(ord(current_row) + 1)
-                
-                # Wrap around to the last row again if the front row of the cinema has been reached
-                if current_row == chr(ord('A') + self.screening.seat_config.row_count):
-                    current_row = 'A'
-                #   - TODO: There is an edge case unlikely encountered in production workloads, but is a bug
-                #       - SeatConfig: Movie 11 11
-                #       - Book 11 seats from position B1
-                #       - Book 110 seats from anywhere in the middle of the cinema (e.g. H9)
-                #       - Seats get missed as a result (default assignments wrap around nicely)
-                #       - NOTE: Doesnt have to be a complete row, any booking needing a wraparound will have this bug
+            # Move to next row, wrapping around to the first row once the last row has been reached
+            current_row = (current_row + 1) % seat_config.row_count
         
+        metrics.observe("seat_allocation_rows_probed", rows_probed, metrics.COUNT_BUCKETS)
         return selected_seats
 
-    def determine_seats_from_user_selection(self, seat_count: int, user_input: str) -> List[str]:
+    def determine_seats_from_user_selection(self, seat_count: int, starting_seat: int, seat_map: Optional[SeatMap] = None) -> List[int]:
+        if seat_map is None:
+            return self.screening.read_consistent(lambda: self.determine_seats_from_user_selection(seat_count, starting_seat, self.screening.seat_map))
         seats_per_row = self.screening.seat_config.seat_count_per_row
-        selected_seats: List[str] = []
-        
-        # Use regular expression to split the user input into row and seat number
-        match = re.match(r"([A-Za-z]+)(\d+)", user_input)
-        row_input = match.group(1).upper()
-        seat_input = int(match.group(2))
-        row_offset = ord(row_input) - ord('A')  # offset to determine the row based on user input
-        seat_offset = seat_input - 1            # offset to determine the seat based on user input
-        # print(f"ord('A'): {ord('A')}, ord(row_input): {ord(row_input)}, row_offset: {row_offset}")
+        selected_seats: List[int] = []
         
-        first_row_filled = False
-        # NOTE: (Bug) if the existing row is fully filled, the algo enters an infinite loop
-        # Nominally, this can be handled with menu/frontend validation to prevent selecting a booked seat.
-        # However, as a big precaution, I'll put this check here until the exact scenario is reproduced, again
-        booked_seats_for_given_row: List[str] = []
-        for booking in self.screening.booking_data:
-            for seat in booking.seats:
-                if seat.startswith(user_input):
-                    booked_seats_for_given_row.append(seat)
-        if len(booked_seats_for_given_row) == seats_per_row:
-            first_row_filled = False
+        # Split the seat id into its row and seat offset
+        row_offset, seat_offset = divmod(starting_seat, seats_per_row)
         
         # Only for the first row, fill up empty seats in the same row all the way to the right
-        # Loop until we fill up the row towards the right
-        for i in range(seat_count):
-            
-            # Break out of loop if we have filled up the first row
-            if first_row_filled == True:
-                # print(f"First row filled. Moving to next row...")
-                break
-            
-            while True:
-            
-                seat_number = i + seat_offset
-                # Determine row (last row of a 0-based index, moving down by number of rows based on number of seats per row)
-                row_index = (seat_number // seats_per_row)
-                seat_row = chr(ord('A') + row_offset + row_index)
+        row_start = row_offset * seats_per_row
+        row_states = seat_map.row(row_offset)
+        column = row_states.find(FREE, seat_offset)
+        while column != -1 and len(selected_seats) < seat_count:
+            selected_seats.append(row_start + column)
+            column = row_states.find(FREE, column + 1)
                 
-                # Determine seat number (left-most starting from 1-based index)
-                seat = (seat_number % seats_per_row) + 1
-                # Prepare to break out of main loop when eaching end of the row  
-                if seat == seats_per_row:
-                    first_row_filled = True
-                
-                # Check if seat is available
-                seat_str = f"{seat_row}{seat}"
-                if not self.is_seat_booked(seat_str):
-                    # print(f"Seat {seat_str} is available, adding to selection.")
-                    selected_seats.append(seat_str)
-                    break
-                
-        # For subsequent rows, fill from the center first, then move outwards
-        next_row = chr(ord(row_input) + 1)
-        # print(f"next_row: {next_row}")
-        remaining_selected_seats: List[str] = self.select_seats_from_center(seat_count - len(selected_seats), next_row)
+        # For subsequent rows, fill from the center first, then move outwards (never re-picking the first row's seats)
+        remaining_selected_seats: List[int] = self.select_seats_from_center(seat_count - len(selected_seats), row_offset + 1, set(selected_seats), seat_map)
         selected_seats.extend(remaining_selected_seats)
         
         return selected_seats
     
+    @metrics.timed("booking_batch_seconds")
+    def book_many(self, requests: Iterable[BookingRequest]) -> BatchBookingResult:
+        # Allocate the whole batch against a private snapshot of the seat map, so each request sees the seats taken
+        # by the requests before it without touching the live screening until the batch is committed
+        seat_config = self.screening.seat_config
+        seat_map = self.screening.read_consistent(lambda: self.screening.seat_map.copy())
+        result = BatchBookingResult()
+        bookings: List[Booking] = []
+        
+        for index, request in enumerate(requests):
+            if request.seat_count <= 0:
+                result.add_failure(index, request, "Seat count must be a positive integer.")
+                continue
+            if request.seat_count > seat_map.free_count:
+                result.add_failure(index, request, f"Only {seat_map.free_count} seats available.")
+                continue
+            if request.starting_seat is None:
+                selected_seats = self.select_seats_from_center(request.seat_count, None, seat_map=seat_map)
+            elif not 0 <= request.starting_seat < seat_config.total_seats or not seat_map.is_free(request.starting_seat):
+                result.add_failure(index, request, "Starting seat is not available.")
+                continue
+            else:
+                selected_seats = self.determine_seats_from_user_selection(request.seat_count, request.starting_seat, seat_map)
+            
+            seat_map.set_states(selected_seats, BOOKED)
+            booking = Booking(self.id_generator.next_id(), selected_seats)
+            if self.journal is not None:
+                self.journal.record_booking_created(booking)
+            bookings.append(booking)
+            result.add_booking(booking)
+        
+        # Commit every successful allocation in one step; the screening rejects the batch as a whole if any seat was taken meanwhile
+        self.screening.add_bookings(bookings)
+        self._persist_bookings(bookings)
+        return result
+    
+    @metrics.timed("booking_reserve_seconds")
+    def reserve(self, seat_count: int, starting_seat: Optional[int] = None, max_attempts: int = 10) -> Booking:
+        # Optimistic reservation for concurrent sellers: plan without holding any lock, then commit with a
+        # seat-level compare-and-set. If another seller took any of the planned seats first, re-plan and retry.
+        booking = self.new_booking()
+        for _ in range(max_attempts):
+            booking.seats = self.plan_seats(seat_count, starting_seat)
+            try:
+                self.save_booking(booking)
+                return booking
+            except SeatConflictError:
+                metrics.increment("seat_conflicts_total")
+                continue
+        raise SeatConflictError(self.screening.seat_config.seat_labels(booking.seats))
+    
+    @metrics.timed("booking_hold_seconds")
+    def hold(self, booking: Booking, seat_count: int, starting_seat: Optional[int] = None, max_attempts: int = 10) -> None:
+        # Same optimistic planning as reserve, but the seats are only held for the booking until save_booking confirms them.
+        # The booking's currently held seats count as free to the plan, and its hold is only replaced once the new seats
+        # are held, so a selection that no longer fits or keeps conflicting leaves the previous hold in place.
+        conflict = SeatConflictError([])
+        for _ in range(max_attempts):
+            selected_seats = self.plan_seats(seat_count, starting_seat, booking.id)
+            try:
+                self.hold_seats(booking, selected_seats)
+                return
+            except SeatConflictError as error:
+                metrics.increment("seat_conflicts_total")
+                conflict = error
+        raise conflict
+    
+    def hold_seats(self, booking: Booking, seats: List[int]) -> None:
+        # Hold the previewed seats for the booking (replacing its previous hold) until it is confirmed, cancelled or times out
+        self.screening.hold_seats(booking.id, seats, self.hold_ttl)
+        booking.seats = seats
+    
+    def release_hold(self, booking: Booking) -> None:
+        self.screening.release_hold(booking.id)
+    
     def new_booking(self) -> Booking:
-        new_id = "GIC" + str(len(self.screening.booking_data) + 1).zfill(4) # should be date + uuid in practice
-        # TODO: Update backend and/or perform database transactions for seat reservations here
-        new_booking = Booking(new_id, [])
+        new_booking = Booking(self.id_generator.next_id(), [])
+        if self.journal is not None:
+            self.journal.record_booking_created(new_booking)
         return new_booking
     
+    @metrics.timed("booking_confirm_seconds")
     def save_booking(self, booking: Booking) -> None:
-        # TODO: Update backend and/or perform database transactions for booking confirmations here
-        # print(booking)
-        return None
\ No newline at end of file
+        # Register the booking with the screening so its seat occupancy index stays up to date
+        self.screening.add_booking(booking)
+        self._persist_bookings([booking])
+        return None
+    
+    @metrics.timed("booking_cancel_seconds")
+    def cancel_booking(self, booking: Booking) -> None:
+        # Remove the booking from the backend first, so a failed delete leaves its seats booked in memory as well
+        if self.repository is not None:
+            self.repository.delete_booking(self.screening, booking)
+        self.screening.remove_booking(booking)
+        if self.journal is not None:
+            self.journal.record_booking_cancelled(booking)
+            self.journal.commit()
+        metrics.increment("bookings_cancelled_total")
+    
+    @metrics.timed("seat_allocation_seconds")
+    def plan_seats(self, seat_count: int, starting_seat: Optional[int], hold_id: Optional[str] = None) -> List[int]:
+        # With a hold id, the seats held under it are planned as free (on a private copy of the seat map), as when
+        # a pending booking changes its selection
+        seat_map = None
+        if hold_id is not None:
+            seat_map = self.screening.read_consistent(lambda: self._seat_map_without_hold(hold_id))
+        if starting_seat is None:
+            selected_seats = self.select_seats_from_center(seat_count, None, None, seat_map)
+        else:
+            selected_seats = self.determine_seats_from_user_selection(seat_count, starting_seat, seat_map)
+        if len(selected_seats) < seat_count:
+            raise ValueError(f"Sorry, there are only {len(selected_seats)} seats available.")
+        return selected_seats
+    
+    def _seat_map_without_hold(self, hold_id: str) -> Optional[SeatMap]:
+        held_seats = self.screening.held_seats(hold_id)
+        if not held_seats:
+            return None
+        seat_map = self.screening.seat_map.copy()
+        seat_map.set_states(held_seats, FREE)
+        return seat_map
+    
+    def _persist_bookings(self, bookings: List[Booking]) -> None:
+        # Write the confirmed bookings to the backend in one transaction, undoing the in-memory booking if it is rejected
+        if not bookings:
+            return
+        if self.repository is not None:
+            try:
+                self.repository.save_bookings(self.screening, bookings)
+            except Exception:
+                for booking in bookings:
+                    self.screening.remove_booking(booking)
+                raise
+        # Journal the confirmations and wait for a single (group) fsync covering all of them
+        if self.journal is not None:
+            for booking in bookings:
+                self.journal.record_seats_confirmed(booking)
+            self.journal.commit()
+        metrics.increment("bookings_confirmed_total", len(bookings))
+        metrics.increment("seats_booked_total", sum(len(booking.seats) for booking in bookings))
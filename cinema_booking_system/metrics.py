@@ -0,0 +1,170 @@
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds of the histogram buckets: latencies in seconds, and small counts such as rows probed per allocation
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+EXPORT_FORMATS = ("prometheus", "jsonl")
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket; they are made cumulative when exported
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        total, counts = 0, []
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+class MetricsRegistry:
+    # Counters and histograms by metric name, created on first use. Updates take a lock, as bookings are
+    # made from the booking service's worker threads as well as the main thread.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "time": time.time(),
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: {
+                        "buckets": list(histogram.buckets),
+                        "counts": histogram.cumulative_counts(),
+                        "sum": histogram.sum,
+                        "count": histogram.count,
+                    }
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+    def prometheus_text(self) -> str:
+        # Prometheus text exposition format, as read by the node exporter's textfile collector
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+        for name, histogram in sorted(snapshot["histograms"].items()):
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in zip(histogram["buckets"] + ["+Inf"], histogram["counts"]):
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{name}_sum {histogram['sum']}")
+            lines.append(f"{name}_count {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str, format: str = "prometheus") -> None:
+        if format == "prometheus":
+            # Replace the file in one step, so a scraper never reads a half-written file
+            temporary_path = f"{path}.tmp"
+            with open(temporary_path, "w") as file:
+                file.write(self.prometheus_text())
+            os.replace(temporary_path, path)
+        elif format == "jsonl":
+            # One snapshot per line, appended on every export
+            with open(path, "a") as file:
+                file.write(json.dumps(self.snapshot()) + "\n")
+        else:
+            raise ValueError(f"Unknown metrics format: {format}")
+
+class MetricsExporter:
+    # Exports a registry to disk every `interval` seconds from a daemon thread, and once more when stopped
+    def __init__(self, registry: MetricsRegistry, path: str, format: str = "prometheus", interval: float = 15.0):
+        self.registry = registry
+        self.path = path
+        self.format = format
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.registry.export(self.path, self.format)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.registry.export(self.path, self.format)
+
+# The registry recording the process's metrics, or None while metrics are disabled (the default). Every
+# instrumented call checks it first, so disabled metrics cost one global lookup per call.
+registry: Optional[MetricsRegistry] = None
+
+def enable(metrics_registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    global registry
+    registry = metrics_registry if metrics_registry is not None else MetricsRegistry()
+    return registry
+
+def disable() -> None:
+    global registry
+    registry = None
+
+def increment(name: str, amount: float = 1) -> None:
+    if registry is not None:
+        registry.increment(name, amount)
+
+def observe(name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+    if registry is not None:
+        registry.observe(name, value, buckets)
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    # Records how long the block took in the `name` histogram, in seconds
+    if registry is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started)
+
+def timed(name: str) -> Callable:
+    # Decorator recording each call's duration in the `name` histogram, in seconds
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            current_registry = registry
+            if current_registry is None:
+                return function(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                current_registry.observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorator
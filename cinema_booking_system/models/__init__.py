@@ -1,4 +1,7 @@
 from .booking import Booking
+from .booking_request import BookingRequest, BookingFailure, BatchBookingResult
+from .cinema import Cinema
 from .movie import Movie
-from .screening import Screening
+from .screening import Screening, SeatConflictError
+from .seat_map import SeatMap
 from .seating_config import SeatingConfig
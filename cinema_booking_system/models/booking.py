@@ -1,7 +1,15 @@
-from typing import List
+from array import array
+from typing import Iterable
+
+# Seat ids fit in unsigned shorts for halls of up to 65,536 seats; larger halls fall back to unsigned ints
+COMPACT_SEAT_TYPECODE = 'H'
+SEAT_TYPECODE = 'I'
 
 class Booking:
-    def __init__(self, id: str, seats: List[str]):
+    # Slotted, so a booking carries no per-instance __dict__ (there can be millions of them in memory)
+    __slots__ = ("_id", "_seats")
+    
+    def __init__(self, id: str, seats: Iterable[int]):
         self.id = id
         self.seats = seats
 
@@ -14,12 +22,18 @@ class Booking:
         self._id = value
         
     @property
-    def seats(self) -> List[str]:
+    def seats(self) -> array:
         return self._seats
     
     @seats.setter
     def seats(self, value):
-        self._seats = value
+        # Seat ids are stored as a packed array of unsigned shorts (or ints) rather than a list of label strings
+        if not isinstance(value, (list, array, range)):
+            value = list(value)
+        try:
+            self._seats = array(COMPACT_SEAT_TYPECODE, value)
+        except OverflowError:
+            self._seats = array(SEAT_TYPECODE, value)
         
     def __str__(self):
-        return f"Booking ID: {self.id}, Seats: {self.seats}"
\ No newline at end of file
+        return f"Booking ID: {self.id}, Seats: {self.seats.tolist()}"
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+BOOKING_ID_PREFIX = "GIC"
+
+# Snowflake-style layout of the 63-bit id: milliseconds since EPOCH_MS | worker id | per-millisecond sequence
+EPOCH_MS = 1735689600000  # 2025-01-01T00:00:00Z
+WORKER_ID_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# Worker ids are split in two ranges: one for standalone processes (run.py --worker-id, or derived from the process
+# id) and one reserved for ScreeningRouter shards, so a shard never shares a worker id with a process beside it
+PROCESS_WORKER_IDS = range(0, 512)
+SHARD_WORKER_IDS = range(512, MAX_WORKER_ID + 1)
+
+# Fixed-width base 36 keeps the ids short and makes string order match generation order
+ID_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ID_WIDTH = 13  # 36 ** 13 > 2 ** 63
+
+class BookingIdGenerator:
+    def __init__(self, worker_id: Optional[int] = None, clock: Callable[[], float] = time.time):
+        # Ids are unique across processes only if each process generating ids has its own worker id. Without one,
+        # the process id modulo 512 is used (within PROCESS_WORKER_IDS), which two processes can share, so
+        # processes writing to the same database should each be given a worker id explicitly
+        self._lock = threading.Lock()
+        self._worker_id_from_pid = worker_id is None
+        self.worker_id = _worker_id_from_pid() if worker_id is None else _checked_worker_id(worker_id)
+        self.clock = clock
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    def set_worker_id(self, worker_id: int) -> None:
+        with self._lock:
+            self.worker_id = _checked_worker_id(worker_id)
+            self._worker_id_from_pid = False
+
+    def next_id(self) -> str:
+        with self._lock:
+            timestamp = int(self.clock() * 1000) - EPOCH_MS
+            if timestamp > self._last_timestamp:
+                self._last_timestamp = timestamp
+                self._sequence = 0
+            else:
+                # Same millisecond, or the clock went backwards: keep counting from the last timestamp so ids never
+                # repeat or go backwards, borrowing the next millisecond once its sequence numbers run out
+                self._sequence += 1
+                if self._sequence > MAX_SEQUENCE:
+                    self._last_timestamp += 1
+                    self._sequence = 0
+            value = (self._last_timestamp << (WORKER_ID_BITS + SEQUENCE_BITS)) | (self.worker_id << SEQUENCE_BITS) | self._sequence
+        return BOOKING_ID_PREFIX + encode_id(value)
+
+    def _after_fork(self) -> None:
+        # A forked child must not keep generating ids under its parent's worker id
+        self._lock = threading.Lock()
+        if self._worker_id_from_pid:
+            self.worker_id = _worker_id_from_pid()
+
+def _worker_id_from_pid() -> int:
+    return PROCESS_WORKER_IDS[os.getpid() % len(PROCESS_WORKER_IDS)]
+
+def _checked_worker_id(worker_id: int) -> int:
+    if not 0 <= worker_id <= MAX_WORKER_ID:
+        raise ValueError(f"Worker id must be between 0 and {MAX_WORKER_ID}: {worker_id}")
+    return worker_id
+
+def encode_id(value: int) -> str:
+    digits = []
+    while value:
+        value, digit = divmod(value, 36)
+        digits.append(ID_DIGITS[digit])
+    return "".join(reversed(digits)).rjust(ID_WIDTH, "0")
+
+# Shared by every BookingController in the process, so ids stay unique however many controllers a screening has;
+# run.py --worker-id sets its worker id
+booking_ids = BookingIdGenerator()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=booking_ids._after_fork)
@@ -0,0 +1,59 @@
+from typing import List, Optional
+from cinema_booking_system.models.booking import Booking
+
+class BookingRequest:
+    __slots__ = ("_seat_count", "_starting_seat")
+    
+    def __init__(self, seat_count: int, starting_seat: Optional[int] = None):
+        self.seat_count = seat_count
+        self.starting_seat = starting_seat
+
+    @property
+    def seat_count(self) -> int:
+        return self._seat_count
+    
+    @seat_count.setter
+    def seat_count(self, value):
+        self._seat_count = value
+    
+    @property
+    def starting_seat(self) -> Optional[int]:
+        return self._starting_seat
+    
+    @starting_seat.setter
+    def starting_seat(self, value):
+        self._starting_seat = value
+    
+    def __str__(self):
+        return f"Booking Request: {self.seat_count} seats, Starting seat: {self.starting_seat}"
+
+class BookingFailure:
+    __slots__ = ("index", "request", "reason")
+    
+    def __init__(self, index: int, request: BookingRequest, reason: str):
+        self.index = index
+        self.request = request
+        self.reason = reason
+    
+    def __str__(self):
+        return f"Booking Request #{self.index} failed: {self.reason}"
+
+class BatchBookingResult:
+    def __init__(self):
+        # One entry per request, in request order: the Booking made for it, or None if it failed
+        self.results: List[Optional[Booking]] = []
+        self.failures: List[BookingFailure] = []
+    
+    @property
+    def bookings(self) -> List[Booking]:
+        return [booking for booking in self.results if booking is not None]
+    
+    def add_booking(self, booking: Booking) -> None:
+        self.results.append(booking)
+    
+    def add_failure(self, index: int, request: BookingRequest, reason: str) -> None:
+        self.results.append(None)
+        self.failures.append(BookingFailure(index, request, reason))
+    
+    def __str__(self):
+        return f"Batch Booking Result: {len(self.results) - len(self.failures)} booked, {len(self.failures)} failed"
@@ -0,0 +1,234 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from cinema_booking_system.models.screening import Screening
+
+class StartTimeIndex:
+    # Screenings kept sorted by start time (parallel lists, so bisect works on the plain datetimes), with a max segment
+    # tree over the same positions of each screening's unbooked seats (free or held), so the next screening that could
+    # fit a party is found in O(log screenings) rather than by walking the sold-out ones
+    def __init__(self):
+        self._start_times: List[datetime] = []
+        self._screenings: List[Screening] = []
+        # The tree is rebuilt on the first search after screenings are added or removed, and kept up to date from the
+        # screenings' change notifications in between; _lock serialises those writers
+        self._lock = threading.Lock()
+        self._size = 0
+        self._tree: List[int] = []
+        self._tree_stale = True
+
+    def __len__(self) -> int:
+        return len(self._screenings)
+
+    def add(self, screening: Screening) -> None:
+        with self._lock:
+            position = bisect_right(self._start_times, screening.start_time)
+            self._start_times.insert(position, screening.start_time)
+            self._screenings.insert(position, screening)
+            self._tree_stale = True
+
+    def remove(self, screening: Screening) -> None:
+        with self._lock:
+            position = self._position(screening)
+            del self._start_times[position]
+            del self._screenings[position]
+            self._tree_stale = True
+
+    def between(self, start: datetime, end: datetime) -> List[Screening]:
+        # Screenings starting in [start, end)
+        return self._screenings[bisect_left(self._start_times, start):bisect_left(self._start_times, end)]
+
+    def starting_from(self, start: datetime, seat_count: int = 0) -> Iterable[Screening]:
+        # Screenings starting at or after `start`, skipping those with fewer than `seat_count` unbooked seats
+        if seat_count <= 0:
+            for position in range(bisect_left(self._start_times, start), len(self._screenings)):
+                yield self._screenings[position]
+            return
+        if self._tree_stale:
+            self._rebuild_tree()
+        position = self._first_at_least(1, 0, self._size, bisect_left(self._start_times, start), seat_count)
+        while position is not None and position < len(self._screenings):
+            yield self._screenings[position]
+            position = self._first_at_least(1, 0, self._size, position + 1, seat_count)
+
+    def all(self) -> List[Screening]:
+        return list(self._screenings)
+
+    def update(self, screening: Screening) -> None:
+        # The screening's seats changed
+        with self._lock:
+            if self._tree_stale:
+                return
+            node = self._size + self._position(screening)
+            self._tree[node] = _unbooked_seats(screening)
+            node //= 2
+            while node:
+                self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+                node //= 2
+
+    def _position(self, screening: Screening) -> int:
+        # Only the screenings sharing its start time are compared
+        position = bisect_left(self._start_times, screening.start_time)
+        while self._screenings[position] is not screening:
+            position += 1
+        return position
+
+    def _rebuild_tree(self) -> None:
+        with self._lock:
+            size = 1
+            while size < len(self._screenings):
+                size *= 2
+            tree = [0] * (2 * size)
+            tree[size:size + len(self._screenings)] = [_unbooked_seats(screening) for screening in self._screenings]
+            for node in range(size - 1, 0, -1):
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            self._size, self._tree, self._tree_stale = size, tree, False
+
+    def _first_at_least(self, node: int, node_low: int, node_high: int, low: int, seat_count: int) -> Optional[int]:
+        # Leftmost position at or after `low` with at least `seat_count` unbooked seats
+        if node_high <= low or self._tree[node] < seat_count:
+            return None
+        if node_high - node_low == 1:
+            return node_low
+        middle = (node_low + node_high) // 2
+        position = self._first_at_least(2 * node, node_low, middle, low, seat_count)
+        if position is None:
+            position = self._first_at_least(2 * node + 1, middle, node_high, low, seat_count)
+        return position
+
+def _unbooked_seats(screening: Screening) -> int:
+    # An upper bound on the seats a party could get: held seats may still be released or expire
+    return screening.seats_free + screening.seats_held
+
+class AvailabilitySummary:
+    # What a listing shows about a screening, as of one version of its seat map
+    __slots__ = ("version", "seats_free", "largest_free_block")
+
+    def __init__(self, version: int, seats_free: int, largest_free_block: int):
+        self.version = version
+        self.seats_free = seats_free
+        self.largest_free_block = largest_free_block
+
+    @property
+    def sold_out(self) -> bool:
+        return self.seats_free == 0
+
+    def __str__(self):
+        return f"Availability: {self.seats_free} seats free, largest block {self.largest_free_block} (version {self.version})"
+
+class AvailabilityCache:
+    # Availability summaries by screening, each kept until the screening's version moves on. A commit, hold or release
+    # bumps the version, so a stale summary is recomputed (from the seat map's counters) the next time it is read.
+    def __init__(self):
+        self._summaries: Dict[Screening, AvailabilitySummary] = {}
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def summary(self, screening: Screening) -> AvailabilitySummary:
+        # Expired holds are released first, so their seats count as free again
+        screening.expire_holds()
+        summary = self._summaries.get(screening)
+        if summary is None or summary.version != screening.version:
+            summary = screening.read_consistent(lambda: AvailabilitySummary(screening.version, screening.seats_free, screening.largest_free_block))
+            self._summaries[screening] = summary
+        return summary
+
+    def discard(self, screening: Screening) -> None:
+        self._summaries.pop(screening, None)
+
+class Cinema:
+    # Catalog of the screenings across every hall, indexed by start time overall, per movie title and per hall
+    def __init__(self, screenings: Iterable[Screening] = ()):
+        self._by_start_time = StartTimeIndex()
+        self._by_movie: Dict[str, StartTimeIndex] = {}
+        self._by_hall: Dict[str, StartTimeIndex] = {}
+        self._by_movie_and_hall: Dict[Tuple[str, str], StartTimeIndex] = {}
+        self._by_id: Dict[int, Screening] = {}
+        self._availability = AvailabilityCache()
+        for screening in screenings:
+            self.add_screening(screening)
+
+    def __len__(self) -> int:
+        return len(self._by_start_time)
+
+    @property
+    def screenings(self) -> List[Screening]:
+        # Every screening, in start time order
+        return self._by_start_time.all()
+
+    @property
+    def movies(self) -> List[str]:
+        return sorted(self._by_movie)
+
+    @property
+    def halls(self) -> List[str]:
+        return sorted(self._by_hall)
+
+    def add_screening(self, screening: Screening) -> None:
+        self._by_start_time.add(screening)
+        for indexes, key in self._keys(screening):
+            indexes.setdefault(key, StartTimeIndex()).add(screening)
+        if screening.id is not None:
+            self._by_id[screening.id] = screening
+        screening.add_listener(self._screening_changed)
+
+    def remove_screening(self, screening: Screening) -> None:
+        screening.remove_listener(self._screening_changed)
+        self._by_start_time.remove(screening)
+        for indexes, key in self._keys(screening):
+            indexes[key].remove(screening)
+            if not len(indexes[key]):
+                del indexes[key]
+        self._by_id.pop(screening.id, None)
+        self._availability.discard(screening)
+
+    def find_screening(self, screening_id: int) -> Optional[Screening]:
+        return self._by_id.get(screening_id)
+
+    def availability(self, screening: Screening) -> AvailabilitySummary:
+        return self._availability.summary(screening)
+
+    def screenings_between(self, start: datetime, end: datetime, movie: Optional[str] = None, hall: Optional[str] = None) -> List[Screening]:
+        # Screenings starting in [start, end), optionally only those of one movie and/or in one hall
+        index = self._index_for(movie, hall)
+        if index is None:
+            return []
+        return index.between(start, end)
+
+    def next_screening_with_seats(self, seat_count: int, after: datetime, movie: Optional[str] = None, hall: Optional[str] = None) -> Optional[Screening]:
+        # First screening starting at or after `after` with at least `seat_count` free seats. The index's segment tree
+        # skips the screenings that cannot fit the party; a candidate only falls short when held seats count towards
+        # it, so its cached availability summary (which releases expired holds) has the final say.
+        index = self._index_for(movie, hall)
+        if index is None:
+            return None
+        for screening in index.starting_from(after, seat_count):
+            if self._availability.summary(screening).seats_free >= seat_count:
+                return screening
+        return None
+
+    def _keys(self, screening: Screening) -> List[tuple]:
+        return [
+            (self._by_movie, screening.movie.title),
+            (self._by_hall, screening.hall),
+            (self._by_movie_and_hall, (screening.movie.title, screening.hall)),
+        ]
+
+    def _screening_changed(self, screening: Screening) -> None:
+        # Change notification from a screening in the catalog, on the thread that changed it
+        self._by_start_time.update(screening)
+        for indexes, key in self._keys(screening):
+            index = indexes.get(key)
+            if index is not None:
+                index.update(screening)
+
+    def _index_for(self, movie: Optional[str], hall: Optional[str]) -> Optional[StartTimeIndex]:
+        if movie is not None and hall is not None:
+            return self._by_movie_and_hall.get((movie, hall))
+        if movie is not None:
+            return self._by_movie.get(movie)
+        if hall is not None:
+            return self._by_hall.get(hall)
+        return self._by_start_time
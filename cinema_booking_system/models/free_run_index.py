@@ -0,0 +1,212 @@
+from array import array
+from bisect import bisect_right
+from typing import List, Optional
+
+# Rows split into more free runs than this get a segment tree over their run lengths, so finding the fitting run
+# nearest the center stays O(log seats) however fragmented the row is; less fragmented rows just walk their runs
+RUN_TREE_THRESHOLD = 8
+
+class FreeRunIndex:
+    def __init__(self, row_count: int, seat_count_per_row: int):
+        self.row_count = row_count
+        self.seat_count_per_row = seat_count_per_row
+        # Per row, maximal runs of free seats as parallel sorted lists of [start, end) columns
+        self._starts: List[List[int]] = [[0] if seat_count_per_row > 0 else [] for _ in range(row_count)]
+        self._ends: List[List[int]] = [[seat_count_per_row] if seat_count_per_row > 0 else [] for _ in range(row_count)]
+        # Max segment tree over rows of the largest free run, so "which row can fit N seats" is answered in O(log rows)
+        self._size = 1
+        while self._size < max(row_count, 1):
+            self._size *= 2
+        self._tree = [0] * (2 * self._size)
+        # Per fragmented row, a max segment tree over columns holding the length of the free run starting at each column
+        self._run_trees: List[Optional[array]] = [None] * row_count
+        for row in range(row_count):
+            self._tree[self._size + row] = seat_count_per_row
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def largest_run(self, row: Optional[int] = None) -> int:
+        # Without a row, the largest free run anywhere in the hall (the root of the segment tree)
+        return self._tree[1] if row is None else self._tree[self._size + row]
+
+    def runs(self, row: int) -> List[tuple]:
+        return list(zip(self._starts[row], self._ends[row]))
+
+    def occupy(self, row: int, column: int) -> None:
+        starts, ends = self._starts[row], self._ends[row]
+        i = bisect_right(starts, column) - 1
+        if i < 0 or column >= ends[i]:
+            return  # Seat is already occupied
+        start, end = starts[i], ends[i]
+        # Split the run around the occupied seat, dropping empty halves
+        del starts[i], ends[i]
+        if column + 1 < end:
+            starts.insert(i, column + 1)
+            ends.insert(i, end)
+        if start < column:
+            starts.insert(i, start)
+            ends.insert(i, column)
+        run_tree = self._run_trees[row]
+        if run_tree is not None:
+            _set_leaf(run_tree, start, column - start)
+            if column + 1 < end:
+                _set_leaf(run_tree, column + 1, end - column - 1)
+        self._update_row(row)
+
+    def release(self, row: int, column: int) -> None:
+        starts, ends = self._starts[row], self._ends[row]
+        i = bisect_right(starts, column) - 1
+        if i >= 0 and column < ends[i]:
+            return  # Seat is already free
+        # Merge with the run ending just before and/or the run starting just after the released seat
+        merge_left = i >= 0 and ends[i] == column
+        merge_right = i + 1 < len(starts) and starts[i + 1] == column + 1
+        if merge_left and merge_right:
+            ends[i] = ends[i + 1]
+            del starts[i + 1], ends[i + 1]
+        elif merge_left:
+            ends[i] = column + 1
+        elif merge_right:
+            starts[i + 1] = column
+            i += 1
+        else:
+            starts.insert(i + 1, column)
+            ends.insert(i + 1, column + 1)
+            i += 1
+        run_tree = self._run_trees[row]
+        if run_tree is not None:
+            if merge_right:
+                _set_leaf(run_tree, column + 1, 0)
+            _set_leaf(run_tree, starts[i], ends[i] - starts[i])
+        self._update_row(row)
+
+    def reset_row(self, row: int, occupied: bytes) -> None:
+        # Rebuild a row's runs from a byte per seat that is 0 for free seats and 1 for occupied ones,
+        # for bulk changes where applying them seat by seat would be slower
+        starts, ends = [], []
+        start = occupied.find(0)
+        while start != -1:
+            end = occupied.find(1, start)
+            if end == -1:
+                end = len(occupied)
+            starts.append(start)
+            ends.append(end)
+            start = occupied.find(0, end)
+        self._starts[row], self._ends[row] = starts, ends
+        self._run_trees[row] = None
+        self._update_row(row)
+
+    def find_row(self, length: int, starting_row: int = 0) -> Optional[int]:
+        # First row at or after starting_row (wrapping around) with a free run of at least `length` seats
+        if length <= 0 or self._tree[1] < length:
+            return None
+        row = _first_at_least(self._tree, 1, 0, self._size, starting_row, length)
+        if row is None or row >= self.row_count:
+            row = _first_at_least(self._tree, 1, 0, self._size, 0, length)
+        return row
+
+    def closest_block_to_center(self, row: int, length: int) -> Optional[int]:
+        # Returns the starting column of the block of `length` free seats closest to the center of the row.
+        # Blocks are ranked like the center-out seat order: the ideal block is centered a quarter seat to the
+        # right of column seat_count_per_row // 2, which keeps ties on the same side as the default selection.
+        if length <= 0 or self.largest_run(row) < length:
+            return None
+        starts, ends = self._starts[row], self._ends[row]
+        target = 4 * (self.seat_count_per_row // 2) + 1
+        ideal_start = (target - 2 * (length - 1)) // 4
+
+        def best_in_run(run_start: int, run_end: int) -> Optional[int]:
+            if run_end - run_start < length:
+                return None
+            low, high = run_start, run_end - length
+            candidates = [min(max(start, low), high) for start in (ideal_start, ideal_start + 1)]
+            return min(candidates, key=lambda start: abs(2 * (2 * start + length - 1) - target))
+
+        # Runs left of the ideal start only get farther away the further left they are (and vice versa),
+        # so only the nearest fitting run starting at or before the ideal start and the nearest one after it count
+        run_tree = self._run_trees[row]
+        if run_tree is not None:
+            size = len(run_tree) // 2
+            runs = [_last_at_least(run_tree, 1, 0, size, ideal_start, length), _first_at_least(run_tree, 1, 0, size, ideal_start + 1, length)]
+            candidates = [best_in_run(start, start + run_tree[size + start]) for start in runs if start is not None]
+        else:
+            i = bisect_right(starts, ideal_start) - 1
+            candidates = []
+            for step, stop in ((-1, -1), (1, len(starts))):
+                j = i if step < 0 else i + 1
+                while j != stop:
+                    best = best_in_run(starts[j], ends[j])
+                    if best is not None:
+                        candidates.append(best)
+                        break
+                    j += step
+        candidates = [start for start in candidates if start is not None]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda start: abs(2 * (2 * start + length - 1) - target))
+
+    def copy(self) -> "FreeRunIndex":
+        index = FreeRunIndex.__new__(FreeRunIndex)
+        index.row_count = self.row_count
+        index.seat_count_per_row = self.seat_count_per_row
+        index._starts = [list(starts) for starts in self._starts]
+        index._ends = [list(ends) for ends in self._ends]
+        index._size = self._size
+        index._tree = list(self._tree)
+        index._run_trees = [None if run_tree is None else array(run_tree.typecode, run_tree) for run_tree in self._run_trees]
+        return index
+
+    def _update_row(self, row: int) -> None:
+        starts, ends = self._starts[row], self._ends[row]
+        run_tree = self._run_trees[row]
+        if run_tree is None and len(starts) > RUN_TREE_THRESHOLD:
+            run_tree = self._run_trees[row] = self._build_run_tree(starts, ends)
+        node = self._size + row
+        self._tree[node] = run_tree[1] if run_tree is not None else max((end - start for start, end in zip(starts, ends)), default=0)
+        node //= 2
+        while node:
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
+
+    def _build_run_tree(self, starts: List[int], ends: List[int]) -> array:
+        size = 1
+        while size < self.seat_count_per_row:
+            size *= 2
+        run_tree = array('H' if self.seat_count_per_row < 1 << 16 else 'I', [0]) * (2 * size)
+        for start, end in zip(starts, ends):
+            run_tree[size + start] = end - start
+        for node in range(size - 1, 0, -1):
+            run_tree[node] = max(run_tree[2 * node], run_tree[2 * node + 1])
+        return run_tree
+
+def _set_leaf(tree, position: int, value: int) -> None:
+    node = len(tree) // 2 + position
+    tree[node] = value
+    node //= 2
+    while node:
+        tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        node //= 2
+
+def _first_at_least(tree, node: int, node_low: int, node_high: int, low: int, length: int) -> Optional[int]:
+    # Leftmost leaf at or after `low` whose value is at least `length`
+    if node_high <= low or tree[node] < length:
+        return None
+    if node_high - node_low == 1:
+        return node_low
+    middle = (node_low + node_high) // 2
+    position = _first_at_least(tree, 2 * node, node_low, middle, low, length)
+    if position is None:
+        position = _first_at_least(tree, 2 * node + 1, middle, node_high, low, length)
+    return position
+
+def _last_at_least(tree, node: int, node_low: int, node_high: int, high: int, length: int) -> Optional[int]:
+    # Rightmost leaf at or before `high` whose value is at least `length`
+    if node_low > high or tree[node] < length:
+        return None
+    if node_high - node_low == 1:
+        return node_low
+    middle = (node_low + node_high) // 2
+    position = _last_at_least(tree, 2 * node + 1, middle, node_high, high, length)
+    if position is None:
+        position = _last_at_least(tree, 2 * node, node_low, middle, high, length)
+    return position
@@ -1,4 +1,6 @@
 class Movie:
+    __slots__ = ("_title",)
+    
     def __init__(self, title):
         self.title = title
         # self.duration = duration
@@ -1,16 +1,66 @@
+import threading
+import time
+from itertools import islice
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 from cinema_booking_system.models.movie import Movie
 from cinema_booking_system.models.seating_config import SeatingConfig
 from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.seat_map import SeatMap, FREE, HELD, BOOKED
+from cinema_booking_system.models.timing_wheel import TimingWheel
+
+T = TypeVar("T")
+
+DEFAULT_HALL = "1"
+
+class SeatConflictError(ValueError):
+    def __init__(self, seats: List[str]):
+        super().__init__(f"Seats are no longer available: {seats}")
+        self.seats = seats
 
 class Screening:
-    def __init__(self, start_time: datetime, seat_config: SeatingConfig, movie: Movie, booking_data: List[Booking]):
+    __slots__ = (
+        "_lock", "_write_sequence", "_holds", "_seat_holds", "_hold_expiry", "_bookings_by_id",
+        "_id", "_hall", "_start_time", "_seat_config", "_movie", "_seat_map", "_listeners",
+    )
+    
+    def __init__(self, start_time: datetime, seat_config: SeatingConfig, movie: Movie, booking_data: List[Booking], id: Optional[int] = None, hall: str = DEFAULT_HALL):
+        # Writers serialise on _lock and bump _write_sequence before and after each change (odd while a change is
+        # in progress), so readers can plan against the live seat map without locking and detect a concurrent write
+        self._lock = threading.Lock()
+        self._write_sequence = 0
+        # Seats held for bookings that are not confirmed yet, by hold id and by seat, expired through a timing wheel
+        self._holds: Dict[str, List[int]] = {}
+        self._seat_holds: Dict[int, str] = {}
+        self._hold_expiry = TimingWheel()
+        # The bookings by id, in the order they were made, so looking one up or cancelling it does not scan them all
+        self._bookings_by_id: Dict[str, Booking] = {}
+        # Called with the screening after each change to its seats (a tuple, so screenings without any cost nothing)
+        self._listeners: tuple = ()
+        self.id = id
+        self.hall = hall
         self.start_time = start_time
         self.seat_config = seat_config
         self.movie = movie
         self.booking_data = booking_data if booking_data is not None else []
 
+    @property
+    def id(self) -> Optional[int]:
+        return self._id
+    
+    @id.setter
+    def id(self, value):
+        self._id = value
+    
+    @property
+    def hall(self) -> str:
+        return self._hall
+    
+    @hall.setter
+    def hall(self, value):
+        self._hall = value
+    
     @property
     def start_time(self) -> datetime:
         return self._start_time
@@ -37,11 +87,185 @@ class Screening:
     
     @property
     def booking_data(self) -> List[Booking]:
-        return self._booking_data
+        # A copy, in the order the bookings were made
+        return list(self._bookings_by_id.values())
     
     @booking_data.setter
     def booking_data(self, value):
-        self._booking_data = value
+        with self._lock, self._changing():
+            self._bookings_by_id = {booking.id: booking for booking in value}
+            # Rebuild the seat map so seat lookups never have to scan the bookings
+            self._seat_map = SeatMap(self.seat_config)
+            self._holds.clear()
+            self._seat_holds.clear()
+            # All seats in one call, so large screenings are loaded in bulk rather than seat by seat
+            self._seat_map.set_states([seat for booking in value for seat in booking.seats], BOOKED)
+    
+    @property
+    def version(self) -> int:
+        # Number of committed changes to the seat map; it only moves forward
+        return (self._write_sequence + 1) // 2
+    
+    @property
+    def seat_map(self) -> SeatMap:
+        return self._seat_map
+    
+    @property
+    def seats_free(self) -> int:
+        # Maintained incrementally by the seat map, so this never rescans the seats or bookings
+        return self._seat_map.free_count
+    
+    def seats_free_in_row(self, row: int) -> int:
+        return self._seat_map.count_in_row(row)
+    
+    def largest_free_block_in_row(self, row: int) -> int:
+        return self._seat_map.largest_free_block(row)
+    
+    @property
+    def largest_free_block(self) -> int:
+        # Largest block of adjacent free seats in any row, read from the seat map's free run index in O(1)
+        return self._seat_map.largest_free_block()
+    
+    def find_booking(self, booking_id: str) -> Optional[Booking]:
+        return self._bookings_by_id.get(booking_id)
+    
+    def latest_booking_ids(self, count: int) -> List[str]:
+        # Most recent first, without copying the other bookings
+        return list(islice(reversed(self._bookings_by_id), count))
+    
+    def is_seat_booked(self, seat: int) -> bool:
+        return self._seat_map.state(seat) == BOOKED
+    
+    def is_seat_available(self, seat: int) -> bool:
+        return self._seat_map.is_free(seat)
+    
+    @property
+    def seats_held(self) -> int:
+        return len(self._seat_holds)
+    
+    def is_seat_held_by(self, seat: int, hold_id: Optional[str]) -> bool:
+        return hold_id is not None and self._seat_holds.get(seat) == hold_id
+    
+    def held_seats(self, hold_id: str) -> List[int]:
+        return list(self._holds.get(hold_id, []))
+    
+    def hold_seats(self, hold_id: str, seats: Iterable[int], ttl: float, now: Optional[float] = None) -> None:
+        # Hold seats for an unconfirmed booking, replacing any seats it held before. Seats must be free
+        # (or already held by the same hold); the hold is released automatically once `ttl` seconds pass.
+        seats = list(seats)
+        self.expire_holds(now)
+        with self._lock:
+            unavailable_seats = [seat for seat in seats if not self._seat_map.is_free(seat) and self._seat_holds.get(seat) != hold_id]
+            if unavailable_seats or len(set(seats)) != len(seats):
+                raise SeatConflictError(self.seat_config.seat_labels(unavailable_seats))
+            with self._changing():
+                self._release_hold(hold_id)
+                self._holds[hold_id] = seats
+                for seat in seats:
+                    self._seat_holds[seat] = hold_id
+                self._seat_map.set_states(seats, HELD)
+            self._hold_expiry.schedule(hold_id, ttl, now)
+    
+    def release_hold(self, hold_id: str) -> bool:
+        with self._lock:
+            if hold_id not in self._holds:
+                return False
+            with self._changing():
+                self._release_hold(hold_id)
+            return True
+    
+    def expire_holds(self, now: Optional[float] = None) -> List[str]:
+        # Advancing the wheel is O(1) amortized per elapsed tick, so this is cheap to call before any availability check
+        with self._lock:
+            expired = [hold_id for hold_id in self._hold_expiry.advance(now) if hold_id in self._holds]
+            if expired:
+                with self._changing():
+                    for hold_id in expired:
+                        self._release_hold(hold_id)
+            return expired
+    
+    def add_booking(self, booking: Booking) -> None:
+        self.add_bookings([booking])
+    
+    def add_bookings(self, bookings: List[Booking]) -> None:
+        # Compare-and-set at seat level: under the write lock, check every seat is still free before changing
+        # anything, so conflicting commits fail fast and the seat map and counters are never left half-updated
+        # Seats held under the booking's id count as available to it; its hold is converted into the booking.
+        requested_seats = [seat for booking in bookings for seat in booking.seats]
+        self.expire_holds()
+        with self._lock:
+            seen_seats = set()
+            unavailable_seats = []
+            for booking in bookings:
+                for seat in booking.seats:
+                    if seat in seen_seats or not (self._seat_map.is_free(seat) or self._seat_holds.get(seat) == booking.id):
+                        unavailable_seats.append(seat)
+                    seen_seats.add(seat)
+            if unavailable_seats:
+                raise SeatConflictError(self.seat_config.seat_labels(unavailable_seats))
+            duplicate_ids = [booking.id for booking in bookings if booking.id in self._bookings_by_id]
+            if duplicate_ids or len({booking.id for booking in bookings}) != len(bookings):
+                raise ValueError(f"Booking ids are already in use: {duplicate_ids}")
+            with self._changing():
+                for booking in bookings:
+                    self._release_hold(booking.id)
+                    self._bookings_by_id[booking.id] = booking
+                self._seat_map.set_states(requested_seats, BOOKED)
+    
+    def remove_booking(self, booking: Booking) -> None:
+        with self._lock:
+            if booking.id not in self._bookings_by_id:
+                raise ValueError(f"Booking {booking.id} is not a booking of this screening")
+            with self._changing():
+                booking = self._bookings_by_id.pop(booking.id)
+                self._seat_map.set_states(booking.seats, FREE)
+    
+    def add_listener(self, listener: Callable[["Screening"], None]) -> None:
+        # Listeners run on the writing thread while the write lock is held, so they must be quick and take no other locks
+        # that could wait on this screening
+        with self._lock:
+            self._listeners += (listener,)
+    
+    def remove_listener(self, listener: Callable[["Screening"], None]) -> None:
+        with self._lock:
+            self._listeners = tuple(known for known in self._listeners if known != listener)
+    
+    def read_consistent(self, read: Callable[[], T]) -> T:
+        # Run a read-only function (e.g. seat planning) against the live seat map without taking the write lock,
+        # retrying it if a write was in progress or happened meanwhile
+        while True:
+            write_sequence = self._write_sequence
+            if write_sequence % 2 == 0:
+                try:
+                    result = read()
+                except Exception:
+                    if self._write_sequence == write_sequence:
+                        raise
+                    continue  # Saw a half-applied write; try again
+                if self._write_sequence == write_sequence:
+                    return result
+            time.sleep(0)  # Let the writer finish
+    
+    def _release_hold(self, hold_id: str) -> None:
+        # Callers must hold _lock and be inside _changing()
+        seats = self._holds.pop(hold_id, None)
+        self._hold_expiry.cancel(hold_id)
+        if seats is None:
+            return
+        for seat in seats:
+            del self._seat_holds[seat]
+        self._seat_map.set_states(seats, FREE)
+    
+    @contextmanager
+    def _changing(self) -> Iterator[None]:
+        # Marks a change to the seat map in progress; callers must already hold _lock
+        self._write_sequence += 1
+        try:
+            yield
+        finally:
+            self._write_sequence += 1
+            for listener in self._listeners:
+                listener(self)
     
     def __str__(self):
-        return f"Screening: {self.start_time}, {self.movie}, {self.seat_config}"
\ No newline at end of file
+        return f"Screening: {self.start_time}, Hall {self.hall}, {self.movie}, {self.seat_config}"
\ No newline at end of file
@@ -0,0 +1,138 @@
+from array import array
+from typing import Iterable, List, Optional
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.models.free_run_index import FreeRunIndex
+from cinema_booking_system.models.seat_order import center_out_order
+
+# Seat states, stored as one unsigned byte per seat
+FREE = 0
+HELD = 1
+BOOKED = 2
+BLOCKED = 3
+
+# Maps each seat state to 0 if the seat is free and 1 otherwise
+OCCUPIED_TABLE = bytes([0] + [1] * 255)
+
+# Changes touching at least this many seats rebuild the counters and free runs of the affected rows from the
+# seat states instead of updating them seat by seat
+BULK_CHANGE_SEATS = 64
+
+class SeatMap:
+    def __init__(self, seat_config: SeatingConfig):
+        self.seat_config = seat_config
+        # Row-major uint8 buffer indexed by seat id; row r occupies [r * seat_count_per_row, (r + 1) * seat_count_per_row)
+        self._states = bytearray(seat_config.total_seats)
+        # Free seat counters and maximal free runs per row, kept in step with every state change
+        self._free_count = seat_config.total_seats
+        self._free_per_row = array('I', [seat_config.seat_count_per_row]) * seat_config.row_count
+        self._free_runs = FreeRunIndex(seat_config.row_count, seat_config.seat_count_per_row)
+        # Shared by every seat map whose rows are this long
+        self._center_out = center_out_order(seat_config.seat_count_per_row)
+
+    @property
+    def seat_config(self) -> SeatingConfig:
+        return self._seat_config
+
+    @seat_config.setter
+    def seat_config(self, value):
+        self._seat_config = value
+
+    @property
+    def states(self) -> memoryview:
+        # Zero-copy 2-D (row, column) view of the seat states; numpy.asarray() on it yields a uint8 array without copying
+        return memoryview(self._states).cast('B', (self._seat_config.row_count, self._seat_config.seat_count_per_row))
+
+    def state(self, seat: int) -> int:
+        return self._states[seat]
+
+    def is_free(self, seat: int) -> bool:
+        return self._states[seat] == FREE
+
+    @property
+    def free_runs(self) -> FreeRunIndex:
+        return self._free_runs
+
+    def set_state(self, seat: int, state: int) -> None:
+        previous = self._states[seat]
+        self._states[seat] = state
+        if (previous == FREE) != (state == FREE):
+            row, column = divmod(seat, self._seat_config.seat_count_per_row)
+            if state == FREE:
+                self._free_count += 1
+                self._free_per_row[row] += 1
+                self._free_runs.release(row, column)
+            else:
+                self._free_count -= 1
+                self._free_per_row[row] -= 1
+                self._free_runs.occupy(row, column)
+
+    def set_states(self, seats: Iterable[int], state: int) -> None:
+        if not isinstance(seats, (list, array, range)):
+            seats = list(seats)
+        if len(seats) < BULK_CHANGE_SEATS:
+            for seat in seats:
+                self.set_state(seat, state)
+            return
+        seats_per_row = self._seat_config.seat_count_per_row
+        states = self._states
+        for seat in seats:
+            states[seat] = state
+        for row in {seat // seats_per_row for seat in seats}:
+            occupied = states[row * seats_per_row:(row + 1) * seats_per_row].translate(OCCUPIED_TABLE)
+            free_seats = occupied.count(0)
+            self._free_count += free_seats - self._free_per_row[row]
+            self._free_per_row[row] = free_seats
+            self._free_runs.reset_row(row, occupied)
+
+    def largest_free_block(self, row: Optional[int] = None) -> int:
+        return self._free_runs.largest_run(row)
+
+    def find_free_block(self, seat_count: int, starting_row: int = 0) -> List[int]:
+        # Closest-to-center block of adjacent free seats in the first row (from starting_row, wrapping) that can fit it
+        row = self._free_runs.find_row(seat_count, starting_row)
+        if row is None:
+            return []
+        start = self._seat_config.seat_id(row, self._free_runs.closest_block_to_center(row, seat_count))
+        return list(range(start, start + seat_count))
+
+    def row(self, row: int) -> bytearray:
+        seats_per_row = self._seat_config.seat_count_per_row
+        return self._states[row * seats_per_row:(row + 1) * seats_per_row]
+
+    @property
+    def free_count(self) -> int:
+        return self._free_count
+
+    def count(self, state: int = FREE) -> int:
+        # Free seats are counted incrementally; other states fall back to bytearray.count, which runs in C over the buffer
+        if state == FREE:
+            return self._free_count
+        return self._states.count(state)
+
+    def count_in_row(self, row: int, state: int = FREE) -> int:
+        if state == FREE:
+            return self._free_per_row[row]
+        seats_per_row = self._seat_config.seat_count_per_row
+        return self._states.count(state, row * seats_per_row, (row + 1) * seats_per_row)
+
+    def rows_with_free_seats(self, seat_count: int = 1) -> List[int]:
+        return [row for row in range(self._seat_config.row_count) if self.count_in_row(row) >= seat_count]
+
+    def free_seats_from_center(self, row: int, seat_count: int) -> List[int]:
+        # Filter the row's precomputed center-out order (center, center+1, center-1, center+2, ...) against the seat states
+        row_start = row * self._seat_config.seat_count_per_row
+        columns = self._center_out.first_free(self.row(row), self._free_per_row[row], seat_count)
+        return [row_start + column for column in columns]
+
+    def copy(self) -> "SeatMap":
+        seat_map = SeatMap.__new__(SeatMap)
+        seat_map._seat_config = self._seat_config
+        seat_map._states = bytearray(self._states)
+        seat_map._free_count = self._free_count
+        seat_map._free_per_row = array('I', self._free_per_row)
+        seat_map._free_runs = self._free_runs.copy()
+        seat_map._center_out = self._center_out
+        return seat_map
+
+    def __str__(self):
+        return f"SeatMap: {self.seat_config}, {self.count()} seats free"
@@ -0,0 +1,50 @@
+from array import array
+from typing import Dict, List
+
+class CenterOutOrder:
+    # The columns of a row in center-out order (center, center+1, center-1, center+2, ...), and each column's
+    # rank in that order. Both only depend on the number of seats per row, so they are built once per row
+    # length and shared by every seat map of that size.
+    def __init__(self, seats_per_row: int):
+        center_column = seats_per_row // 2
+        columns = [center_column]
+        for distance in range(1, seats_per_row):
+            if center_column + distance < seats_per_row:
+                columns.append(center_column + distance)
+            if center_column - distance >= 0:
+                columns.append(center_column - distance)
+        self.seats_per_row = seats_per_row
+        self.columns = array('I', columns)
+        self.ranks = array('I', [0]) * seats_per_row
+        for rank, column in enumerate(columns):
+            self.ranks[column] = rank
+
+    def first_free(self, row_states: bytes, free_count: int, seat_count: int) -> List[int]:
+        # Columns of the first seat_count free seats (state 0) of the row in center-out order; free_count is
+        # the number of free seats in the row
+        if free_count * 16 >= self.seats_per_row:
+            # Free seats are common enough to be met within a few steps of walking the order
+            selected_columns: List[int] = []
+            for column in self.columns:
+                if not row_states[column]:
+                    selected_columns.append(column)
+                    if len(selected_columns) == seat_count:
+                        break
+            return selected_columns
+        # A nearly full row: find its few free seats with bytes.find and rank them instead of walking every seat
+        free_columns = []
+        column = row_states.find(0)
+        while column != -1:
+            free_columns.append(column)
+            column = row_states.find(0, column + 1)
+        free_columns.sort(key=self.ranks.__getitem__)
+        return free_columns[:seat_count]
+
+# Center-out orders by row length, shared flyweight-style by every hall with that many seats per row
+_center_out_orders: Dict[int, CenterOutOrder] = {}
+
+def center_out_order(seats_per_row: int) -> CenterOutOrder:
+    order = _center_out_orders.get(seats_per_row)
+    if order is None:
+        order = _center_out_orders[seats_per_row] = CenterOutOrder(seats_per_row)
+    return order
@@ -1,4 +1,8 @@
+from typing import Iterable, List
+
 class SeatingConfig:
+    __slots__ = ("_row_count", "_seat_count_per_row")
+    
     def __init__(self, row_count: int, seat_count_per_row: int):
         self.row_count = row_count
         self.seat_count_per_row = seat_count_per_row
@@ -19,5 +23,54 @@ class SeatingConfig:
     def seat_count_per_row(self, value):
         self._seat_count_per_row = value
     
+    @property
+    def total_seats(self) -> int:
+        return self._row_count * self._seat_count_per_row
+    
+    # Seats are identified internally by a compact integer id (row * seat_count_per_row + column).
+    # Labels such as "B7" are only produced/parsed at the UI boundary through the helpers below.
+    
+    def seat_id(self, row: int, column: int) -> int:
+        return row * self._seat_count_per_row + column
+    
+    def row_label(self, row: int) -> str:
+        # Rows are lettered like spreadsheet columns: A-Z, then AA, AB, ... ZZ, AAA, ...
+        label = ""
+        row += 1
+        while row:
+            row, letter = divmod(row - 1, 26)
+            label = chr(ord('A') + letter) + label
+        return label
+    
+    def parse_row(self, label: str) -> int:
+        row = 0
+        for letter in label.upper():
+            if not 'A' <= letter <= 'Z':
+                raise ValueError(f"Invalid row label: {label}")
+            row = row * 26 + ord(letter) - ord('A') + 1
+        if row == 0:
+            raise ValueError(f"Invalid row label: {label}")
+        return row - 1
+    
+    def seat_label(self, seat_id: int) -> str:
+        row, column = divmod(seat_id, self._seat_count_per_row)
+        return f"{self.row_label(row)}{column + 1}"
+    
+    def parse_seat(self, label: str) -> int:
+        # Split "B7" into its row letters and seat number without going through a regex
+        split = len(label.rstrip("0123456789"))
+        if split == 0 or split == len(label):
+            raise ValueError(f"Invalid seat label: {label}")
+        row, column = self.parse_row(label[:split]), int(label[split:]) - 1
+        if not (0 <= row < self._row_count and 0 <= column < self._seat_count_per_row):
+            raise ValueError(f"Seat is outside the cinema: {label}")
+        return self.seat_id(row, column)
+    
+    def seat_labels(self, seat_ids: Iterable[int]) -> List[str]:
+        return [self.seat_label(seat_id) for seat_id in seat_ids]
+    
+    def seat_ids(self, labels: Iterable[str]) -> List[int]:
+        return [self.parse_seat(label) for label in labels]
+    
     def __str__(self):
-        return f"Rows: {self.row_count}, Seats per row: {self.seat_count_per_row}"
\ No newline at end of file
+        return f"Rows: {self.row_count}, Seats per row: {self.seat_count_per_row}"
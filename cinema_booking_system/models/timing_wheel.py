@@ -0,0 +1,64 @@
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+class TimingWheel:
+    def __init__(self, tick: float = 1.0, slot_count: int = 512, clock: Callable[[], float] = time.monotonic):
+        # Each slot holds the timers whose expiry tick maps onto it; timers more than one revolution away
+        # simply stay in their slot until the wheel comes round to their expiry tick
+        self.tick = tick
+        self.slot_count = slot_count
+        self.clock = clock
+        self._origin = clock()
+        self._current_tick = 0
+        # Slots are created on first use, so an idle wheel (e.g. on a screening nobody is booking) stays small
+        self._slots: Dict[int, Dict[Hashable, int]] = {}
+        self._slot_of: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slot_of
+
+    def schedule(self, key: Hashable, delay: float, now: Optional[float] = None) -> None:
+        # O(1): rescheduling an existing key replaces its previous timer
+        self.cancel(key)
+        now = self.clock() if now is None else now
+        expiry_tick = max(math.ceil((now - self._origin + delay) / self.tick), self._current_tick + 1)
+        slot = expiry_tick % self.slot_count
+        self._slots.setdefault(slot, {})[key] = expiry_tick
+        self._slot_of[key] = slot
+
+    def cancel(self, key: Hashable) -> bool:
+        slot = self._slot_of.pop(key, None)
+        if slot is None:
+            return False
+        timers = self._slots[slot]
+        del timers[key]
+        if not timers:
+            del self._slots[slot]
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        # Move the wheel up to `now` and return the keys that expired. Each elapsed tick visits one slot,
+        # and at most one full revolution is walked however long the wheel sat idle.
+        now = self.clock() if now is None else now
+        target_tick = math.floor((now - self._origin) / self.tick)
+        if target_tick <= self._current_tick:
+            return []
+        expired: List[Hashable] = []
+        first_tick = max(self._current_tick + 1, target_tick - self.slot_count + 1)
+        for tick in range(first_tick, target_tick + 1):
+            slot = self._slots.get(tick % self.slot_count)
+            if not slot:
+                continue
+            due = [key for key, expiry_tick in slot.items() if expiry_tick <= target_tick]
+            for key in due:
+                del slot[key]
+                del self._slot_of[key]
+            if not slot:
+                del self._slots[tick % self.slot_count]
+            expired.extend(due)
+        self._current_tick = target_tick
+        return expired
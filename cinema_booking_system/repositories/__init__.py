@@ -0,0 +1,3 @@
+from .booking_journal import BookingJournal
+from .sqlite_repository import SQLiteRepository
+from .screening_snapshot import ScreeningSnapshot, write_snapshot
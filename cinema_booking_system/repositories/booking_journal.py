@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from cinema_booking_system import metrics
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening, DEFAULT_HALL
+from cinema_booking_system.models.seating_config import SeatingConfig
+
+BOOKING_CREATED = "booking-created"
+SEATS_CONFIRMED = "seats-confirmed"
+BOOKING_CANCELLED = "booking-cancelled"
+
+JOURNAL_FILE = "journal.log"
+SNAPSHOT_FILE = "snapshot.json"
+
+class BookingJournal:
+    def __init__(self, directory: str, snapshot_interval: int = 10000):
+        self.directory = directory
+        # A snapshot is taken (and the journal restarted) after this many records
+        self.snapshot_interval = snapshot_interval
+        self.screening: Optional[Screening] = None
+        # _lock guards appends; _commit_lock lets a single thread fsync on behalf of everyone waiting (group commit)
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._sequence = 0
+        self._durable_sequence = 0
+        self._records_since_snapshot = 0
+        self._file = None
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.directory, JOURNAL_FILE)
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, SNAPSHOT_FILE)
+
+    @property
+    def started(self) -> bool:
+        # Whether start() or a successful recover() has opened the journal for appending
+        return self._file is not None
+
+    def recover(self) -> Optional[Screening]:
+        # Rebuild the screening from the latest snapshot plus the journal records written after it
+        if not os.path.exists(self.snapshot_path):
+            return None
+        with open(self.snapshot_path, "r", encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        self._sequence = snapshot["sequence"]
+
+        # Replay into a plain dict of booking id -> seats and build the seat map once at the end,
+        # rather than applying every historical event to the seat map
+        seats_by_booking: Dict[str, Optional[List[int]]] = {booking_id: seats for booking_id, seats in snapshot["bookings"]}
+        self._records_since_snapshot = 0
+        if os.path.exists(self.journal_path):
+            valid_length = 0
+            with open(self.journal_path, "rb") as journal_file:
+                for line in journal_file:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("Incomplete record")
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn write at the tail of the journal from a crash; nothing after it was acknowledged
+                    valid_length += len(line)
+                    if record["seq"] <= self._sequence:
+                        continue  # Already covered by the snapshot
+                    self._sequence = record["seq"]
+                    self._records_since_snapshot += 1
+                    if record["type"] == BOOKING_CREATED:
+                        seats_by_booking.setdefault(record["booking_id"], None)
+                    elif record["type"] == SEATS_CONFIRMED:
+                        seats_by_booking[record["booking_id"]] = record["seats"]
+                    elif record["type"] == BOOKING_CANCELLED:
+                        seats_by_booking.pop(record["booking_id"], None)
+            # Drop any torn tail so new records are not appended after it
+            os.truncate(self.journal_path, valid_length)
+
+        details = snapshot["screening"]
+        bookings = [Booking(booking_id, seats) for booking_id, seats in seats_by_booking.items() if seats is not None]
+        self.screening = Screening(
+            datetime.fromisoformat(details["start_time"]),
+            SeatingConfig(details["row_count"], details["seat_count_per_row"]),
+            Movie(details["movie"]),
+            bookings,
+            details["id"],
+            details.get("hall", DEFAULT_HALL),
+        )
+        self._durable_sequence = self._sequence
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        return self.screening
+
+    def start(self, screening: Screening) -> None:
+        # Start journalling a screening that was not recovered from this directory
+        self.screening = screening
+        self.snapshot()
+
+    def record_booking_created(self, booking: Booking) -> int:
+        return self._append({"type": BOOKING_CREATED, "booking_id": booking.id})
+
+    def record_seats_confirmed(self, booking: Booking) -> int:
+        return self._append({"type": SEATS_CONFIRMED, "booking_id": booking.id, "seats": booking.seats.tolist()})
+
+    def record_booking_cancelled(self, booking: Booking) -> int:
+        return self._append({"type": BOOKING_CANCELLED, "booking_id": booking.id})
+
+    @metrics.timed("journal_commit_seconds")
+    def commit(self, sequence: Optional[int] = None) -> None:
+        # Block until every record up to `sequence` (default: everything appended so far) is on disk.
+        # Whoever holds the commit lock fsyncs all pending records, so threads that queue up behind it
+        # usually find their records already durable and return without a second fsync.
+        sequence = self._sequence if sequence is None else sequence
+        with self._commit_lock:
+            if self._durable_sequence >= sequence:
+                return
+            with self._lock:
+                self._file.flush()
+                durable_sequence = self._sequence
+                file_descriptor = self._file.fileno()
+            os.fsync(file_descriptor)
+            self._durable_sequence = max(self._durable_sequence, durable_sequence)
+        if self._records_since_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+    @metrics.timed("journal_snapshot_seconds")
+    def snapshot(self) -> None:
+        # Write the snapshot next to the old one and swap it in atomically, then restart the journal.
+        # A crash between the two steps is harmless: records already in the snapshot are skipped on replay.
+        with self._commit_lock, self._lock:
+            screening = self.screening
+            snapshot = {
+                "sequence": self._sequence,
+                "screening": {
+                    "id": screening.id,
+                    "start_time": screening.start_time.isoformat(),
+                    "hall": screening.hall,
+                    "movie": screening.movie.title,
+                    "row_count": screening.seat_config.row_count,
+                    "seat_count_per_row": screening.seat_config.seat_count_per_row,
+                },
+                # Read through the screening's seqlock, so a booking cancelled meanwhile cannot make the copy skip another
+                "bookings": screening.read_consistent(lambda: [[booking.id, booking.seats.tolist()] for booking in screening.booking_data]),
+            }
+            temporary_path = self.snapshot_path + ".tmp"
+            with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+                json.dump(snapshot, snapshot_file, separators=(",", ":"))
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temporary_path, self.snapshot_path)
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, "w", encoding="utf-8")
+            self._durable_sequence = self._sequence
+            self._records_since_snapshot = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.commit()
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: dict) -> int:
+        # Appends only reach the OS buffer; callers that need durability follow up with commit()
+        if self._file is None:
+            raise ValueError("The booking journal has not been started; call start() or recover() first")
+        with self._lock:
+            self._sequence += 1
+            record["seq"] = self._sequence
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._records_since_snapshot += 1
+            return self._sequence
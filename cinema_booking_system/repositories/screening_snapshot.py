@@ -0,0 +1,174 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import List, Optional
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seat_map import FREE
+from cinema_booking_system.models.seating_config import SeatingConfig
+
+# Binary snapshot of a screening, laid out so other processes can mmap it and read availability in place:
+#
+#   header     magic, format version, hall size, section sizes and offsets (HEADER, little-endian)
+#   metadata   screening id, start time, hall and movie title as UTF-8 JSON
+#   states     one byte per seat, row-major, in the same layout and state codes as SeatMap
+#   row free   free seats per row (uint32)
+#   bookings   (booking id, first seat, seat count) records sorted by booking id (BOOKING_RECORD)
+#   seats      the bookings' seat ids (uint32), referenced by the booking records
+#
+# Sections start on 8-byte boundaries. Every process mapping the same file shares one copy of it in the page cache.
+MAGIC = b"GICS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIIQQQQQQ")
+BOOKING_ID_SIZE = 32
+BOOKING_RECORD = struct.Struct(f"<{BOOKING_ID_SIZE}sII")
+ALIGNMENT = 8
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def write_snapshot(screening: Screening, path: str) -> None:
+    # Capture the seat states and bookings at one version of the screening, then write the file next to the old one
+    # and swap it in atomically; processes that still map the old file keep reading it until they reopen
+    def capture():
+        seat_map = screening.seat_map
+        rows = range(screening.seat_config.row_count)
+        return bytes(seat_map.states), array('I', [seat_map.count_in_row(row) for row in rows]), seat_map.free_count, list(screening.booking_data)
+    states, row_free, free_count, bookings = screening.read_consistent(capture)
+
+    seat_config = screening.seat_config
+    metadata = json.dumps({
+        "id": screening.id,
+        "start_time": screening.start_time.isoformat(),
+        "hall": screening.hall,
+        "movie": screening.movie.title,
+    }).encode("utf-8")
+    booking_records = bytearray()
+    seats = array('I')
+    for booking in sorted(bookings, key=lambda booking: booking.id):
+        booking_id = booking.id.encode("ascii")
+        if len(booking_id) > BOOKING_ID_SIZE:
+            raise ValueError(f"Booking id is longer than {BOOKING_ID_SIZE} characters: {booking.id}")
+        booking_records += BOOKING_RECORD.pack(booking_id, len(seats), len(booking.seats))
+        seats.fromlist(booking.seats.tolist())
+
+    sections = [metadata, states, _little_endian(row_free), bytes(booking_records), _little_endian(seats)]
+    offsets = []
+    offset = _aligned(HEADER.size)
+    for section in sections:
+        offsets.append(offset)
+        offset = _aligned(offset + len(section))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, seat_config.row_count, seat_config.seat_count_per_row, free_count, len(bookings), len(metadata), *offsets, len(seats))
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(header)
+        for section_offset, section in zip(offsets, sections):
+            snapshot_file.write(b"\0" * (section_offset - snapshot_file.tell()))
+            snapshot_file.write(section)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary_path, path)
+
+class ScreeningSnapshot:
+    # Read-only view of a snapshot file through mmap. Availability is read straight from the mapped bytes, without
+    # building the screening's bookings or seat map; load() rebuilds a full Screening when one is needed.
+    def __init__(self, path: str):
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        (magic, version, _, self.row_count, self.seat_count_per_row, self.seats_free, self.booking_count, metadata_size,
+         metadata_offset, states_offset, row_free_offset, bookings_offset, seats_offset, seat_ref_count) = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Not a screening snapshot (format {FORMAT_VERSION}): {path}")
+        self.seat_config = SeatingConfig(self.row_count, self.seat_count_per_row)
+        metadata = json.loads(bytes(self._buffer[metadata_offset:metadata_offset + metadata_size]))
+        self.id: Optional[int] = metadata["id"]
+        self.start_time = datetime.fromisoformat(metadata["start_time"])
+        self.hall: str = metadata["hall"]
+        self.movie_title: str = metadata["movie"]
+        total_seats = self.seat_config.total_seats
+        self._states = self._buffer[states_offset:states_offset + total_seats]
+        self._bookings = self._buffer[bookings_offset:bookings_offset + self.booking_count * BOOKING_RECORD.size]
+        self._row_free = self._uint32_view(row_free_offset, self.row_count)
+        self._seats = self._uint32_view(seats_offset, seat_ref_count)
+
+    def _uint32_view(self, offset: int, count: int):
+        view = self._buffer[offset:offset + 4 * count]
+        if sys.byteorder == "little":
+            return view.cast('I')
+        # Big-endian hosts read a byte-swapped copy instead of a view
+        values = array('I', view)
+        values.byteswap()
+        return values
+
+    @property
+    def states(self) -> memoryview:
+        # Zero-copy 2-D (row, column) view of the seat states, shaped like SeatMap.states; numpy.asarray() on it
+        # yields a read-only uint8 array backed by the mapped file
+        return self._states.cast('B', (self.row_count, self.seat_count_per_row))
+
+    def state(self, seat: int) -> int:
+        return self._states[seat]
+
+    def is_seat_available(self, seat: int) -> bool:
+        return self._states[seat] == FREE
+
+    def seats_free_in_row(self, row: int) -> int:
+        return self._row_free[row]
+
+    def booking_ids(self) -> List[str]:
+        return [self._booking_record(index)[0] for index in range(self.booking_count)]
+
+    def find_booking(self, booking_id: str) -> Optional[Booking]:
+        # Binary search over the booking records, which are sorted by id
+        low, high = 0, self.booking_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._booking_record(middle)[0] < booking_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.booking_count:
+            record_id, first_seat, seat_count = self._booking_record(low)
+            if record_id == booking_id:
+                return Booking(record_id, self._seats[first_seat:first_seat + seat_count].tolist())
+        return None
+
+    def load(self) -> Screening:
+        # Rebuild the screening with its bookings, e.g. for a process that takes bookings
+        bookings = []
+        for index in range(self.booking_count):
+            booking_id, first_seat, seat_count = self._booking_record(index)
+            bookings.append(Booking(booking_id, self._seats[first_seat:first_seat + seat_count].tolist()))
+        return Screening(self.start_time, SeatingConfig(self.row_count, self.seat_count_per_row), Movie(self.movie_title), bookings, self.id, self.hall)
+
+    def close(self) -> None:
+        # Views handed out by `states` must be released before the file can be unmapped
+        for view in ("_states", "_bookings", "_row_free", "_seats"):
+            if isinstance(getattr(self, view, None), memoryview):
+                getattr(self, view).release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ScreeningSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _booking_record(self, index: int):
+        booking_id, first_seat, seat_count = BOOKING_RECORD.unpack_from(self._bookings, index * BOOKING_RECORD.size)
+        return booking_id.rstrip(b"\0").decode("ascii"), first_seat, seat_count
@@ -0,0 +1,161 @@
+import sqlite3
+import queue
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+from cinema_booking_system import metrics
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS seating_configs (
+    id INTEGER PRIMARY KEY,
+    row_count INTEGER NOT NULL,
+    seat_count_per_row INTEGER NOT NULL,
+    UNIQUE (row_count, seat_count_per_row)
+);
+CREATE TABLE IF NOT EXISTS screenings (
+    id INTEGER PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    hall TEXT NOT NULL DEFAULT '1',
+    movie_id INTEGER NOT NULL REFERENCES movies (id),
+    seating_config_id INTEGER NOT NULL REFERENCES seating_configs (id)
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    id TEXT PRIMARY KEY,
+    screening_id INTEGER NOT NULL REFERENCES screenings (id)
+);
+CREATE TABLE IF NOT EXISTS booking_seats (
+    screening_id INTEGER NOT NULL REFERENCES screenings (id),
+    seat_id INTEGER NOT NULL,
+    booking_id TEXT NOT NULL REFERENCES bookings (id) ON DELETE CASCADE,
+    PRIMARY KEY (screening_id, seat_id)  -- a seat can only ever belong to one booking per screening
+);
+CREATE INDEX IF NOT EXISTS booking_seats_booking_id ON booking_seats (booking_id);
+"""
+
+# Columns added after the first release, applied to databases created before them
+MIGRATIONS = [
+    ("screenings", "hall", "ALTER TABLE screenings ADD COLUMN hall TEXT NOT NULL DEFAULT '1'"),
+]
+
+# Statements are kept as constants so each pooled connection compiles them once and reuses them from its statement cache
+INSERT_MOVIE = "INSERT INTO movies (title) VALUES (?) ON CONFLICT (title) DO NOTHING"
+SELECT_MOVIE_ID = "SELECT id FROM movies WHERE title = ?"
+INSERT_SEATING_CONFIG = "INSERT INTO seating_configs (row_count, seat_count_per_row) VALUES (?, ?) ON CONFLICT (row_count, seat_count_per_row) DO NOTHING"
+SELECT_SEATING_CONFIG_ID = "SELECT id FROM seating_configs WHERE row_count = ? AND seat_count_per_row = ?"
+INSERT_SCREENING = "INSERT INTO screenings (start_time, hall, movie_id, seating_config_id) VALUES (?, ?, ?, ?)"
+SELECT_SCREENING = (
+    "SELECT screenings.start_time, screenings.hall, movies.title, seating_configs.row_count, seating_configs.seat_count_per_row "
+    "FROM screenings JOIN movies ON movies.id = screenings.movie_id "
+    "JOIN seating_configs ON seating_configs.id = screenings.seating_config_id WHERE screenings.id = ?"
+)
+SELECT_SCREENING_IDS = "SELECT id FROM screenings ORDER BY id"
+INSERT_BOOKING = "INSERT INTO bookings (id, screening_id) VALUES (?, ?)"
+INSERT_BOOKING_SEAT = "INSERT INTO booking_seats (screening_id, seat_id, booking_id) VALUES (?, ?, ?)"
+DELETE_BOOKING = "DELETE FROM bookings WHERE id = ? AND screening_id = ?"
+SELECT_BOOKING_SEATS = "SELECT booking_id, seat_id FROM booking_seats WHERE screening_id = ? ORDER BY rowid"
+SELECT_BOOKING_IDS = "SELECT id FROM bookings WHERE screening_id = ? ORDER BY rowid"
+
+class SQLiteRepository:
+    def __init__(self, path: str, pool_size: int = 4, timeout: float = 5.0):
+        self.path = path
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        for _ in range(pool_size):
+            connection = self._connect(timeout)
+            self._connections.append(connection)
+            self._pool.put(connection)
+        with self.connection() as connection:
+            connection.executescript(SCHEMA)
+            for table, column, statement in MIGRATIONS:
+                if column not in [info[1] for info in connection.execute(f"PRAGMA table_info({table})")]:
+                    connection.execute(statement)
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        # isolation_level=None leaves transactions to the explicit BEGIN/COMMIT in transaction()
+        connection = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False, cached_statements=64)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        # Borrow a connection from the pool; it goes back even if the caller raises
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.close()
+
+    def save_screening(self, screening: Screening) -> int:
+        with self.transaction() as connection:
+            connection.execute(INSERT_MOVIE, (screening.movie.title,))
+            movie_id = connection.execute(SELECT_MOVIE_ID, (screening.movie.title,)).fetchone()[0]
+            seat_config = screening.seat_config
+            connection.execute(INSERT_SEATING_CONFIG, (seat_config.row_count, seat_config.seat_count_per_row))
+            seating_config_id = connection.execute(SELECT_SEATING_CONFIG_ID, (seat_config.row_count, seat_config.seat_count_per_row)).fetchone()[0]
+            cursor = connection.execute(INSERT_SCREENING, (screening.start_time.isoformat(), screening.hall, movie_id, seating_config_id))
+            screening.id = cursor.lastrowid
+            self._insert_bookings(connection, screening.id, screening.booking_data)
+        return screening.id
+
+    @metrics.timed("repository_load_screening_seconds")
+    def load_screening(self, screening_id: int) -> Optional[Screening]:
+        with self.connection() as connection:
+            row = connection.execute(SELECT_SCREENING, (screening_id,)).fetchone()
+            if row is None:
+                return None
+            start_time, hall, title, row_count, seat_count_per_row = row
+            seats_by_booking = {booking_id: [] for (booking_id,) in connection.execute(SELECT_BOOKING_IDS, (screening_id,))}
+            for booking_id, seat_id in connection.execute(SELECT_BOOKING_SEATS, (screening_id,)):
+                seats_by_booking[booking_id].append(seat_id)
+        bookings = [Booking(booking_id, seats) for booking_id, seats in seats_by_booking.items()]
+        return Screening(datetime.fromisoformat(start_time), SeatingConfig(row_count, seat_count_per_row), Movie(title), bookings, screening_id, hall)
+
+    def list_screening_ids(self) -> List[int]:
+        with self.connection() as connection:
+            return [screening_id for (screening_id,) in connection.execute(SELECT_SCREENING_IDS)]
+
+    def save_booking(self, screening: Screening, booking: Booking) -> None:
+        self.save_bookings(screening, [booking])
+
+    @metrics.timed("repository_save_bookings_seconds")
+    def save_bookings(self, screening: Screening, bookings: List[Booking]) -> None:
+        # One transaction per call; the seat-level primary key makes the whole call fail if any seat is already taken
+        try:
+            with self.transaction() as connection:
+                self._insert_bookings(connection, screening.id, bookings)
+        except sqlite3.IntegrityError as error:
+            raise ValueError(f"Unable to save bookings for screening {screening.id}: {error}") from error
+
+    @metrics.timed("repository_delete_booking_seconds")
+    def delete_booking(self, screening: Screening, booking: Booking) -> None:
+        with self.transaction() as connection:
+            connection.execute(DELETE_BOOKING, (booking.id, screening.id))
+
+    def _insert_bookings(self, connection: sqlite3.Connection, screening_id: int, bookings: List[Booking]) -> None:
+        connection.executemany(INSERT_BOOKING, ((booking.id, screening_id) for booking in bookings))
+        connection.executemany(INSERT_BOOKING_SEAT, ((screening_id, seat, booking.id) for booking in bookings for seat in booking.seats))
@@ -1,78 +1,170 @@
-from typing import List
+import shutil
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+from cinema_booking_system import metrics
 from cinema_booking_system.models.seating_config import SeatingConfig
-from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seat_map import FREE, HELD
 
 SELECTED_SYMBOL = "o"
 AVAILABLE_SYMBOL = "."
 UNAVAILABLE_SYMBOL = "x"
+HELD_SYMBOL = "~"
+
+# Display-only state used to mark the seats being previewed
+SELECTED_STATE = 255
+
+# Maps each seat state byte to the symbol rendered for it
+SYMBOL_TABLE = bytearray(UNAVAILABLE_SYMBOL.encode("ascii") * 256)
+SYMBOL_TABLE[FREE] = ord(AVAILABLE_SYMBOL)
+SYMBOL_TABLE[HELD] = ord(HELD_SYMBOL)
+SYMBOL_TABLE[SELECTED_STATE] = ord(SELECTED_SYMBOL)
+SYMBOL_TABLE = bytes(SYMBOL_TABLE)
+
+# ANSI escape sequences used when repainting a frame in place
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_BELOW = "\x1b[J"
+
+# Lines kept free under a repainted frame for the caption and the seat prompt; a frame that leaves less room
+# would scroll the terminal and break the cursor positioning, so it is printed in full instead
+REPAINT_PROMPT_LINES = 8
+
+class FrameLayout:
+    # Everything in a frame that only depends on the hall's dimensions, built once per seating configuration:
+    # a template of the whole frame with the seat cells left blank, and where each row's cells start in it
+    def __init__(self, seating_config: SeatingConfig):
+        seats_per_row = seating_config.seat_count_per_row
+        
+        # Row labels are padded to the longest one (AA, AB, ... past row Z), and each seat gets a cell wide enough
+        # for its number in the footer (3 characters up to 99 seats per row)
+        label_width = len(seating_config.row_label(seating_config.row_count - 1))
+        cell_width = max(3, len(str(seats_per_row)) + 1)
+        
+        # Calculate the total length of the horizontal rule
+        hr_length = seats_per_row * cell_width + label_width
+        
+        # Calculate the number of spaces needed on each side of the "SCREEN" text
+        screen_text = "SCREEN"
+        screen_whitespace = " " * ((hr_length - len(screen_text)) // 2)
+        
+        # The screen, then the horizontal rule
+        header = f"{screen_whitespace}{screen_text}{screen_whitespace}\n" + "-" * hr_length + "\n"
+        
+        # One line per row, back row first, with a blank where each seat's symbol goes
+        lines = []
+        self.row_offsets: List[int] = [0] * seating_config.row_count
+        # Screen position (0-based line and column) of each row's first seat, for repainting single rows
+        self.row_positions: List[Tuple[int, int]] = [(0, 0)] * seating_config.row_count
+        offset = len(header)
+        for row_index in reversed(range(seating_config.row_count)):
+            prefix = seating_config.row_label(row_index).ljust(label_width) + " " * (cell_width - 1)
+            self.row_offsets[row_index] = offset + len(prefix)
+            self.row_positions[row_index] = (header.count("\n") + len(lines), len(prefix))
+            line = prefix + (" " * (cell_width - 1)).join(" " * seats_per_row) + " \n"
+            lines.append(line)
+            offset += len(line)
+        
+        # The seat numbers under the last row, then the legend
+        footer = " " * label_width + "".join(f"{i + 1:>{cell_width}}" for i in range(seats_per_row)) + "\n"
+        legend = f"\n{SELECTED_SYMBOL} - Selected seat | {AVAILABLE_SYMBOL} - Available seat | {HELD_SYMBOL} - Held seat | {UNAVAILABLE_SYMBOL} - Unavailable seat\n\n"
+        self.template = (header + "".join(lines) + footer + legend).encode("ascii")
+        self.line_count = self.template.count(b"\n")
+        self.seats_per_row = seats_per_row
+        self.cell_width = cell_width
+
+    def render(self, states: bytes) -> bytearray:
+        # Translate the seat states to symbols in one pass, then drop each row into every cell_width-th byte of its line
+        symbols = states.translate(SYMBOL_TABLE)
+        frame = bytearray(self.template)
+        seats_per_row, cell_width = self.seats_per_row, self.cell_width
+        row_length = cell_width * (seats_per_row - 1) + 1
+        for row_index, offset in enumerate(self.row_offsets):
+            frame[offset:offset + row_length:cell_width] = symbols[row_index * seats_per_row:(row_index + 1) * seats_per_row]
+        return frame
+
+    def diff(self, previous: bytes, current: bytes) -> str:
+        # ANSI output turning the `previous` frame on screen into `current`: for each row that changed, move the
+        # cursor to its first changed seat and rewrite the line up to its last changed seat
+        output = []
+        cell_width = self.cell_width
+        row_length = cell_width * (self.seats_per_row - 1) + 1
+        for row_index, offset in enumerate(self.row_offsets):
+            if previous[offset:offset + row_length] == current[offset:offset + row_length]:
+                continue
+            first = next(column for column in range(0, row_length, cell_width) if previous[offset + column] != current[offset + column])
+            last = next(column for column in range(row_length - 1, -1, -cell_width) if previous[offset + column] != current[offset + column])
+            line, column = self.row_positions[row_index]
+            output.append(f"\x1b[{line + 1};{column + first + 1}H" + current[offset + first:offset + last + 1].decode("ascii"))
+        return "".join(output)
+
+# Frame layouts by hall dimensions, shared by every display of a hall that size
+_frame_layouts: Dict[Tuple[int, int], FrameLayout] = {}
+
+def frame_layout(seating_config: SeatingConfig) -> FrameLayout:
+    key = (seating_config.row_count, seating_config.seat_count_per_row)
+    layout = _frame_layouts.get(key)
+    if layout is None:
+        layout = _frame_layouts[key] = FrameLayout(seating_config)
+    return layout
 
 class SeatingDisplay:
-    def __init__(self, seating_config: SeatingConfig, booking_data: List[Booking]):
-        self.seating_config = seating_config
-        self.booking_data = booking_data
+    def __init__(self, screening: Screening):
+        self.screening = screening
+        # The frame last drawn by repaint(), while it is still on screen at the top of the terminal
+        self._frame_on_screen: Optional[bytes] = None
 
     @property
-    def seat_config(self) -> SeatingConfig:
-        return self._seat_config
+    def screening(self) -> Screening:
+        return self._screening
     
-    @seat_config.setter
-    def seat_config(self, value):
-        self._seat_config = value
+    @screening.setter
+    def screening(self, value):
+        self._screening = value
     
     @property
-    def booking_data(self) -> List[Booking]:
-        return self._booking_data
+    def seating_config(self) -> SeatingConfig:
+        return self._screening.seat_config
     
-    @booking_data.setter
-    def booking_data(self, value):
-        self._booking_data = value
+    def render(self, selected_seats: Iterable[int] = ()) -> str:
+        return self._render_frame(selected_seats).decode("ascii")
     
-    def display(self, selected_seats: List[str] = []):
-        # Calculate the total length of the horizontal rule
-        hr_length = self.seating_config.seat_count_per_row * 3 + 1
-        
-        # Calculate the length of the "SCREEN" text
-        screen_text = "SCREEN"
-        screen_length = len(screen_text)
-        
-        # Calculate the number of spaces needed on each side of the "SCREEN" text
-        whitespace_each_side = (hr_length - screen_length) // 2
-        screen_whitespace = " " * whitespace_each_side
-        
-        # Print the screen
-        print(f"{screen_whitespace}{screen_text}{screen_whitespace}")
-        
-        # Print the horizontal rule
-        hr_string = "-" * hr_length
-        print(hr_string)
-        
-        # Print the row letters and seats
-        for i in range(self.seating_config.row_count):
-            row_letter = chr(65 + (self.seating_config.row_count - 1 - i))  # Reverse the row letters
-            row = f"{row_letter} "
-            for j in range(self.seating_config.seat_count_per_row):
-                seat = f"{chr(65+(self.seating_config.row_count - 1 - i))}{j+1}"
-                if seat in selected_seats:
-                    row += f" {SELECTED_SYMBOL} "
-                elif any(seat in booking.seats for booking in self.booking_data):
-                    row += f" {UNAVAILABLE_SYMBOL} "
-                else:
-                    row += f" {AVAILABLE_SYMBOL} "
-            print(row)
-        
-        # Print the last row
-        last_row = " "
-        for i in range(self.seating_config.seat_count_per_row):
-            if i < 9:
-                last_row += f"  {i+1}"
-            else:
-                last_row += f" {i+1}"
-        print(last_row)
-        
-        # Print the legend
-        print(f"\n{SELECTED_SYMBOL} - Selected seat | {AVAILABLE_SYMBOL} - Available seat | {UNAVAILABLE_SYMBOL} - Unavailable seat\n")
+    def display(self, selected_seats: Iterable[int] = ()):
+        # The whole frame goes out in a single write
+        sys.stdout.write(self.render(selected_seats))
+    
+    @metrics.timed("seating_display_repaint_seconds")
+    def repaint(self, selected_seats: Iterable[int] = ()):
+        # Draw the frame at the top of the terminal, rewriting only the seats that changed since the last repaint
+        # and clearing whatever was printed under it. The cursor is left on the line below the frame.
+        layout = frame_layout(self.seating_config)
+        frame = bytes(self._render_frame(selected_seats))
+        if layout.line_count + REPAINT_PROMPT_LINES > shutil.get_terminal_size().lines:
+            # Too tall to stay on screen
+            self._frame_on_screen = None
+            sys.stdout.write(frame.decode("ascii"))
+        elif self._frame_on_screen is None or len(self._frame_on_screen) != len(frame):
+            sys.stdout.write(CLEAR_SCREEN + frame.decode("ascii"))
+            self._frame_on_screen = frame
+        else:
+            sys.stdout.write(layout.diff(self._frame_on_screen, frame) + f"\x1b[{layout.line_count + 1};1H" + CLEAR_BELOW)
+            self._frame_on_screen = frame
+        sys.stdout.flush()
+    
+    def reset(self):
+        # Forget the frame on screen, so the next repaint draws a full frame on a cleared screen
+        self._frame_on_screen = None
+    
+    @metrics.timed("seating_display_render_seconds")
+    def _render_frame(self, selected_seats: Iterable[int]) -> bytearray:
+        # Overlay the selected seats on a copy of the seat map; only the selected seats are visited
+        states = bytearray(self.screening.seat_map.states)
+        for seat in selected_seats:
+            states[seat] = SELECTED_STATE
+        return frame_layout(self.seating_config).render(states)
 
 # Example usage:
 if __name__ == "__main__":
-    seating_display = SeatingDisplay(SeatingConfig(26, 20), [])
-    seating_display.display(["A1", "B2", "C3"])
\ No newline at end of file
+    from datetime import datetime
+    from cinema_booking_system.models.movie import Movie
+    seating_display = SeatingDisplay(Screening(datetime.now(), SeatingConfig(26, 20), Movie("Example"), []))
+    seating_display.display(seating_display.seating_config.seat_ids(["A1", "B2", "C3"]))
\ No newline at end of file
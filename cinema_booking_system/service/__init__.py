@@ -0,0 +1,3 @@
+from .booking_client import BookingClient
+from .booking_service import BookingService
+from .screening_router import ScreeningRouter
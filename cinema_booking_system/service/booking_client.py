@@ -0,0 +1,65 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+class BookingClient:
+    # Minimal asyncio client for BookingService, keeping one HTTP/1.1 connection open across requests
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        # Requests on the connection must not interleave
+        self._lock = asyncio.Lock()
+
+    async def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any]]:
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        async with self._lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n\r\n".encode("latin-1") + payload
+            )
+            await self._writer.drain()
+            status_line = await self._reader.readline()
+            if not status_line:
+                await self.close()
+                raise ConnectionError("The booking service closed the connection")
+            status = int(status_line.split(b" ", 2)[1])
+            headers = {}
+            while True:
+                line = await self._reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            response = json.loads(await self._reader.readexactly(int(headers.get("content-length", 0))))
+            if headers.get("connection", "").lower() == "close":
+                await self.close()
+            return status, response
+
+    async def availability(self) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("GET", "/availability")
+
+    async def preview(self, seat_count: int, starting_seat: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("POST", "/preview", {"seat_count": seat_count, "starting_seat": starting_seat})
+
+    async def hold(self, seat_count: int, starting_seat: Optional[str] = None, booking_id: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("POST", "/holds", {"seat_count": seat_count, "starting_seat": starting_seat, "booking_id": booking_id})
+
+    async def confirm(self, booking_id: str) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("POST", f"/bookings/{booking_id}/confirm")
+
+    async def cancel(self, booking_id: str) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("POST", f"/bookings/{booking_id}/cancel")
+
+    async def booking(self, booking_id: str) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("GET", f"/bookings/{booking_id}")
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._reader, self._writer = None, None
@@ -0,0 +1,257 @@
+import asyncio
+import json
+import re
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.screening import Screening, SeatConflictError
+from cinema_booking_system.controllers.booking_controller import BookingController, HOLD_TTL_SECONDS
+from cinema_booking_system.seating_display import SYMBOL_TABLE
+
+T = TypeVar("T")
+
+# Requests larger than this are rejected before their body is read
+MAX_BODY_SIZE = 64 * 1024
+
+# How often abandoned holds are dropped from the service's pending bookings
+PRUNE_INTERVAL_SECONDS = 5.0
+
+STATUS_TEXT = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+BOOKING_PATH = re.compile(r"^/bookings/([^/]+)(?:/(confirm|cancel))?$")
+
+class ServiceError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class BookingService:
+    # JSON-over-HTTP front-end for one screening. Every connection is served on a single event loop; seat planning,
+    # which walks the seat map, runs on an executor so slow allocations never stall the other connections.
+    def __init__(self, screening: Screening, booker: Optional[BookingController] = None, executor: Optional[Executor] = None, hold_ttl: float = HOLD_TTL_SECONDS):
+        self.screening = screening
+        self.booker = booker if booker is not None else BookingController(screening, hold_ttl=hold_ttl)
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+        # Bookings with seats on hold that are not confirmed yet, by booking id. Only touched on the event loop thread.
+        self._pending: Dict[str, Booking] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._prune_task: Optional[asyncio.Task] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        # Port 0 picks a free port; read it back from `port`
+        self._server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_BODY_SIZE)
+        self._prune_task = asyncio.create_task(self._prune_pending())
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        self._prune_task.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def handle(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        # Route one request; returns the status code and JSON response body
+        if path == "/availability":
+            self._require(method, "GET")
+            return 200, self._availability()
+        if path == "/preview":
+            self._require(method, "POST")
+            seat_count, starting_seat = self._parse_selection(body)
+            seats = await self._run(self.booker.plan_seats, seat_count, starting_seat)
+            return 200, {"seats": self.screening.seat_config.seat_labels(seats)}
+        if path == "/holds":
+            self._require(method, "POST")
+            return 201, await self._hold(body)
+        match = BOOKING_PATH.match(path)
+        if match is None:
+            raise ServiceError(404, f"Unknown path: {path}")
+        booking_id, action = match.groups()
+        if action is None:
+            self._require(method, "GET")
+            return 200, self._booking_details(self._find_booking(booking_id))
+        self._require(method, "POST")
+        if action == "confirm":
+            return 200, await self._confirm(booking_id)
+        return 200, await self._cancel(booking_id)
+
+    async def _hold(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        # Creates a pending booking, or changes the selection of an existing one when `booking_id` is given
+        seat_count, starting_seat = self._parse_selection(body)
+        booking_id = body.get("booking_id")
+        if booking_id is None:
+            booking = self.booker.new_booking()
+        elif booking_id in self._pending:
+            booking = self._pending[booking_id]
+        else:
+            raise ServiceError(404, f"No pending booking {booking_id}")
+        self._pending[booking.id] = booking
+        # A rejected change leaves the pending booking's current hold in place
+        try:
+            await self._run(self.booker.hold, booking, seat_count, starting_seat)
+        except Exception as error:
+            if booking_id is None:
+                del self._pending[booking.id]
+            if type(error) is ValueError:
+                # Other clients took seats after the count was checked, so the party no longer fits
+                raise ServiceError(409, str(error)) from error
+            raise
+        details = self._booking_details(booking)
+        details["expires_in"] = self.booker.hold_ttl
+        return details
+
+    async def _confirm(self, booking_id: str) -> Dict[str, Any]:
+        # Taken out of the pending bookings first, so a second confirmation for the same id cannot race this one
+        booking = self._pending.pop(booking_id, None)
+        if booking is None:
+            raise ServiceError(404, f"No pending booking {booking_id}")
+        if not self.screening.held_seats(booking.id):
+            raise ServiceError(409, f"The hold on booking {booking_id} has expired")
+        try:
+            await self._run(self.booker.save_booking, booking)
+        except Exception:
+            self._pending[booking.id] = booking
+            raise
+        return self._booking_details(booking)
+
+    async def _cancel(self, booking_id: str) -> Dict[str, Any]:
+        booking = self._pending.pop(booking_id, None)
+        if booking is not None:
+            self.booker.release_hold(booking)
+        else:
+            booking = self._find_booking(booking_id)
+            await self._run(self.booker.cancel_booking, booking)
+        return {"booking_id": booking.id, "cancelled": True}
+
+    def _availability(self) -> Dict[str, Any]:
+        seat_config = self.screening.seat_config
+        seat_map = self.screening.read_consistent(lambda: bytes(self.screening.seat_map.states))
+        return {
+            "movie": self.screening.movie.title,
+            "start_time": self.screening.start_time.isoformat(),
+            "seats_available": self.booker.seats_available,
+            "seats_held": self.screening.seats_held,
+            "version": self.screening.version,
+            # One string per row, keyed by row label: '.' free, '~' held, 'x' unavailable
+            "rows": {
+                seat_config.row_label(row): seat_map[row * seat_config.seat_count_per_row:(row + 1) * seat_config.seat_count_per_row].translate(SYMBOL_TABLE).decode("ascii")
+                for row in range(seat_config.row_count)
+            },
+        }
+
+    def _booking_details(self, booking: Booking) -> Dict[str, Any]:
+        return {"booking_id": booking.id, "seats": self.screening.seat_config.seat_labels(booking.seats), "confirmed": booking.id not in self._pending}
+
+    def _find_booking(self, booking_id: str) -> Booking:
+        booking = self._pending.get(booking_id) or self.screening.find_booking(booking_id)
+        if booking is None:
+            raise ServiceError(404, f"Booking not found: {booking_id}")
+        return booking
+
+    def _parse_selection(self, body: Dict[str, Any]) -> Tuple[int, Optional[int]]:
+        seat_count = body.get("seat_count")
+        if not isinstance(seat_count, int) or isinstance(seat_count, bool) or seat_count < 1:
+            raise ServiceError(400, "seat_count must be a positive integer")
+        booking_id = body.get("booking_id")
+        if booking_id is not None and not isinstance(booking_id, str):
+            raise ServiceError(400, "booking_id must be a string")
+        # A pending booking's own held seats count as available to its new selection
+        seats_available = self.screening.seats_free + (len(self.screening.held_seats(booking_id)) if booking_id in self._pending else 0)
+        if seat_count > seats_available:
+            raise ServiceError(409, f"Sorry, there are only {seats_available} seats available.")
+        starting_seat = body.get("starting_seat")
+        if starting_seat is None:
+            return seat_count, None
+        if not isinstance(starting_seat, str):
+            raise ServiceError(400, "starting_seat must be a seat label such as B3")
+        try:
+            seat = self.screening.seat_config.parse_seat(starting_seat)
+        except ValueError as error:
+            raise ServiceError(400, str(error)) from error
+        if not self.screening.is_seat_available(seat) and not self.screening.is_seat_held_by(seat, booking_id):
+            raise ServiceError(409, f"Seat {starting_seat} is not available")
+        return seat_count, seat
+
+    def _require(self, method: str, expected: str) -> None:
+        if method != expected:
+            raise ServiceError(405, f"Use {expected}")
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    def prune_pending(self) -> None:
+        # Drop pending bookings whose hold has expired
+        self.screening.expire_holds()
+        for booking_id in [booking_id for booking_id in self._pending if not self.screening.held_seats(booking_id)]:
+            del self._pending[booking_id]
+
+    async def _prune_pending(self) -> None:
+        while True:
+            await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
+            self.prune_pending()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # HTTP/1.1 with keep-alive: serve requests on the connection until the client closes it
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, response = await self._respond(method, path, headers, reader)
+                payload = json.dumps(response, separators=(",", ":")).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if not keep_alive or status == 413:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass  # Client went away or sent something that is not HTTP
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, headers: Dict[str, str], reader: asyncio.StreamReader) -> Tuple[int, Dict[str, Any]]:
+        try:
+            content_length = int(headers.get("content-length", 0))
+            if content_length > MAX_BODY_SIZE:
+                raise ServiceError(413, "Request body is too large")
+            body = json.loads(await reader.readexactly(content_length)) if content_length else {}
+            if not isinstance(body, dict):
+                raise ServiceError(400, "Request body must be a JSON object")
+        except ServiceError as error:
+            return error.status, {"error": str(error)}
+        except ValueError as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"Unexpected error: {error}"}
+        return await self.dispatch(method, path.split("?", 1)[0], body)
+
+    async def dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        # Like handle, but errors are turned into their status code and an error body instead of being raised
+        try:
+            return await self.handle(method, path, body)
+        except ServiceError as error:
+            return error.status, {"error": str(error)}
+        except SeatConflictError as error:
+            return 409, {"error": str(error), "seats": error.seats}
+        except ValueError as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"Unexpected error: {error}"}
@@ -0,0 +1,171 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future
+from datetime import datetime
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.booking_id_generator import BookingIdGenerator, SHARD_WORKER_IDS
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+from cinema_booking_system.service.booking_service import BookingService, PRUNE_INTERVAL_SECONDS
+
+# A request routed to a screening: (screening id, method, path, JSON body), as in the booking API
+Request = Tuple[int, str, str, Optional[Dict[str, Any]]]
+
+class InlineExecutor(Executor):
+    # Runs each call on the calling thread: a shard worker owns its screenings, so there is nothing to run alongside
+    def submit(self, function, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except BaseException as error:
+            future.set_exception(error)
+        return future
+
+def _screening_record(screening: Screening) -> Dict[str, Any]:
+    # Plain data sent to a shard worker, which rebuilds the screening on its side
+    return {
+        "id": screening.id,
+        "start_time": screening.start_time.isoformat(),
+        "hall": screening.hall,
+        "movie": screening.movie.title,
+        "row_count": screening.seat_config.row_count,
+        "seat_count_per_row": screening.seat_config.seat_count_per_row,
+        "bookings": [(booking.id, booking.seats.tolist()) for booking in screening.booking_data],
+    }
+
+def _screening_from_record(record: Dict[str, Any]) -> Screening:
+    bookings = [Booking(booking_id, seats) for booking_id, seats in record["bookings"]]
+    seat_config = SeatingConfig(record["row_count"], record["seat_count_per_row"])
+    return Screening(datetime.fromisoformat(record["start_time"]), seat_config, Movie(record["movie"]), bookings, record["id"], record["hall"])
+
+def _serve_shard(connection: Connection, db_path: Optional[str], worker_id: int) -> None:
+    # Worker process: owns the screenings routed to it and answers batches of requests until told to stop.
+    # Each screening is served by its own BookingService, driven synchronously on a private event loop.
+    # The shard's booking ids carry its own worker id, so shards sharing a database never mint the same id.
+    repository = SQLiteRepository(db_path) if db_path is not None else None
+    id_generator = BookingIdGenerator(worker_id)
+    executor = InlineExecutor()
+    services: Dict[int, BookingService] = {}
+    loop = asyncio.new_event_loop()
+    last_pruned = time.monotonic()
+
+    async def handle_all(requests: List[Request]) -> List[Tuple[int, Dict[str, Any]]]:
+        responses = []
+        for screening_id, method, path, body in requests:
+            service = services.get(screening_id)
+            if service is None:
+                responses.append((404, {"error": f"Unknown screening: {screening_id}"}))
+            else:
+                responses.append(await service.dispatch(method, path, body or {}))
+        return responses
+
+    try:
+        while True:
+            kind, payload = connection.recv()
+            if kind == "stop":
+                break
+            if kind == "add":
+                screening = _screening_from_record(payload)
+                services[screening.id] = BookingService(screening, BookingController(screening, repository, id_generator=id_generator), executor)
+                connection.send(None)
+            else:
+                connection.send(loop.run_until_complete(handle_all(payload)))
+            if time.monotonic() - last_pruned >= PRUNE_INTERVAL_SECONDS:
+                for service in services.values():
+                    service.prune_pending()
+                last_pruned = time.monotonic()
+    finally:
+        loop.close()
+        if repository is not None:
+            repository.close()
+        connection.close()
+
+class ScreeningRouter:
+    # Partitions screenings across worker processes by screening id. Each worker owns its screenings' booking state
+    # outright, so bookings for different screenings run on different cores without sharing the GIL or any locks.
+    # Requests use the booking API's methods, paths and JSON bodies, and get its status codes and responses back.
+    def __init__(self, screenings: Iterable[Screening] = (), worker_count: Optional[int] = None, db_path: Optional[str] = None, first_worker_id: int = SHARD_WORKER_IDS.start):
+        worker_count = worker_count or os.cpu_count() or 1
+        # Shard i mints booking ids under worker id first_worker_id + i, from the range reserved for shards
+        if first_worker_id not in SHARD_WORKER_IDS or first_worker_id + worker_count - 1 not in SHARD_WORKER_IDS:
+            raise ValueError(f"Shard worker ids must be between {SHARD_WORKER_IDS.start} and {SHARD_WORKER_IDS.stop - 1}")
+        self.first_worker_id = first_worker_id
+        # Workers are spawned rather than forked, so they start without copies of this process's threads and locks
+        context = multiprocessing.get_context("spawn")
+        self._connections: List[Connection] = []
+        self._processes = []
+        # One lock per worker pipe; several are always taken in worker order
+        self._locks = [threading.Lock() for _ in range(worker_count)]
+        for index in range(worker_count):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(target=_serve_shard, args=(worker_connection, db_path, first_worker_id + index), name=f"screening-shard-{index}", daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+        for screening in screenings:
+            self.add_screening(screening)
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._connections)
+
+    def shard_of(self, screening_id: int) -> int:
+        return screening_id % len(self._connections)
+
+    def add_screening(self, screening: Screening) -> None:
+        # The screening is handed to its worker, which serves it from then on
+        if screening.id is None:
+            raise ValueError("Only saved screenings (with an id) can be routed")
+        shard = self.shard_of(screening.id)
+        with self._locks[shard]:
+            self._connections[shard].send(("add", _screening_record(screening)))
+            self._connections[shard].recv()
+
+    def request(self, screening_id: int, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any]]:
+        return self.request_many([(screening_id, method, path, body)])[0]
+
+    def request_many(self, requests: Iterable[Request]) -> List[Tuple[int, Dict[str, Any]]]:
+        # Each worker gets its share of the requests in one message and they all work on them at the same time;
+        # responses come back in request order
+        batches: Dict[int, List[Tuple[int, Request]]] = {}
+        count = 0
+        for index, request in enumerate(requests):
+            batches.setdefault(self.shard_of(request[0]), []).append((index, request))
+            count += 1
+        responses: List[Tuple[int, Dict[str, Any]]] = [None] * count
+        shards = sorted(batches)
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send(("requests", [request for _, request in batches[shard]]))
+            for shard in shards:
+                for (index, _), response in zip(batches[shard], self._connections[shard].recv()):
+                    responses[index] = response
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        return responses
+
+    def close(self) -> None:
+        for lock, connection in zip(self._locks, self._connections):
+            with lock:
+                connection.send(("stop", None))
+                connection.close()
+        for process in self._processes:
+            process.join()
+
+    def __enter__(self) -> "ScreeningRouter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
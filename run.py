@@ -1,29 +1,110 @@
-from cinema_booking_system import BookingMenu, ConfigMenu
-from cinema_booking_system.models import Movie, Screening, SeatingConfig
+import argparse
+import sys
+from cinema_booking_system import metrics
+from cinema_booking_system.controllers import BookingController
+from cinema_booking_system.models import Cinema, Movie, Screening, SeatingConfig
+from cinema_booking_system.models.booking_id_generator import PROCESS_WORKER_IDS, booking_ids
+from cinema_booking_system.repositories import SQLiteRepository
 from datetime import datetime
 
+# The menus (prompt_toolkit), the command runner and the service (asyncio) are imported by the mode that uses them,
+# so short-lived headless runs do not pay for loading the interactive front-end
+
 # Check whether the script is being run directly or being imported as a module
 if __name__ == "__main__":
     
-    # This part skips all the data retrieval from backend, so you just have a config menu instead of a backend data fetch
+    parser = argparse.ArgumentParser(description="GIC Cinemas booking system")
+    parser.add_argument("--db", default="cinema.db", help="SQLite database holding screenings and bookings (default: cinema.db)")
+    parser.add_argument("--new-screening", action="store_true", help="Configure another screening even when the database already has some")
+    parser.add_argument("--hall", default="1", help="Hall of a newly configured screening (default: 1)")
+    parser.add_argument("--repaint", action="store_true", help="Redraw the seat preview in place (ANSI terminals), sending only the seats that changed")
+    parser.add_argument("--serve", action="store_true", help="Serve the booking API over HTTP instead of running the booking menu")
+    parser.add_argument("--host", default="127.0.0.1", help="Address the booking API listens on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port the booking API listens on (default: 8080)")
+    parser.add_argument("--commands", metavar="FILE", help="Run booking commands from FILE ('-' for stdin) without prompts, printing one JSON result per line")
+    parser.add_argument("--metrics", help="Record booking, display and persistence timings and export them to this file")
+    parser.add_argument("--metrics-format", choices=metrics.EXPORT_FORMATS, default="prometheus", help="Prometheus text file, or one JSON snapshot per line (default: prometheus)")
+    parser.add_argument("--metrics-interval", type=float, default=15.0, help="Seconds between metrics exports (default: 15)")
+    parser.add_argument("--worker-id", type=int, help=f"Worker id ({PROCESS_WORKER_IDS.start}-{PROCESS_WORKER_IDS.stop - 1}) embedded in new booking ids; give every process sharing a database its own (default: derived from the process id)")
+    args = parser.parse_args()
+    if args.worker_id is not None:
+        if args.worker_id not in PROCESS_WORKER_IDS:
+            parser.error(f"--worker-id must be between {PROCESS_WORKER_IDS.start} and {PROCESS_WORKER_IDS.stop - 1}")
+        booking_ids.set_worker_id(args.worker_id)
+    
+    # Metrics are off unless asked for, and then exported periodically and once more on exit
+    exporter = None
+    if args.metrics:
+        exporter = metrics.MetricsExporter(metrics.enable(), args.metrics, args.metrics_format, args.metrics_interval)
+        exporter.start()
     
-    # Run the initial config menu
-    config_menu = ConfigMenu()
-    user_input = config_menu.prompt_config()
+    # Load every screening from the database into the catalog and start with the most recent one,
+    # falling back to the config menu when there is none yet
+    repository = SQLiteRepository(args.db)
+    screening_ids = repository.list_screening_ids()
+    cinema = Cinema(repository.load_screening(screening_id) for screening_id in screening_ids)
+    screening = cinema.find_screening(screening_ids[-1]) if screening_ids and not args.new_screening else None
     
-    # Alternatively, you can replace the above steps with either of the following to skip entering configs
-    # user_input = "Down 10 10" # Test with even number of seats
-    # user_input = "Down 11 11" # Test with odd number of seats
+    if args.commands:
+        # Headless mode: the commands configure screenings themselves, so no configuration prompt is shown
+        from cinema_booking_system.command_runner import CommandRunner
+        runner = CommandRunner(screening, repository, cinema, args.hall)
+        commands = sys.stdin if args.commands == "-" else open(args.commands)
+        try:
+            failures = runner.run(commands, sys.stdout)
+        finally:
+            if commands is not sys.stdin:
+                commands.close()
+        repository.close()
+        if exporter is not None:
+            exporter.stop()
+        sys.exit(1 if failures else 0)
     
-    print(f"Configured: {user_input}")
-    parts = user_input.split()
-    title = parts[0]
-    row_count = int(parts[1])
-    seat_count_per_row = int(parts[2])
-    movie = Movie(title)
-    seating_config = SeatingConfig(row_count, seat_count_per_row)
-    screening = Screening(datetime.now(), seating_config, movie, [])
+    if screening is None:
+        # Run the initial config menu
+        from cinema_booking_system.config_menu import ConfigMenu
+        config_menu = ConfigMenu()
+        user_input = config_menu.prompt_config()
+        
+        # Alternatively, you can replace the above steps with either of the following to skip entering configs
+        # user_input = "Down 10 10" # Test with even number of seats
+        # user_input = "Down 11 11" # Test with odd number of seats
+        
+        print(f"Configured: {user_input}")
+        parts = user_input.split()
+        title = parts[0]
+        row_count = int(parts[1])
+        seat_count_per_row = int(parts[2])
+        movie = Movie(title)
+        seating_config = SeatingConfig(row_count, seat_count_per_row)
+        screening = Screening(datetime.now(), seating_config, movie, [], hall=args.hall)
+        repository.save_screening(screening)
+        cinema.add_screening(screening)
+    else:
+        print(f"Loaded: {screening.movie.title} {screening.seat_config.row_count} {screening.seat_config.seat_count_per_row}")
     
-    # Run the booking menu
-    menu = BookingMenu(screening) # normally screening details would be pulled from a database
-    menu.run()
+    if args.serve:
+        # Serve the booking API until interrupted
+        import asyncio
+        from cinema_booking_system.service import BookingService
+        
+        async def serve():
+            service = BookingService(screening, BookingController(screening, repository))
+            await service.start(args.host, args.port)
+            print(f"Serving bookings on http://{args.host}:{service.port}")
+            try:
+                await service.serve_forever()
+            finally:
+                await service.close()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+    else:
+        # Run the booking menu
+        from cinema_booking_system.booking_menu import BookingMenu
+        menu = BookingMenu(screening, repository, cinema, args.repaint)
+        menu.run()
+    repository.close()
+    if exporter is not None:
+        exporter.stop()
@@ -1,10 +1,12 @@
+import threading
 import unittest
 from unittest.mock import patch
 from datetime import datetime
 from cinema_booking_system.models.movie import Movie
-from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.screening import Screening, SeatConflictError
 from cinema_booking_system.models.seating_config import SeatingConfig
 from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.booking_request import BookingRequest
 from cinema_booking_system.booking_menu import BookingMenu
 from cinema_booking_system.controllers.booking_controller import BookingController
 
@@ -32,21 +34,26 @@ class TestBookingController(unittest.TestCase):
     def test_is_seat_booked(self):
         """Test seat booking status check."""
         # Add a booking
-        booking = Booking("GIC0001", ["A1", "A2"])
-        self.screening.booking_data.append(booking)
+        booking = Booking("GIC0001", self.seating_config.seat_ids(["A1", "A2"]))
+        self.screening.add_booking(booking)
         
         # Test booked seats
-        self.assertTrue(self.booker.is_seat_booked("A1"))
-        self.assertTrue(self.booker.is_seat_booked("A2"))
+        self.assertTrue(self.booker.is_seat_booked(self.seating_config.parse_seat("A1")))
+        self.assertTrue(self.booker.is_seat_booked(self.seating_config.parse_seat("A2")))
         
         # Test available seats
-        self.assertFalse(self.booker.is_seat_booked("A3"))
-        self.assertFalse(self.booker.is_seat_booked("B1"))
+        self.assertFalse(self.booker.is_seat_booked(self.seating_config.parse_seat("A3")))
+        self.assertFalse(self.booker.is_seat_booked(self.seating_config.parse_seat("B1")))
+        
+        # Test seats are released once the booking is removed
+        self.screening.remove_booking(booking)
+        self.assertFalse(self.booker.is_seat_booked(self.seating_config.parse_seat("A1")))
+        self.assertFalse(self.booker.is_seat_booked(self.seating_config.parse_seat("A2")))
 
     def test_select_seats_from_center(self):
         """Test center-based seat selection algorithm."""
         # Test with empty theater
-        seats = self.booker.select_seats_from_center(3, "A")
+        seats = self.seating_config.seat_labels(self.booker.select_seats_from_center(3, 0))
         self.assertEqual(len(seats), 3)
         
         # Verify seats are in the same row and centered
@@ -57,23 +64,182 @@ class TestBookingController(unittest.TestCase):
         middle_seat = sum(seat_numbers) / len(seat_numbers)
         self.assertAlmostEqual(middle_seat, 5.5, delta=2)  # Should be near center
 
+    def test_select_seats_from_center_keeps_party_together(self):
+        """Test center-based selection prefers a block of adjacent seats over splitting the party."""
+        # Leave row A with only split seats around the center
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["A3", "A6", "A8"])))
+        seats = self.seating_config.seat_labels(self.booker.select_seats_from_center(3, 0))
+        self.assertEqual(seats, ["B5", "B6", "B7"])
+
+        # A party that fits in a gap stays in the starting row
+        seats = self.seating_config.seat_labels(self.booker.select_seats_from_center(2, 0))
+        self.assertEqual(seats, ["A4", "A5"])
+
     def test_determine_seats_from_user_selection(self):
         """Test user-selected seat allocation algorithm."""
         # Test selection starting from A1
-        seats = self.booker.determine_seats_from_user_selection(3, "A1")
+        seats = self.seating_config.seat_labels(self.booker.determine_seats_from_user_selection(3, self.seating_config.parse_seat("A1")))
         self.assertEqual(len(seats), 3)
         self.assertIn("A1", seats)
         self.assertIn("A2", seats)
         self.assertIn("A3", seats)
         
         # Test with some seats already booked
-        booking = Booking("GIC0001", ["A1", "A2"])
-        self.screening.booking_data.append(booking)
-        seats = self.booker.determine_seats_from_user_selection(3, "A3")
+        booking = Booking("GIC0001", self.seating_config.seat_ids(["A1", "A2"]))
+        self.screening.add_booking(booking)
+        seats = self.seating_config.seat_labels(self.booker.determine_seats_from_user_selection(3, self.seating_config.parse_seat("A3")))
         self.assertEqual(len(seats), 3)
         self.assertNotIn("A1", seats)
         self.assertNotIn("A2", seats)
 
+    def test_save_booking(self):
+        """Test saving a booking registers its seats with the screening."""
+        booking = self.booker.new_booking()
+        booking.seats = self.seating_config.seat_ids(["C5", "C6"])
+        self.booker.save_booking(booking)
+        self.assertIn(booking, self.screening.booking_data)
+        self.assertTrue(self.booker.is_seat_booked(self.seating_config.parse_seat("C5")))
+        self.assertTrue(self.booker.is_seat_booked(self.seating_config.parse_seat("C6")))
+
+    def test_seats_available(self):
+        """Test available seat count follows bookings and cancellations exactly."""
+        self.assertEqual(self.booker.seats_available, 50)
+        booking = self.booker.new_booking()
+        booking.seats = self.booker.select_seats_from_center(4, 0)
+        self.booker.save_booking(booking)
+        self.assertEqual(self.booker.seats_available, 46)
+        self.screening.remove_booking(booking)
+        self.assertEqual(self.booker.seats_available, 50)
+
+    def test_save_booking_rejects_unavailable_seats(self):
+        """Test a booking overlapping booked seats is rejected without changing availability."""
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["A1"])))
+        booking = self.booker.new_booking()
+        booking.seats = self.seating_config.seat_ids(["A1", "A2"])
+        with self.assertRaises(ValueError):
+            self.booker.save_booking(booking)
+        self.assertEqual(self.booker.seats_available, 49)
+        self.assertFalse(self.booker.is_seat_booked(self.seating_config.parse_seat("A2")))
+
+    def test_hold_seats_until_confirmed(self):
+        """Test previewed seats are held for the booking and converted when it is saved."""
+        booking = self.booker.new_booking()
+        self.booker.hold_seats(booking, self.booker.select_seats_from_center(4, None))
+        self.assertEqual(self.booker.seats_available, 46)
+        
+        # Another seller planning at the same time skips the held seats
+        other_seats = self.booker.select_seats_from_center(4, None)
+        self.assertFalse(set(other_seats) & set(booking.seats))
+        
+        self.booker.save_booking(booking)
+        self.assertEqual(self.screening.seats_held, 0)
+        self.assertEqual(self.booker.seats_available, 46)
+
+    def test_failed_reselection_keeps_hold(self):
+        """Test changing a held selection replans with its own seats and keeps the old hold when the new one fails."""
+        booking = self.booker.new_booking()
+        self.booker.hold(booking, 48)
+        held_seats = list(booking.seats)
+        
+        # The booking's own seats count towards the new selection
+        self.booker.hold(booking, 49, self.seating_config.parse_seat("A1"))
+        self.assertEqual(len(booking.seats), 49)
+        self.booker.hold(booking, 48)
+        self.assertEqual(self.screening.held_seats(booking.id), held_seats)
+        
+        # A selection that no longer fits, or keeps conflicting, leaves the previous hold in place
+        free_seat = next(seat for seat in range(50) if self.screening.is_seat_available(seat))
+        self.screening.add_booking(Booking("OTHER", [free_seat]))
+        with self.assertRaises(ValueError):
+            self.booker.hold(booking, 50)
+        self.assertEqual(self.screening.held_seats(booking.id), held_seats)
+        with patch.object(Screening, "hold_seats", side_effect=SeatConflictError(["A2"])):
+            with self.assertRaises(SeatConflictError) as context:
+                self.booker.hold(booking, 2, self.seating_config.parse_seat("A2"))
+        self.assertEqual(context.exception.seats, ["A2"])
+        self.assertEqual(self.screening.held_seats(booking.id), held_seats)
+        self.assertEqual(list(booking.seats), held_seats)
+
+    def test_book_many(self):
+        """Test batch allocation commits every successful request and reports failures."""
+        requests = [
+            BookingRequest(10),
+            BookingRequest(3, self.seating_config.parse_seat("C1")),
+            BookingRequest(0),
+            BookingRequest(100),
+            BookingRequest(2, self.seating_config.parse_seat("C2")),
+        ]
+        result = self.booker.book_many(requests)
+        
+        self.assertEqual(len(result.results), 5)
+        self.assertEqual([failure.index for failure in result.failures], [2, 3, 4])
+        self.assertEqual(len(result.bookings), 2)
+        self.assertEqual(self.seating_config.seat_labels(result.results[1].seats), ["C1", "C2", "C3"])
+        self.assertEqual(len({booking.id for booking in result.bookings}), 2)
+        self.assertEqual(self.booker.seats_available, 37)
+        self.assertEqual(self.screening.booking_data, result.bookings)
+        
+        # Seats allocated earlier in the batch are not handed out again
+        booked_seats = [seat for booking in result.bookings for seat in booking.seats]
+        self.assertEqual(len(booked_seats), len(set(booked_seats)))
+
+    def test_reserve_replans_on_conflict(self):
+        """Test a reservation whose planned seats are taken before commit is re-planned."""
+        stale_seats = self.seating_config.seat_ids(["A5", "A6"])
+        original_select = self.booker.select_seats_from_center
+        def select_after_competing_commit(seat_count, starting_row, *args):
+            if not self.screening.booking_data:
+                # Another seller commits the planned seats between our plan and our commit
+                self.screening.add_booking(Booking("OTHER", stale_seats))
+                return list(stale_seats)
+            return original_select(seat_count, starting_row, *args)
+        
+        with patch.object(self.booker, "select_seats_from_center", side_effect=select_after_competing_commit):
+            booking = self.booker.reserve(2)
+        self.assertEqual(len(booking.seats), 2)
+        self.assertFalse(set(booking.seats) & set(stale_seats))
+        self.assertEqual(self.booker.seats_available, 46)
+
+    def test_reserve_from_many_threads(self):
+        """Test concurrent reservations never hand out the same seat twice."""
+        errors = []
+        def sell():
+            booker = BookingController(self.screening)
+            while True:
+                try:
+                    booker.reserve(2)
+                except SeatConflictError:
+                    continue
+                except ValueError:
+                    return  # Sold out
+                except Exception as error:
+                    errors.append(error)
+                    return
+        
+        threads = [threading.Thread(target=sell) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        booked_seats = [seat for booking in self.screening.booking_data for seat in booking.seats]
+        self.assertEqual(errors, [])
+        self.assertEqual(len(booked_seats), 50)
+        self.assertEqual(len(set(booked_seats)), 50)
+        self.assertEqual(self.booker.seats_available, 0)
+
+    def test_select_seats_wraps_around_from_last_row(self):
+        """Test selection starting from the last row wraps back to the first row."""
+        seats = self.seating_config.seat_labels(self.booker.determine_seats_from_user_selection(3, self.seating_config.parse_seat("E9")))
+        self.assertEqual(seats[:2], ["E9", "E10"])
+        self.assertTrue(seats[2].startswith("A"))
+
+    def test_determine_seats_skips_booked_seats_in_first_row(self):
+        """Test booked seats to the right of the chosen seat are skipped."""
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["A4"])))
+        seats = self.seating_config.seat_labels(self.booker.determine_seats_from_user_selection(3, self.seating_config.parse_seat("A3")))
+        self.assertEqual(seats, ["A3", "A5", "A6"])
+
 if __name__ == '__main__':
     unittest.main()
     
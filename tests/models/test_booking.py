@@ -4,9 +4,20 @@ from cinema_booking_system.models.booking import Booking
 class TestBooking(unittest.TestCase):
     def test_booking_creation(self):
         """Object Creation: Booking"""
-        booking = Booking('GIC0001', ["A1", "A2"])
+        booking = Booking('GIC0001', [0, 1])
         self.assertEqual(booking.id, "GIC0001")
-        self.assertEqual(booking.seats, ["A1", "A2"])
+        self.assertEqual(booking.seats.tolist(), [0, 1])
+
+    def test_booking_seats_are_packed(self):
+        """Memory Layout: Booking keeps no instance dict and packs its seat ids"""
+        booking = Booking('GIC0001', [0, 1])
+        self.assertFalse(hasattr(booking, "__dict__"))
+        self.assertEqual(booking.seats.typecode, "H")
+        
+        # Seat ids past 65535 (halls over 65,536 seats) need the wider typecode
+        booking.seats = [1, 70000]
+        self.assertEqual(booking.seats.typecode, "I")
+        self.assertEqual(booking.seats.tolist(), [1, 70000])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
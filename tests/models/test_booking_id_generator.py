@@ -0,0 +1,54 @@
+import threading
+import unittest
+from cinema_booking_system.models.booking_id_generator import BookingIdGenerator, PROCESS_WORKER_IDS
+
+class TestBookingIdGenerator(unittest.TestCase):
+    def test_ids_are_unique_and_sorted(self):
+        """Booking Ids: Ids never repeat and sort in the order they were generated"""
+        generator = BookingIdGenerator(worker_id=1)
+        ids = [generator.next_id() for _ in range(10000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(sorted(ids), ids)
+        self.assertTrue(all(booking_id.startswith("GIC") and len(booking_id) == 16 for booking_id in ids))
+
+    def test_clock_going_backwards(self):
+        """Booking Ids: Ids keep increasing when the clock steps back"""
+        now = [1800000000.0]
+        generator = BookingIdGenerator(worker_id=1, clock=lambda: now[0])
+        first = generator.next_id()
+        now[0] -= 5
+        self.assertGreater(generator.next_id(), first)
+
+    def test_workers_do_not_collide(self):
+        """Booking Ids: Generators with different worker ids never produce the same id"""
+        clock = lambda: 1800000000.0
+        first, second = BookingIdGenerator(worker_id=1, clock=clock), BookingIdGenerator(worker_id=2, clock=clock)
+        ids = [generator.next_id() for generator in (first, second) for _ in range(5000)]
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_worker_id_range(self):
+        """Booking Ids: Worker ids outside the 10-bit range are rejected instead of wrapping onto another worker's"""
+        with self.assertRaises(ValueError):
+            BookingIdGenerator(worker_id=1024)
+        generator = BookingIdGenerator()
+        self.assertIn(generator.worker_id, PROCESS_WORKER_IDS)
+        generator.set_worker_id(3)
+        self.assertEqual(generator.worker_id, 3)
+        with self.assertRaises(ValueError):
+            generator.set_worker_id(-1)
+
+    def test_thread_safety(self):
+        """Booking Ids: Threads sharing a generator never get the same id"""
+        generator = BookingIdGenerator(worker_id=1)
+        ids = []
+        def generate():
+            ids.extend(generator.next_id() for _ in range(2000))
+        threads = [threading.Thread(target=generate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(ids)), 16000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.cinema import Cinema
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+
+class TestCinema(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.seating_config = SeatingConfig(2, 5)
+        self.morning = Screening(datetime(2025, 2, 8, 10, 0), self.seating_config, Movie("Dune"), [], 1, "1")
+        self.evening = Screening(datetime(2025, 2, 8, 19, 30), self.seating_config, Movie("Dune"), [], 2, "2")
+        self.full = Screening(datetime(2025, 2, 8, 14, 0), self.seating_config, Movie("Dune"), [Booking("GIC0001", range(9))], 3, "1")
+        self.other = Screening(datetime(2025, 2, 8, 12, 0), self.seating_config, Movie("Heat"), [], 4, "2")
+        self.cinema = Cinema([self.evening, self.full, self.morning, self.other])
+
+    def test_screenings_are_sorted(self):
+        """Cinema: Screenings are kept in start time order"""
+        self.assertEqual(self.cinema.screenings, [self.morning, self.other, self.full, self.evening])
+        self.assertEqual(self.cinema.movies, ["Dune", "Heat"])
+        self.assertEqual(self.cinema.halls, ["1", "2"])
+        self.assertIs(self.cinema.find_screening(3), self.full)
+
+    def test_screenings_between(self):
+        """Cinema: Shows of a movie, or in a hall, within a time range"""
+        self.assertEqual(self.cinema.screenings_between(datetime(2025, 2, 8, 11, 0), datetime(2025, 2, 8, 20, 0), "Dune"), [self.full, self.evening])
+        self.assertEqual(self.cinema.screenings_between(datetime(2025, 2, 8), datetime(2025, 2, 9), hall="2"), [self.other, self.evening])
+        self.assertEqual(self.cinema.screenings_between(datetime(2025, 2, 8), datetime(2025, 2, 9), "Dune", "1"), [self.morning, self.full])
+        self.assertEqual(self.cinema.screenings_between(datetime(2025, 2, 8), datetime(2025, 2, 9), "Alien"), [])
+
+    def test_next_screening_with_seats(self):
+        """Cinema: Next show with enough free seats skips fuller ones"""
+        self.assertIs(self.cinema.next_screening_with_seats(2, datetime(2025, 2, 8, 11, 0), "Dune"), self.evening)
+        self.assertIs(self.cinema.next_screening_with_seats(1, datetime(2025, 2, 8, 11, 0), "Dune"), self.full)
+        self.assertIs(self.cinema.next_screening_with_seats(2, datetime(2025, 2, 8, 11, 0)), self.other)
+        self.assertIsNone(self.cinema.next_screening_with_seats(11, datetime(2025, 2, 8)))
+
+    def test_next_screening_follows_bookings(self):
+        """Cinema: The next show with enough free seats follows bookings, cancellations and holds"""
+        after = datetime(2025, 2, 8, 11, 0)
+        self.assertIs(self.cinema.next_screening_with_seats(2, after, "Dune"), self.evening)
+        self.evening.hold_seats("GIC0002", range(9), ttl=60)
+        self.assertIsNone(self.cinema.next_screening_with_seats(2, after, "Dune"))
+        self.evening.release_hold("GIC0002")
+        booking = Booking("GIC0003", range(9))
+        self.evening.add_booking(booking)
+        self.assertIsNone(self.cinema.next_screening_with_seats(2, after, "Dune"))
+        self.assertIs(self.cinema.next_screening_with_seats(1, after, "Dune", "2"), self.evening)
+        self.evening.remove_booking(booking)
+        self.assertIs(self.cinema.next_screening_with_seats(10, after, hall="2"), self.other)
+        self.cinema.remove_screening(self.other)
+        self.assertIs(self.cinema.next_screening_with_seats(10, after, hall="2"), self.evening)
+
+    def test_remove_screening(self):
+        """Cinema: Removed screenings leave every index"""
+        self.cinema.remove_screening(self.other)
+        self.assertEqual(self.cinema.movies, ["Dune"])
+        self.assertEqual(self.cinema.screenings_between(datetime(2025, 2, 8), datetime(2025, 2, 9), hall="2"), [self.evening])
+        self.assertIsNone(self.cinema.find_screening(4))
+
+    def test_availability_summary(self):
+        """Cinema: Availability summaries are cached until the screening changes"""
+        summary = self.cinema.availability(self.full)
+        self.assertEqual((summary.seats_free, summary.largest_free_block, summary.sold_out), (1, 1, False))
+        self.assertIs(self.cinema.availability(self.full), summary)
+        self.full.add_booking(Booking("GIC0002", [9]))
+        summary = self.cinema.availability(self.full)
+        self.assertEqual((summary.seats_free, summary.largest_free_block, summary.sold_out), (0, 0, True))
+        self.assertEqual(self.cinema.availability(self.morning).largest_free_block, 5)
+        self.assertIs(self.cinema.next_screening_with_seats(1, datetime(2025, 2, 8, 11, 0), "Dune"), self.evening)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from cinema_booking_system.models.free_run_index import FreeRunIndex
+
+class TestFreeRunIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.index = FreeRunIndex(3, 10)
+
+    def test_index_creation(self):
+        """Object Creation: FreeRunIndex"""
+        self.assertEqual(self.index.runs(0), [(0, 10)])
+        self.assertEqual(self.index.largest_run(2), 10)
+        self.assertEqual(self.index.largest_run(), 10)
+
+    def test_occupy_and_release(self):
+        """Free Runs: runs are split on occupy and merged back on release"""
+        self.index.occupy(0, 4)
+        self.index.occupy(0, 0)
+        self.assertEqual(self.index.runs(0), [(1, 4), (5, 10)])
+        self.assertEqual(self.index.largest_run(0), 5)
+        self.index.release(0, 4)
+        self.assertEqual(self.index.runs(0), [(1, 10)])
+        self.index.release(0, 0)
+        self.assertEqual(self.index.runs(0), [(0, 10)])
+
+    def test_find_row(self):
+        """Free Runs: finds the first row (wrapping) with a run long enough"""
+        for column in (3, 7):
+            self.index.occupy(0, column)
+            self.index.occupy(1, column)
+        self.assertEqual(self.index.find_row(4, 0), 2)
+        self.assertEqual(self.index.find_row(3, 1), 1)
+        self.assertEqual(self.index.find_row(11, 0), None)
+
+    def test_closest_block_to_center(self):
+        """Free Runs: picks the block of adjacent seats closest to the center"""
+        self.assertEqual(self.index.closest_block_to_center(0, 3), 4)
+        self.index.occupy(0, 5)
+        self.assertEqual(self.index.closest_block_to_center(0, 3), 6)
+        self.assertEqual(self.index.closest_block_to_center(0, 6), None)
+
+    def test_closest_block_in_fragmented_row(self):
+        """Free Runs: a row split into many runs finds the nearest fitting block on either side of the center"""
+        index = FreeRunIndex(1, 40)
+        for column in range(0, 40, 2):
+            index.occupy(0, column)
+        for column in (2, 4, 30, 32):
+            index.release(0, column)
+        self.assertEqual(index.runs(0)[0], (1, 6))
+        self.assertEqual(index.closest_block_to_center(0, 5), 29)
+        self.assertEqual(index.closest_block_to_center(0, 1), 21)
+        self.assertIsNone(index.closest_block_to_center(0, 6))
+        index.release(0, 20)
+        self.assertEqual(index.closest_block_to_center(0, 3), 19)
+
+if __name__ == '__main__':
+    unittest.main()
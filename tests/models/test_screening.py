@@ -1,8 +1,10 @@
+import time
 import unittest
 from datetime import datetime
 from cinema_booking_system.models.seating_config import SeatingConfig
 from cinema_booking_system.models.movie import Movie
-from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.screening import Screening, SeatConflictError
+from cinema_booking_system.models.booking import Booking
 
 class TestScreening(unittest.TestCase):
     def test_screening_creation(self):
@@ -15,5 +17,88 @@ class TestScreening(unittest.TestCase):
         self.assertEqual(screening.seat_config.row_count, 10)
         self.assertEqual(screening.seat_config._seat_count_per_row, 10)
 
+    def test_seat_occupancy_index(self):
+        """Seat Index: Screening tracks booked seats across add/remove"""
+        seating_config = SeatingConfig(10, 10)
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), [Booking("GIC0001", seating_config.seat_ids(["A1"]))])
+        self.assertTrue(screening.is_seat_booked(seating_config.parse_seat("A1")))
+        booking = Booking("GIC0002", seating_config.seat_ids(["B1", "B2"]))
+        screening.add_booking(booking)
+        self.assertTrue(screening.is_seat_booked(seating_config.parse_seat("B2")))
+        screening.remove_booking(booking)
+        self.assertFalse(screening.is_seat_booked(seating_config.parse_seat("B2")))
+        self.assertTrue(screening.is_seat_booked(seating_config.parse_seat("A1")))
+
+    def test_find_booking(self):
+        """Booking Index: Bookings are found by id across add/remove"""
+        seating_config = SeatingConfig(10, 10)
+        existing = Booking("GIC0001", seating_config.seat_ids(["A1"]))
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), [existing])
+        self.assertIs(screening.find_booking("GIC0001"), existing)
+        booking = Booking("GIC0002", seating_config.seat_ids(["B1"]))
+        screening.add_booking(booking)
+        self.assertIs(screening.find_booking("GIC0002"), booking)
+        with self.assertRaises(ValueError):
+            screening.add_booking(Booking("GIC0002", seating_config.seat_ids(["C1"])))
+        self.assertFalse(screening.is_seat_booked(seating_config.parse_seat("C1")))
+        screening.remove_booking(booking)
+        self.assertIsNone(screening.find_booking("GIC0002"))
+
+    def test_remove_unknown_booking(self):
+        """Booking Index: Removing a booking the screening does not have is rejected, keeping the others in order"""
+        seating_config = SeatingConfig(10, 10)
+        bookings = [Booking(f"GIC000{number}", seating_config.seat_ids([f"A{number}"])) for number in range(1, 4)]
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), bookings)
+        with self.assertRaisesRegex(ValueError, "GIC0009"):
+            screening.remove_booking(Booking("GIC0009", seating_config.seat_ids(["A1"])))
+        self.assertTrue(screening.is_seat_booked(seating_config.parse_seat("A1")))
+        screening.remove_booking(bookings[1])
+        self.assertEqual(screening.booking_data, [bookings[0], bookings[2]])
+        self.assertEqual(screening.latest_booking_ids(5), ["GIC0003", "GIC0001"])
+
+    def test_hold_seats(self):
+        """Seat Holds: Held seats are unavailable to others until released or expired"""
+        seating_config = SeatingConfig(10, 10)
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), [])
+        now = time.monotonic()
+        screening.hold_seats("GIC0001", seating_config.seat_ids(["A1", "A2"]), 60, now)
+        self.assertEqual(screening.seats_free, 98)
+        self.assertEqual(screening.seats_held, 2)
+        self.assertTrue(screening.is_seat_held_by(seating_config.parse_seat("A1"), "GIC0001"))
+        with self.assertRaises(SeatConflictError):
+            screening.hold_seats("GIC0002", seating_config.seat_ids(["A2", "A3"]), 60, now)
+        with self.assertRaises(SeatConflictError):
+            screening.add_booking(Booking("GIC0002", seating_config.seat_ids(["A1"])))
+        
+        # Holding again replaces the previous hold
+        screening.hold_seats("GIC0001", seating_config.seat_ids(["A2", "A3"]), 60, now)
+        self.assertTrue(screening.is_seat_available(seating_config.parse_seat("A1")))
+        self.assertEqual(screening.held_seats("GIC0001"), seating_config.seat_ids(["A2", "A3"]))
+        
+        self.assertTrue(screening.release_hold("GIC0001"))
+        self.assertFalse(screening.release_hold("GIC0001"))
+        self.assertEqual(screening.seats_free, 100)
+
+    def test_hold_expires(self):
+        """Seat Holds: Holds are released once their TTL passes"""
+        seating_config = SeatingConfig(10, 10)
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), [])
+        now = time.monotonic()
+        screening.hold_seats("GIC0001", seating_config.seat_ids(["A1"]), 30, now)
+        self.assertEqual(screening.expire_holds(now + 10), [])
+        self.assertEqual(screening.expire_holds(now + 31), ["GIC0001"])
+        self.assertEqual(screening.seats_free, 100)
+        self.assertEqual(screening.seats_held, 0)
+
+    def test_hold_converts_into_booking(self):
+        """Seat Holds: A booking can take the seats held under its own id"""
+        seating_config = SeatingConfig(10, 10)
+        screening = Screening(datetime(2025, 2, 8, 19, 30), seating_config, Movie("John Wick"), [])
+        screening.hold_seats("GIC0001", seating_config.seat_ids(["A1", "A2"]), 60)
+        screening.add_booking(Booking("GIC0001", seating_config.seat_ids(["A1", "A2"])))
+        self.assertTrue(screening.is_seat_booked(seating_config.parse_seat("A1")))
+        self.assertEqual(screening.seats_held, 0)
+        self.assertEqual(screening.seats_free, 98)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import unittest
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.models.seat_map import SeatMap, FREE, HELD, BOOKED
+
+class TestSeatMap(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.seating_config = SeatingConfig(3, 10)
+        self.seat_map = SeatMap(self.seating_config)
+
+    def test_seat_map_creation(self):
+        """Object Creation: SeatMap"""
+        self.assertEqual(self.seat_map.count(FREE), 30)
+        self.assertEqual(self.seat_map.states.shape, (3, 10))
+        self.assertEqual(self.seat_map.states[1, 2], FREE)
+
+    def test_set_states(self):
+        """Seat States: counts follow state changes per row and overall"""
+        self.seat_map.set_states(self.seating_config.seat_ids(["B1", "B2"]), BOOKED)
+        self.seat_map.set_state(self.seating_config.parse_seat("C5"), HELD)
+        self.assertEqual(self.seat_map.states[1, 0], BOOKED)
+        self.assertEqual(self.seat_map.count(FREE), 27)
+        self.assertEqual(self.seat_map.count_in_row(1), 8)
+        self.assertEqual(self.seat_map.count_in_row(2, HELD), 1)
+        self.assertEqual(self.seat_map.rows_with_free_seats(10), [0])
+        self.assertEqual(self.seat_map.largest_free_block(1), 8)
+        self.seat_map.set_states(self.seating_config.seat_ids(["B1", "B2"]), FREE)
+        self.assertEqual(self.seat_map.free_count, 29)
+        self.assertEqual(self.seat_map.count_in_row(1), 10)
+
+    def test_bulk_set_states(self):
+        """Seat States: large changes rebuild rows in bulk with the same counters and runs as seat-by-seat changes"""
+        seating_config = SeatingConfig(20, 30)
+        bulk, single = SeatMap(seating_config), SeatMap(seating_config)
+        seats = list(range(0, 600, 3)) + [31, 32, 299]
+        bulk.set_states(seats, BOOKED)
+        for seat in seats:
+            single.set_state(seat, BOOKED)
+        bulk.set_states(range(60, 150), FREE)
+        for seat in range(60, 150):
+            single.set_state(seat, FREE)
+        self.assertEqual(bulk.states.tobytes(), single.states.tobytes())
+        self.assertEqual(bulk.free_count, single.free_count)
+        for row in range(20):
+            self.assertEqual(bulk.count_in_row(row), single.count_in_row(row))
+            self.assertEqual(bulk.free_runs.runs(row), single.free_runs.runs(row))
+            self.assertEqual(bulk.largest_free_block(row), single.largest_free_block(row))
+        self.assertEqual(bulk.find_free_block(5), single.find_free_block(5))
+
+    def test_free_seats_from_center(self):
+        """Seat Selection: free seats are returned in center-out order"""
+        self.assertEqual(self.seating_config.seat_labels(self.seat_map.free_seats_from_center(0, 10)),
+                         ["A6", "A7", "A5", "A8", "A4", "A9", "A3", "A10", "A2", "A1"])
+        self.seat_map.set_states(self.seating_config.seat_ids(["A6", "A8"]), BOOKED)
+        self.assertEqual(self.seating_config.seat_labels(self.seat_map.free_seats_from_center(0, 3)), ["A7", "A5", "A4"])
+
+    def test_free_seats_from_center_odd_row(self):
+        """Seat Selection: center-out order for an odd number of seats per row"""
+        seating_config = SeatingConfig(1, 5)
+        seat_map = SeatMap(seating_config)
+        self.assertEqual(seating_config.seat_labels(seat_map.free_seats_from_center(0, 5)), ["A3", "A4", "A2", "A5", "A1"])
+
+    def test_copy(self):
+        """Snapshot: copies do not share state with the original"""
+        snapshot = self.seat_map.copy()
+        snapshot.set_state(0, BOOKED)
+        self.assertTrue(self.seat_map.is_free(0))
+        self.assertFalse(snapshot.is_free(0))
+
+if __name__ == '__main__':
+    unittest.main()
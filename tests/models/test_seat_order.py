@@ -0,0 +1,31 @@
+import unittest
+from cinema_booking_system.models.seat_order import CenterOutOrder, center_out_order
+
+class TestCenterOutOrder(unittest.TestCase):
+    def test_order_creation(self):
+        """Object Creation: CenterOutOrder"""
+        self.assertEqual(CenterOutOrder(5).columns.tolist(), [2, 3, 1, 4, 0])
+        self.assertEqual(CenterOutOrder(4).columns.tolist(), [2, 3, 1, 0])
+        self.assertEqual(CenterOutOrder(4).ranks.tolist(), [3, 2, 0, 1])
+
+    def test_order_is_shared(self):
+        """Flyweight: one order per row length"""
+        self.assertIs(center_out_order(10), center_out_order(10))
+        self.assertIsNot(center_out_order(10), center_out_order(11))
+
+    def test_first_free(self):
+        """Center-Out Order: free seats closest to the center, in a mostly free and a nearly full row"""
+        order = CenterOutOrder(10)
+        row_states = bytearray(10)
+        row_states[5] = 2
+        self.assertEqual(order.first_free(row_states, 9, 3), [6, 4, 7])
+
+        # Only two free seats left: found with bytes.find and ranked instead of walking the order
+        order = CenterOutOrder(40)
+        row_states = bytearray([2] * 40)
+        row_states[1] = row_states[25] = 0
+        self.assertEqual(order.first_free(row_states, 2, 3), [25, 1])
+        self.assertEqual(order.first_free(row_states, 2, 1), [25])
+
+if __name__ == '__main__':
+    unittest.main()
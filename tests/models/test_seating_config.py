@@ -8,5 +8,32 @@ class TestSeatingConfig(unittest.TestCase):
         self.assertEqual(seat_config.row_count, 10)
         self.assertEqual(seat_config._seat_count_per_row, 10)
 
+    def test_seat_label_codec(self):
+        """Seat Codec: SeatingConfig converts between seat labels and seat ids"""
+        seat_config = SeatingConfig(5, 12)
+        self.assertEqual(seat_config.parse_seat("A1"), 0)
+        self.assertEqual(seat_config.parse_seat("b7"), 18)
+        self.assertEqual(seat_config.seat_label(18), "B7")
+        self.assertEqual(seat_config.seat_labels(seat_config.seat_ids(["E12", "C10"])), ["E12", "C10"])
+        with self.assertRaises(ValueError):
+            seat_config.parse_seat("12")
+        with self.assertRaises(ValueError):
+            seat_config.parse_seat("A13")
+        with self.assertRaises(ValueError):
+            seat_config.parse_seat("F1")
+
+    def test_multi_letter_row_labels(self):
+        """Seat Codec: Rows past Z are labelled AA, AB, ... like spreadsheet columns"""
+        seat_config = SeatingConfig(800, 10)
+        self.assertEqual([seat_config.row_label(row) for row in (0, 25, 26, 27, 51, 701, 702)], ["A", "Z", "AA", "AB", "AZ", "ZZ", "AAA"])
+        for row in range(800):
+            self.assertEqual(seat_config.parse_row(seat_config.row_label(row)), row)
+        self.assertEqual(seat_config.parse_seat("ab10"), 27 * 10 + 9)
+        self.assertEqual(seat_config.seat_label(27 * 10 + 9), "AB10")
+        with self.assertRaises(ValueError):
+            seat_config.parse_seat("A-1")
+        with self.assertRaises(ValueError):
+            seat_config.parse_seat("ZZZ1")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
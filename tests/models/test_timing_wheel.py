@@ -0,0 +1,37 @@
+import unittest
+from cinema_booking_system.models.timing_wheel import TimingWheel
+
+class TestTimingWheel(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.wheel = TimingWheel(tick=1.0, slot_count=8, clock=lambda: self.now)
+
+    def test_advance_returns_expired_keys(self):
+        """Timing Wheel: Timers expire once their delay has passed"""
+        self.wheel.schedule("GIC0001", 2)
+        self.wheel.schedule("GIC0002", 5)
+        self.assertEqual(self.wheel.advance(1.5), [])
+        self.assertEqual(self.wheel.advance(2.0), ["GIC0001"])
+        self.assertNotIn("GIC0001", self.wheel)
+        self.assertEqual(self.wheel.advance(5.0), ["GIC0002"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_cancel_and_reschedule(self):
+        """Timing Wheel: Cancelled timers never fire and rescheduling replaces the old timer"""
+        self.wheel.schedule("GIC0001", 2)
+        self.assertTrue(self.wheel.cancel("GIC0001"))
+        self.assertFalse(self.wheel.cancel("GIC0001"))
+        self.wheel.schedule("GIC0002", 2)
+        self.wheel.schedule("GIC0002", 4)
+        self.assertEqual(self.wheel.advance(3.0), [])
+        self.assertEqual(self.wheel.advance(4.0), ["GIC0002"])
+
+    def test_delay_longer_than_one_revolution(self):
+        """Timing Wheel: Timers further away than the wheel's span wait for their own revolution"""
+        self.wheel.schedule("GIC0001", 20)
+        self.assertEqual(self.wheel.advance(12.0), [])
+        self.assertEqual(self.wheel.advance(19.0), [])
+        self.assertEqual(self.wheel.advance(40.0), ["GIC0001"])
+
+if __name__ == '__main__':
+    unittest.main()
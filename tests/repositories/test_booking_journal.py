@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.repositories.booking_journal import BookingJournal
+
+class TestBookingJournal(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.seating_config = SeatingConfig(5, 10)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), [], 7)
+        self.journal = BookingJournal(self.directory.name, snapshot_interval=5)
+        self.journal.start(self.screening)
+        self.booker = BookingController(self.screening, journal=self.journal)
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def book(self, seat_count: int) -> Booking:
+        booking = self.booker.new_booking()
+        booking.seats = self.booker.select_seats_from_center(seat_count, None)
+        self.booker.save_booking(booking)
+        return booking
+
+    def recover(self) -> Screening:
+        self.journal.close()
+        self.journal = BookingJournal(self.directory.name, snapshot_interval=5)
+        return self.journal.recover()
+
+    def test_recover_from_journal(self):
+        """Journal: confirmed bookings and cancellations are replayed on recovery"""
+        first = self.book(2)
+        self.book(3)
+        self.booker.cancel_booking(first)
+        
+        recovered = self.recover()
+        self.assertEqual(recovered.id, 7)
+        self.assertEqual(recovered.movie.title, "TestMovie")
+        self.assertEqual([booking.id for booking in recovered.booking_data], [b.id for b in self.screening.booking_data])
+        self.assertEqual(recovered.seats_free, 47)
+
+    def test_recover_from_snapshot_and_tail(self):
+        """Journal: snapshots cover older records and only the tail is replayed"""
+        for _ in range(6):
+            self.book(1)
+        self.assertLess(self.journal._records_since_snapshot, 5)
+        recovered = self.recover()
+        self.assertEqual(recovered.seats_free, 44)
+        self.assertEqual(len(recovered.booking_data), 6)
+
+    def test_recover_ignores_torn_tail(self):
+        """Journal: a partially written record at the end of the journal is discarded"""
+        self.book(2)
+        self.journal.close()
+        with open(self.journal.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"type":"seats-confirmed","booking_id":"GIC9')
+        recovered = self.recover()
+        self.assertEqual(recovered.seats_free, 48)
+        
+        # New records are appended after the last complete record
+        booker = BookingController(recovered, journal=self.journal)
+        booking = booker.new_booking()
+        booking.seats = booker.select_seats_from_center(1, None)
+        booker.save_booking(booking)
+        self.assertEqual(self.recover().seats_free, 47)
+
+    def test_recover_without_snapshot(self):
+        """Journal: an empty directory has nothing to recover"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(BookingJournal(directory).recover())
+
+    def test_journal_must_be_started(self):
+        """Journal: a journal that was neither started nor recovered is rejected up front"""
+        with tempfile.TemporaryDirectory() as directory:
+            journal = BookingJournal(directory)
+            self.assertFalse(journal.started)
+            with self.assertRaises(ValueError):
+                BookingController(self.screening, journal=journal)
+            with self.assertRaises(ValueError):
+                journal.record_booking_created(Booking("GIC0001", []))
+
+if __name__ == '__main__':
+    unittest.main()
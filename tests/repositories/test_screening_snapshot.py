@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seat_map import FREE, BOOKED, HELD
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.repositories.screening_snapshot import ScreeningSnapshot, write_snapshot
+
+def free_seats_in_snapshot(path: str) -> int:
+    with ScreeningSnapshot(path) as snapshot:
+        return snapshot.seats_free
+
+class TestScreeningSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "screening.snapshot")
+        self.seating_config = SeatingConfig(5, 10)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), [], 7, "IMAX")
+        self.screening.add_booking(Booking("GIC0002", self.seating_config.seat_ids(["A1", "A2"])))
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["E10"])))
+        self.screening.hold_seats("GIC0003", self.seating_config.seat_ids(["C5"]), 300)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_availability_is_read_from_the_mapped_file(self):
+        """Snapshot Test: Availability, seat states and bookings are read without loading the screening"""
+        write_snapshot(self.screening, self.path)
+        with ScreeningSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.id, 7)
+            self.assertEqual(snapshot.hall, "IMAX")
+            self.assertEqual(snapshot.movie_title, "TestMovie")
+            self.assertEqual(snapshot.start_time, datetime(2024, 1, 1, 12, 0))
+            self.assertEqual(snapshot.seats_free, 46)
+            self.assertEqual(snapshot.seats_free_in_row(0), 8)
+            self.assertEqual(snapshot.seats_free_in_row(2), 9)
+            self.assertEqual(snapshot.state(self.seating_config.parse_seat("A2")), BOOKED)
+            self.assertEqual(snapshot.state(self.seating_config.parse_seat("C5")), HELD)
+            self.assertTrue(snapshot.is_seat_available(self.seating_config.parse_seat("A3")))
+            
+            # The 2-D view matches the live seat map byte for byte
+            states = snapshot.states
+            self.assertEqual(states.shape, (5, 10))
+            self.assertEqual(states[0, 1], BOOKED)
+            self.assertEqual(states[1, 0], FREE)
+            self.assertEqual(states.tobytes(), self.screening.seat_map.states.tobytes())
+            states.release()
+            
+            self.assertEqual(snapshot.booking_ids(), ["GIC0001", "GIC0002"])
+            self.assertEqual(snapshot.find_booking("GIC0002").seats.tolist(), self.seating_config.seat_ids(["A1", "A2"]))
+            self.assertIsNone(snapshot.find_booking("GIC0003"))
+
+    def test_load(self):
+        """Snapshot Test: Rebuild the screening with its bookings"""
+        write_snapshot(self.screening, self.path)
+        with ScreeningSnapshot(self.path) as snapshot:
+            screening = snapshot.load()
+        self.assertEqual((screening.id, screening.hall, screening.movie.title), (7, "IMAX", "TestMovie"))
+        self.assertEqual(screening.seats_free, 47)  # holds are not kept
+        self.assertEqual(screening.find_booking("GIC0001").seats.tolist(), self.seating_config.seat_ids(["E10"]))
+
+    def test_snapshot_is_replaced_atomically(self):
+        """Snapshot Test: An open snapshot keeps reading its version after the file is rewritten"""
+        write_snapshot(self.screening, self.path)
+        with ScreeningSnapshot(self.path) as old_snapshot:
+            self.screening.add_booking(Booking("GIC0004", self.seating_config.seat_ids(["B1", "B2", "B3"])))
+            write_snapshot(self.screening, self.path)
+            self.assertEqual(old_snapshot.seats_free, 46)
+            with ScreeningSnapshot(self.path) as new_snapshot:
+                self.assertEqual(new_snapshot.seats_free, 43)
+
+    def test_snapshot_shared_with_other_processes(self):
+        """Snapshot Test: Other processes read the same file"""
+        write_snapshot(self.screening, self.path)
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            self.assertEqual(pool.map(free_seats_in_snapshot, [self.path, self.path]), [46, 46])
+
+    def test_rejects_other_files(self):
+        """Snapshot Test: Files that are not snapshots are rejected"""
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"\0" * 256)
+        with self.assertRaises(ValueError):
+            ScreeningSnapshot(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import sqlite3
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+
+class TestSQLiteRepository(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cinema.db")
+        self.repository = SQLiteRepository(self.path, pool_size=2)
+        self.seating_config = SeatingConfig(5, 10)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), [])
+        self.repository.save_screening(self.screening)
+
+    def tearDown(self):
+        self.repository.close()
+        self.directory.cleanup()
+
+    def test_save_and_load_screening(self):
+        """Persistence: a screening and its bookings survive a reload"""
+        booking = Booking("GIC0001", self.seating_config.seat_ids(["A1", "A2"]))
+        self.screening.add_booking(booking)
+        self.repository.save_booking(self.screening, booking)
+        self.repository.close()
+        
+        self.repository = SQLiteRepository(self.path)
+        self.assertEqual(self.repository.list_screening_ids(), [self.screening.id])
+        loaded = self.repository.load_screening(self.screening.id)
+        self.assertEqual(loaded.movie.title, "TestMovie")
+        self.assertEqual(loaded.start_time, datetime(2024, 1, 1, 12, 0))
+        self.assertEqual(loaded.seat_config.row_count, 5)
+        self.assertEqual([b.id for b in loaded.booking_data], ["GIC0001"])
+        self.assertEqual(self.seating_config.seat_labels(loaded.booking_data[0].seats), ["A1", "A2"])
+        self.assertEqual(loaded.seats_free, 48)
+
+    def test_screening_hall(self):
+        """Persistence: screenings keep the hall they are shown in"""
+        screening = Screening(datetime(2024, 1, 1, 15, 0), self.seating_config, Movie("TestMovie"), [], hall="3")
+        self.repository.save_screening(screening)
+        self.assertEqual(self.repository.load_screening(screening.id).hall, "3")
+        self.assertEqual(self.repository.load_screening(self.screening.id).hall, "1")
+
+    def test_seat_unique_constraint(self):
+        """Persistence: the same seat cannot be saved twice for a screening"""
+        self.repository.save_booking(self.screening, Booking("GIC0001", self.seating_config.seat_ids(["A1"])))
+        with self.assertRaises(ValueError):
+            self.repository.save_booking(self.screening, Booking("GIC0002", self.seating_config.seat_ids(["A2", "A1"])))
+        loaded = self.repository.load_screening(self.screening.id)
+        self.assertEqual([b.id for b in loaded.booking_data], ["GIC0001"])
+
+    def test_controller_persists_bookings(self):
+        """Persistence: BookingController writes confirmations and cancellations through the repository"""
+        booker = BookingController(self.screening, self.repository)
+        booking = booker.new_booking()
+        booking.seats = booker.select_seats_from_center(3, None)
+        booker.save_booking(booking)
+        self.assertEqual(self.repository.load_screening(self.screening.id).seats_free, 47)
+        booker.cancel_booking(booking)
+        self.assertEqual(self.repository.load_screening(self.screening.id).seats_free, 50)
+
+    def test_failed_cancellation_keeps_booking(self):
+        """Persistence: a cancellation the database rejects leaves the booking's seats booked in memory too"""
+        booker = BookingController(self.screening, self.repository)
+        booking = booker.new_booking()
+        booking.seats = booker.select_seats_from_center(2, None)
+        booker.save_booking(booking)
+        with patch.object(self.repository, "delete_booking", side_effect=sqlite3.OperationalError("database is locked")):
+            with self.assertRaises(sqlite3.OperationalError):
+                booker.cancel_booking(booking)
+        self.assertIs(self.screening.find_booking(booking.id), booking)
+        self.assertEqual(self.screening.seats_free, 48)
+        booker.cancel_booking(booking)
+        self.assertEqual(self.repository.load_screening(self.screening.id).seats_free, 50)
+
+if __name__ == '__main__':
+    unittest.main()
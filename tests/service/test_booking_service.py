@@ -0,0 +1,132 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening, SeatConflictError
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.service.booking_client import BookingClient
+from cinema_booking_system.service.booking_service import BookingService
+
+class TestBookingService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Set up test fixtures before each test."""
+        self.seating_config = SeatingConfig(5, 10)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), [Booking("GIC0001", self.seating_config.seat_ids(["A1"]))])
+        self.service = BookingService(self.screening)
+        await self.service.start()
+        self.client = BookingClient("127.0.0.1", self.service.port)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.service.close()
+
+    async def test_availability(self):
+        """Booking Service: Availability reports free seats and the seat map"""
+        status, response = await self.client.availability()
+        self.assertEqual(status, 200)
+        self.assertEqual(response["seats_available"], 49)
+        self.assertEqual(response["rows"]["A"], "x.........")
+
+    async def test_hold_and_confirm(self):
+        """Booking Service: Held seats are confirmed into a booking"""
+        status, response = await self.client.preview(2)
+        self.assertEqual(status, 200)
+        preview = response["seats"]
+        
+        status, response = await self.client.hold(2)
+        self.assertEqual(status, 201)
+        self.assertEqual(response["seats"], preview)
+        self.assertFalse(response["confirmed"])
+        booking_id = response["booking_id"]
+        self.assertTrue(booking_id.startswith("GIC"))
+        self.assertEqual(self.screening.seats_held, 2)
+        
+        # Move the selection, then confirm it
+        status, response = await self.client.hold(2, "B3", booking_id)
+        self.assertEqual(response["seats"], ["B3", "B4"])
+        status, response = await self.client.confirm(booking_id)
+        self.assertEqual(status, 200)
+        self.assertTrue(response["confirmed"])
+        self.assertTrue(self.screening.is_seat_booked(self.seating_config.parse_seat("B4")))
+        
+        status, response = await self.client.booking(booking_id)
+        self.assertEqual(response["seats"], ["B3", "B4"])
+        status, response = await self.client.confirm(booking_id)
+        self.assertEqual(status, 404)
+
+    async def test_change_selection_of_full_house(self):
+        """Booking Service: A pending booking's held seats count towards its new selection"""
+        _, response = await self.client.hold(49)
+        booking_id = response["booking_id"]
+        status, response = await self.client.hold(49, "A2", booking_id)
+        self.assertEqual(status, 201)
+        self.assertEqual(len(response["seats"]), 49)
+        status, response = await self.client.hold(1)
+        self.assertEqual(status, 409)
+        self.assertEqual(response["error"], "Sorry, there are only 0 seats available.")
+
+    async def test_rejected_change_keeps_hold(self):
+        """Booking Service: A change of selection that fails leaves the pending booking's hold in place"""
+        _, response = await self.client.hold(2)
+        booking_id = response["booking_id"]
+        held_seats = self.screening.held_seats(booking_id)
+        with patch.object(self.service.booker, "hold_seats", side_effect=SeatConflictError(["B1"])):
+            status, response = await self.client.hold(3, "B1", booking_id)
+        self.assertEqual(status, 409)
+        self.assertEqual(self.screening.held_seats(booking_id), held_seats)
+        status, response = await self.client.confirm(booking_id)
+        self.assertEqual(status, 200)
+        
+        # Malformed booking ids and seats are client errors
+        status, _ = await self.client.request("POST", "/holds", {"seat_count": 1, "booking_id": ["GIC0001"]})
+        self.assertEqual(status, 400)
+        status, _ = await self.client.request("POST", "/holds", {"seat_count": 1, "starting_seat": 12})
+        self.assertEqual(status, 400)
+
+    async def test_cancel(self):
+        """Booking Service: Cancelling releases held and booked seats"""
+        _, response = await self.client.hold(3)
+        status, _ = await self.client.cancel(response["booking_id"])
+        self.assertEqual(status, 200)
+        self.assertEqual(self.screening.seats_free, 49)
+        status, _ = await self.client.cancel("GIC0001")
+        self.assertEqual(status, 200)
+        self.assertEqual(self.screening.seats_free, 50)
+        status, _ = await self.client.booking("GIC0001")
+        self.assertEqual(status, 404)
+
+    async def test_rejects_invalid_requests(self):
+        """Booking Service: Invalid or conflicting requests get error responses"""
+        status, _ = await self.client.hold(0)
+        self.assertEqual(status, 400)
+        status, _ = await self.client.hold(51)
+        self.assertEqual(status, 409)
+        status, _ = await self.client.hold(1, "A1")
+        self.assertEqual(status, 409)
+        status, _ = await self.client.hold(1, "Z99")
+        self.assertEqual(status, 400)
+        status, _ = await self.client.request("GET", "/holds")
+        self.assertEqual(status, 405)
+        status, _ = await self.client.request("GET", "/nowhere")
+        self.assertEqual(status, 404)
+
+    async def test_concurrent_clients(self):
+        """Booking Service: Concurrent clients never get the same seat"""
+        async def book(client: BookingClient):
+            _, response = await client.hold(2)
+            status, response = await client.confirm(response["booking_id"])
+            return status, response
+        clients = [BookingClient("127.0.0.1", self.service.port) for _ in range(20)]
+        results = await asyncio.gather(*(book(client) for client in clients))
+        for client in clients:
+            await client.close()
+        self.assertTrue(all(status == 200 for status, _ in results))
+        seats = [seat for _, response in results for seat in response["seats"]]
+        self.assertEqual(len(seats), len(set(seats)))
+        self.assertEqual(len({response["booking_id"] for _, response in results}), 20)
+        self.assertEqual(self.screening.seats_free, 9)
+
+if __name__ == '__main__':
+    unittest.main()
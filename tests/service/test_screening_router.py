@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.booking_id_generator import MAX_WORKER_ID, SEQUENCE_BITS, SHARD_WORKER_IDS, booking_ids
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+from cinema_booking_system.service.screening_router import ScreeningRouter
+
+class TestScreeningRouter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures: three screenings over two worker processes, backed by a database."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.repository = SQLiteRepository(os.path.join(cls.directory.name, "cinema.db"))
+        cls.seating_config = SeatingConfig(5, 10)
+        cls.screenings = []
+        for title in ("First", "Second", "Third"):
+            screening = Screening(datetime(2024, 1, 1, 12, 0), cls.seating_config, Movie(title), [Booking(f"GIC{title.upper()}", cls.seating_config.seat_ids(["A1"]))])
+            cls.repository.save_screening(screening)
+            cls.screenings.append(screening)
+        cls.router = ScreeningRouter(cls.screenings, worker_count=2, db_path=os.path.join(cls.directory.name, "cinema.db"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.router.close()
+        cls.repository.close()
+        cls.directory.cleanup()
+
+    def test_screenings_are_partitioned(self):
+        """Screening Router: Screenings are spread over the workers by id"""
+        self.assertEqual(self.router.worker_count, 2)
+        self.assertEqual({self.router.shard_of(screening.id) for screening in self.screenings}, {0, 1})
+        with self.assertRaises(ValueError):
+            ScreeningRouter(worker_count=2, first_worker_id=SHARD_WORKER_IDS.stop - 1)
+        with self.assertRaises(ValueError):
+            self.router.add_screening(Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("Unsaved"), []))
+
+    def test_shards_have_their_own_worker_ids(self):
+        """Screening Router: Each worker mints booking ids under its own worker id, from the range reserved for shards"""
+        for screening in self.screenings[:2]:
+            status, response = self.router.request(screening.id, "POST", "/holds", {"seat_count": 1})
+            self.assertEqual(status, 201)
+            worker_id = (int(response["booking_id"][3:], 36) >> SEQUENCE_BITS) & MAX_WORKER_ID
+            self.assertEqual(worker_id, SHARD_WORKER_IDS.start + self.router.shard_of(screening.id))
+            self.assertNotEqual(worker_id, booking_ids.worker_id)
+            self.router.request(screening.id, "POST", f"/bookings/{response['booking_id']}/cancel")
+
+    def test_requests_are_routed(self):
+        """Screening Router: Requests reach their screening's worker and get the booking API's responses"""
+        first, second, third = (screening.id for screening in self.screenings)
+        responses = self.router.request_many([
+            (first, "POST", "/holds", {"seat_count": 2}),
+            (second, "POST", "/holds", {"seat_count": 3}),
+            (third, "GET", "/availability", None),
+            (999, "GET", "/availability", None),
+        ])
+        self.assertEqual([status for status, _ in responses], [201, 201, 200, 404])
+        self.assertEqual(len(responses[0][1]["seats"]), 2)
+        self.assertEqual(len(responses[1][1]["seats"]), 3)
+        self.assertEqual(responses[2][1]["movie"], "Third")
+        
+        # Confirm the hold on the second screening; it is saved by the worker
+        booking_id = responses[1][1]["booking_id"]
+        status, response = self.router.request(second, "POST", f"/bookings/{booking_id}/confirm")
+        self.assertEqual(status, 200)
+        self.assertTrue(response["confirmed"])
+        self.assertEqual(self.router.request(second, "GET", "/availability")[1]["seats_available"], 46)
+        self.assertIsNotNone(self.repository.load_screening(second).find_booking(booking_id))
+        
+        # Errors come back as the booking API's status codes
+        status, response = self.router.request(first, "POST", "/holds", {"seat_count": 0})
+        self.assertEqual(status, 400)
+        status, response = self.router.request(first, "POST", "/bookings/GICNONE/confirm")
+        self.assertEqual(status, 404)
+
+if __name__ == '__main__':
+    unittest.main()
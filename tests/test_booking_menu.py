@@ -3,8 +3,9 @@ from unittest.mock import patch
 from datetime import datetime
 from prompt_toolkit.document import Document
 from prompt_toolkit.validation import ValidationError
+from cinema_booking_system.models.cinema import Cinema
 from cinema_booking_system.models.movie import Movie
-from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.screening import Screening, SeatConflictError
 from cinema_booking_system.models.seating_config import SeatingConfig
 from cinema_booking_system.models.booking import Booking
 from cinema_booking_system.booking_menu import BookingMenu, BookingMenuValidator
@@ -14,9 +15,10 @@ class TestBookingMenuValidator(unittest.TestCase):
         """Set up test fixtures before each test."""
         self.seating_config = SeatingConfig(5, 10)  # 5 rows (A-E), 10 seats per row
         self.booking_data = [
-            Booking("GIC0001", ["A1", "A2"]),  # Pre-booked seats
+            Booking("GIC0001", self.seating_config.seat_ids(["A1", "A2"])),  # Pre-booked seats
         ]
-        self.validator = BookingMenuValidator(self.seating_config, self.booking_data)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), self.booking_data)
+        self.validator = BookingMenuValidator(self.screening)
 
     def test_valid_inputs(self):
         """Test valid seat selections."""
@@ -67,6 +69,16 @@ class TestBookingMenuValidator(unittest.TestCase):
             self.validator.validate(document)
         self.assertIn("already booked", str(context.exception))
 
+    def test_multi_letter_rows(self):
+        """Test seats in rows past Z are validated with their multi-letter labels."""
+        validator = BookingMenuValidator(Screening(datetime(2024, 1, 1, 12, 0), SeatingConfig(30, 10), Movie("TestMovie"), []))
+        validator.validate(Document("AD10"))
+        validator.validate(Document("ab3"))
+        for input_text in ["AE1", "AD11", "ZZZZ1"]:
+            with self.subTest(input_text=input_text):
+                with self.assertRaises(ValidationError):
+                    validator.validate(Document(input_text))
+
 class TestBookingMenu(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test."""
@@ -104,6 +116,78 @@ class TestBookingMenu(unittest.TestCase):
         self.assertEqual(result, "2")
         mock_prompt.assert_called_once()
 
+    @patch('cinema_booking_system.booking_menu.prompt')
+    def test_prompt_screening(self, mock_prompt):
+        """Test picking another screening from the cinema catalog."""
+        start_time = datetime.now().replace(microsecond=0)
+        later = Screening(start_time.replace(hour=23, minute=59), self.seating_config, self.movie, [], hall="2")
+        other = Screening(start_time.replace(hour=23, minute=0), self.seating_config, Movie("Other"), [])
+        menu = BookingMenu(self.screening, cinema=Cinema([self.screening, later, other]))
+        mock_prompt.side_effect = ["TestMovie", "1"]
+        self.assertIs(menu.prompt_screening(), later)
+        menu.select_screening(later)
+        self.assertIs(menu.booker.screening, later)
+        self.assertIs(menu.validator.screening, later)
+
+    @patch('cinema_booking_system.booking_menu.time.sleep')
+    @patch('cinema_booking_system.booking_menu.prompt')
+    def test_seats_taken_after_count_is_accepted(self, mock_prompt, mock_sleep):
+        """Test going back to the seat count prompt when another seller takes seats after the count was accepted."""
+        seating_config = SeatingConfig(1, 4)
+        screening = Screening(datetime(2024, 1, 1, 12, 0), seating_config, self.movie, [])
+        menu = BookingMenu(screening)
+        new_booking = menu.booker.new_booking
+
+        def new_booking_then_sell_seats():
+            # Another seller books A1-A3 right after this seller's count of 4 was accepted
+            booking = new_booking()
+            if not screening.find_booking("GIC0002"):
+                screening.add_booking(Booking("GIC0002", seating_config.seat_ids(["A1", "A2", "A3"])))
+            return booking
+
+        menu.booker.new_booking = new_booking_then_sell_seats
+        mock_prompt.side_effect = ["1", "4", "1", "confirm", "3"]
+        with patch('builtins.print'):
+            menu.run()
+        self.assertEqual(mock_prompt.call_count, 5)
+        self.assertEqual([len(booking.seats) for booking in screening.booking_data], [3, 1])
+        self.assertEqual(seating_config.seat_labels(screening.booking_data[1].seats), ["A4"])
+
+    def fail_once(self, function, error: Exception, on_call: int = 1):
+        # Wraps a method so its `on_call`-th call raises `error`, as when another seller gets in first
+        calls = []
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == on_call:
+                raise error
+            return function(*args, **kwargs)
+        return wrapper
+
+    @patch('cinema_booking_system.booking_menu.time.sleep')
+    @patch('cinema_booking_system.booking_menu.prompt')
+    def test_hold_conflict_on_first_preview(self, mock_prompt, mock_sleep):
+        """Test the first preview is selected again when its seats are taken before they are held."""
+        self.menu.booker.hold_seats = self.fail_once(self.menu.booker.hold_seats, SeatConflictError(["C5"]))
+        mock_prompt.side_effect = ["1", "2", "confirm", "3"]
+        with patch('builtins.print'):
+            self.menu.run()
+        self.assertEqual([len(booking.seats) for booking in self.screening.booking_data], [2])
+
+    @patch('cinema_booking_system.booking_menu.time.sleep')
+    @patch('cinema_booking_system.booking_menu.prompt')
+    def test_hold_conflict_after_failed_confirm(self, mock_prompt, mock_sleep):
+        """Test a failed confirm followed by a hold conflict goes back to a fresh default selection."""
+        self.menu.booker.save_booking = self.fail_once(self.menu.booker.save_booking, ValueError("database is locked"))
+        self.menu.booker.hold_seats = self.fail_once(self.menu.booker.hold_seats, SeatConflictError(["C5"]), on_call=3)
+        mock_prompt.side_effect = ["1", "2", "B3", "confirm", "confirm", "3"]
+        with patch('builtins.print'):
+            self.menu.run()
+        self.assertEqual(mock_prompt.call_count, 6)
+        bookings = self.screening.booking_data
+        self.assertEqual(len(bookings), 1)
+        self.assertEqual(len(bookings[0].seats), 2)
+        self.assertNotIn(self.seating_config.parse_seat("B3"), bookings[0].seats)
+
 if __name__ == '__main__':
     unittest.main()
     
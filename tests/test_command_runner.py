@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from datetime import datetime
+from cinema_booking_system.command_runner import CommandRunner
+from cinema_booking_system.models.booking import Booking
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening, SeatConflictError
+from cinema_booking_system.models.seating_config import SeatingConfig
+from cinema_booking_system.repositories.sqlite_repository import SQLiteRepository
+
+class TestCommandRunner(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.seating_config = SeatingConfig(3, 4)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), [])
+        self.runner = CommandRunner(self.screening)
+
+    def run_commands(self, *commands):
+        output = StringIO()
+        failures = self.runner.run(commands, output)
+        return failures, [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_book_and_confirm(self):
+        """Command Test: Hold seats, change the selection and confirm, as in the booking menu"""
+        failures, results = self.run_commands("book 2", "book 2 from B1", "confirm", "")
+        self.assertEqual(failures, 0)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["seats"], ["A3", "A4"])
+        self.assertFalse(results[0]["confirmed"])
+        self.assertEqual(results[1]["booking_id"], results[0]["booking_id"])
+        self.assertEqual(results[1]["seats"], ["B1", "B2"])
+        self.assertEqual(results[1]["seats_available"], 10)
+        self.assertTrue(results[2]["confirmed"])
+        
+        booking = self.screening.find_booking(results[2]["booking_id"])
+        self.assertEqual(self.seating_config.seat_labels(booking.seats), ["B1", "B2"])
+        self.assertEqual(self.screening.seats_held, 0)
+
+    def test_failed_reselection_keeps_hold(self):
+        """Command Test: A change of selection that cannot be held keeps the seats already held"""
+        hold_seats = self.runner.booker.hold_seats
+        row_b = set(self.seating_config.seat_ids(["B1", "B2", "B3", "B4"]))
+        def hold_seats_unless_taken(booking, seats):
+            # Another seller keeps getting to row B first
+            if row_b & set(seats):
+                raise SeatConflictError(self.seating_config.seat_labels(seats))
+            return hold_seats(booking, seats)
+        with patch.object(self.runner.booker, "hold_seats", side_effect=hold_seats_unless_taken):
+            failures, results = self.run_commands("book 2", "book 2 from B1", "confirm")
+        self.assertEqual(failures, 1)
+        self.assertFalse(results[1]["ok"])
+        self.assertTrue(results[2]["confirmed"])
+        self.assertEqual(results[2]["seats"], ["A3", "A4"])
+
+    def test_check_and_cancel(self):
+        """Command Test: Check a booking, then cancel it"""
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["C1"])))
+        failures, results = self.run_commands("check gic0001", "cancel GIC0001", "check GIC0001")
+        self.assertEqual(failures, 1)
+        self.assertEqual(results[0]["seats"], ["C1"])
+        self.assertTrue(results[1]["cancelled"])
+        self.assertEqual(results[2], {"command": "check GIC0001", "ok": False, "error": "Booking not found."})
+        self.assertEqual(self.screening.seats_free, 12)
+
+    def test_invalid_commands(self):
+        """Command Test: Invalid commands are reported and the rest still run"""
+        self.screening.add_booking(Booking("GIC0001", self.seating_config.seat_ids(["A1"])))
+        failures, results = self.run_commands("fly", "book 12", "book 2 from A1", "book 2 from D1", "confirm", "cancel", "book 1")
+        self.assertEqual(failures, 6)
+        self.assertTrue(results[0]["error"].startswith("Unknown command: fly."))
+        self.assertEqual(results[1]["error"], "Sorry, there are only 11 seats available.")
+        self.assertEqual(results[2]["error"], "Seat is already booked. Please select another seat.")
+        self.assertEqual(results[3]["error"], "Seat is outside the cinema: D1")
+        self.assertEqual(results[4]["error"], "No booking to confirm. Start with: book [Seats]")
+        self.assertEqual(results[5]["error"], "No booking to cancel.")
+        
+        # A booking left pending when the commands run out releases its seats
+        self.assertTrue(results[6]["ok"])
+        self.assertEqual(self.screening.seats_held, 0)
+
+    def test_configure(self):
+        """Command Test: Configure a screening, saved to the repository"""
+        with tempfile.TemporaryDirectory() as directory:
+            repository = SQLiteRepository(os.path.join(directory, "cinema.db"))
+            self.runner = CommandRunner(repository=repository)
+            failures, results = self.run_commands("book 1", "configure Inception 0 4", "configure Inception 5 8", "book 3", "confirm")
+            self.assertEqual(failures, 2)
+            self.assertTrue(results[0]["error"].startswith("No screening configured."))
+            self.assertEqual(results[1]["error"], "Row count must be a positive integer.")
+            self.assertEqual(results[2]["seats_available"], 40)
+            
+            screening = repository.load_screening(results[2]["screening_id"])
+            self.assertEqual(screening.movie.title, "Inception")
+            self.assertEqual(screening.seat_config.seat_labels(screening.booking_data[0].seats), results[4]["seats"])
+            repository.close()
+
+if __name__ == '__main__':
+    unittest.main()
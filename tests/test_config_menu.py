@@ -15,6 +15,7 @@ class TestConfigMenuValidator(unittest.TestCase):
             "Movie1 10 20",
             # "The Movie 5 30", # In practice: TDD has raised an issue where the format used in the brief doesn't specify if spaces are allowed; to seek clarification
             "Avatar 26 50",
+            "Arena 400 250",
             "exit",
             "EXIT",
             "Exit"
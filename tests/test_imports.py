@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import unittest
+import cinema_booking_system
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(module: str) -> set:
+    # Modules loaded by importing `module` in a fresh interpreter
+    script = f"import sys; import {module}; print(' '.join(sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+class TestImports(unittest.TestCase):
+    def test_headless_imports_skip_prompt_toolkit(self):
+        """Import Test: models, controllers, repositories and the command runner do not load prompt_toolkit"""
+        for module in ("cinema_booking_system", "cinema_booking_system.models", "cinema_booking_system.controllers", "cinema_booking_system.repositories", "cinema_booking_system.command_runner"):
+            with self.subTest(module=module):
+                self.assertNotIn("prompt_toolkit", loaded_modules(module))
+
+    def test_lazy_package_attributes(self):
+        """Import Test: the menus are still available from the package, imported on first use"""
+        from cinema_booking_system import BookingMenu, CommandRunner, ConfigMenu, SeatingDisplay
+        from cinema_booking_system.booking_menu import BookingMenu as booking_menu_class
+        self.assertIs(BookingMenu, booking_menu_class)
+        self.assertIn("ConfigMenu", dir(cinema_booking_system))
+        with self.assertRaises(AttributeError):
+            cinema_booking_system.NotAMenu
+
+if __name__ == '__main__':
+    unittest.main()
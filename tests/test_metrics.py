@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from cinema_booking_system import metrics
+from cinema_booking_system.controllers.booking_controller import BookingController
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.models.seating_config import SeatingConfig
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test."""
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), SeatingConfig(5, 10), Movie("TestMovie"), [])
+        self.booker = BookingController(self.screening)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        metrics.disable()
+        self.directory.cleanup()
+
+    def test_disabled_by_default(self):
+        """Metrics Test: Nothing is recorded until metrics are enabled."""
+        self.assertIsNone(metrics.registry)
+        self.booker.reserve(3)
+        metrics.increment("bookings_confirmed_total")
+        with metrics.timer("example_seconds"):
+            pass
+        self.assertIsNone(metrics.registry)
+
+    def test_booking_operations_are_recorded(self):
+        """Metrics Test: Reservations record allocation and confirmation timings, probes and counters."""
+        registry = metrics.enable()
+        self.booker.reserve(3)
+        self.booker.reserve(2)
+        booking = self.booker.reserve(40)  # Split over several rows
+        self.booker.cancel_booking(booking)
+
+        self.assertEqual(registry.counters["bookings_confirmed_total"], 3)
+        self.assertEqual(registry.counters["seats_booked_total"], 45)
+        self.assertEqual(registry.counters["bookings_cancelled_total"], 1)
+        self.assertEqual(registry.histograms["booking_reserve_seconds"].count, 3)
+        self.assertEqual(registry.histograms["seat_allocation_seconds"].count, 3)
+        probes = registry.histograms["seat_allocation_rows_probed"]
+        self.assertEqual(probes.count, 3)
+        self.assertEqual(probes.sum, 1 + 1 + 5)
+
+    def test_histogram_buckets(self):
+        """Metrics Test: Histogram buckets count values up to and including their bound."""
+        registry = metrics.MetricsRegistry()
+        for value in (1, 2, 3, 100, 5000):
+            registry.observe("rows", value, metrics.COUNT_BUCKETS)
+        histogram = registry.histograms["rows"]
+        counts = dict(zip(histogram.buckets + ("+Inf",), histogram.cumulative_counts()))
+        self.assertEqual(counts[1], 1)
+        self.assertEqual(counts[2], 2)
+        self.assertEqual(counts[4], 3)
+        self.assertEqual(counts[128], 4)
+        self.assertEqual(counts["+Inf"], 5)
+
+    def test_prometheus_export(self):
+        """Metrics Test: Export a Prometheus text file."""
+        registry = metrics.enable()
+        self.booker.reserve(3)
+        path = os.path.join(self.directory.name, "cinema.prom")
+        registry.export(path, "prometheus")
+        with open(path) as file:
+            text = file.read()
+        self.assertIn("# TYPE bookings_confirmed_total counter\nbookings_confirmed_total 1\n", text)
+        self.assertIn("# TYPE booking_reserve_seconds histogram\n", text)
+        self.assertIn('booking_reserve_seconds_bucket{le="+Inf"} 1\n', text)
+        self.assertIn("booking_reserve_seconds_count 1\n", text)
+
+    def test_json_lines_export(self):
+        """Metrics Test: Each JSON lines export appends one snapshot."""
+        registry = metrics.enable()
+        path = os.path.join(self.directory.name, "metrics.jsonl")
+        self.booker.reserve(3)
+        registry.export(path, "jsonl")
+        self.booker.reserve(3)
+        exporter = metrics.MetricsExporter(registry, path, "jsonl", interval=60)
+        exporter.start()
+        exporter.stop()
+        with open(path) as file:
+            snapshots = [json.loads(line) for line in file]
+        self.assertEqual([snapshot["counters"]["bookings_confirmed_total"] for snapshot in snapshots], [1, 2])
+        self.assertEqual(snapshots[1]["histograms"]["booking_reserve_seconds"]["count"], 2)
+
+        with self.assertRaises(ValueError):
+            registry.export(path, "csv")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,32 +1,38 @@
+import os
+import re
 import unittest
 from unittest.mock import patch
 from io import StringIO
+from datetime import datetime
 from cinema_booking_system.models.seating_config import SeatingConfig
 from cinema_booking_system.models.booking import Booking
-from cinema_booking_system.seating_display import SeatingDisplay
+from cinema_booking_system.models.movie import Movie
+from cinema_booking_system.models.screening import Screening
+from cinema_booking_system.seating_display import SeatingDisplay, frame_layout, CLEAR_SCREEN
 
 class TestSeatingDisplay(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test."""
         self.seating_config = SeatingConfig(3, 4)  # 3 rows (A-C), 4 seats per row
         self.booking_data = []
-        self.display = SeatingDisplay(self.seating_config, self.booking_data)
+        self.screening = Screening(datetime(2024, 1, 1, 12, 0), self.seating_config, Movie("TestMovie"), self.booking_data)
+        self.display = SeatingDisplay(self.screening)
 
     def test_initialization(self):
         """Object Creation: SeatingDisplay"""
+        self.assertEqual(self.display.screening, self.screening)
         self.assertEqual(self.display.seating_config, self.seating_config)
-        self.assertEqual(self.display.booking_data, self.booking_data)
 
     def test_property_setters(self):
         """Property Setting: SeatingDisplay"""
         new_config = SeatingConfig(4, 5)
-        new_bookings = [Booking("GIC0001", ["A1"])]
+        new_bookings = [Booking("GIC0001", new_config.seat_ids(["A1"]))]
+        new_screening = Screening(datetime(2024, 1, 1, 12, 0), new_config, Movie("TestMovie"), new_bookings)
         
-        self.display.seat_config = new_config
-        self.display.booking_data = new_bookings
+        self.display.screening = new_screening
         
-        self.assertEqual(self.display.seat_config, new_config)
-        self.assertEqual(self.display.booking_data, new_bookings)
+        self.assertEqual(self.display.screening, new_screening)
+        self.assertEqual(self.display.seating_config, new_config)
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_display_empty_cinema(self, mock_stdout):
@@ -51,7 +57,7 @@ class TestSeatingDisplay(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_display_with_selected_seats(self, mock_stdout):
         """Display Test: Test displaying theater with selected seats."""
-        selected_seats = ["A1", "B2"]
+        selected_seats = self.seating_config.seat_ids(["A1", "B2"])
         self.display.display(selected_seats)
         output = mock_stdout.getvalue()
         
@@ -62,8 +68,8 @@ class TestSeatingDisplay(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_display_with_booked_seats(self, mock_stdout):
         """Display Test: Test displaying theater with booked seats."""
-        booking = Booking("GIC0001", ["A1", "A2"])
-        self.display.booking_data = [booking]
+        booking = Booking("GIC0001", self.seating_config.seat_ids(["A1", "A2"]))
+        self.screening.add_booking(booking)
         self.display.display()
         output = mock_stdout.getvalue()
         
@@ -74,9 +80,9 @@ class TestSeatingDisplay(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_display_with_mixed_seats(self, mock_stdout):
         """Display Test: Test displaying theater with both selected and booked seats."""
-        booking = Booking("GIC0001", ["A1"])
-        self.display.booking_data = [booking]
-        selected_seats = ["B1"]
+        booking = Booking("GIC0001", self.seating_config.seat_ids(["A1"]))
+        self.screening.add_booking(booking)
+        selected_seats = self.seating_config.seat_ids(["B1"])
         self.display.display(selected_seats)
         output = mock_stdout.getvalue()
         
@@ -89,6 +95,41 @@ class TestSeatingDisplay(unittest.TestCase):
         self.assertEqual(selected_count, 1+1) # include 1 more from the legend
         self.assertEqual(available_count, 10+1) # include 1 more from the legend
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_display_writes_rendered_frame(self, mock_stdout):
+        """Display Test: Test the frame is rendered from a layout cached per hall size."""
+        selected_seats = self.seating_config.seat_ids(["C4"])
+        self.display.display(selected_seats)
+        self.assertEqual(mock_stdout.getvalue(), self.display.render(selected_seats))
+        self.assertIs(frame_layout(self.seating_config), frame_layout(SeatingConfig(3, 4)))
+        self.assertIn("C  .  .  .  o \nB  .  .  .  . \n", mock_stdout.getvalue())
+
+    @patch('cinema_booking_system.seating_display.shutil.get_terminal_size', return_value=os.terminal_size((80, 40)))
+    def test_repaint_sends_only_changed_seats(self, mock_terminal_size):
+        """Display Test: Test repainting rewrites only the changed seats of the frame on screen."""
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            self.display.repaint(self.seating_config.seat_ids(["A1"]))
+        first = mock_stdout.getvalue()
+        self.assertTrue(first.startswith(CLEAR_SCREEN))
+        screen = first[len(CLEAR_SCREEN):].split("\n")
+        
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            self.display.repaint(self.seating_config.seat_ids(["A3", "B2"]))
+        second = mock_stdout.getvalue()
+        self.assertLess(len(second), len(first) // 4)
+        
+        # Apply the cursor moves and writes to the screen and compare with a freshly rendered frame
+        for line, column, text in re.findall(r"\x1b\[(\d+);(\d+)H([^\x1b]*)", second):
+            line, column = int(line) - 1, int(column) - 1
+            screen[line] = screen[line][:column] + text + screen[line][column + len(text):]
+        self.assertEqual("\n".join(screen), self.display.render(self.seating_config.seat_ids(["A3", "B2"])))
+        
+        # After a reset the next repaint draws a full frame again
+        self.display.reset()
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            self.display.repaint()
+        self.assertTrue(mock_stdout.getvalue().startswith(CLEAR_SCREEN))
+
     def test_legend_display(self):
         """Display Test: Test that the legend is displayed correctly."""
         with patch('sys.stdout', new_callable=StringIO) as mock_stdout: